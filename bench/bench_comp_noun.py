@@ -0,0 +1,101 @@
+"""복합명사 분리(PosN0.isCompNoun) 벤치마크
+
+체언 사전 단어를 이어 붙여서 만든 긴 복합명사(20 음절 이상의 고유명사 등)를
+어절 길이별로 분리하는 속도를 잰다. 어절 분석결과 캐시(eojeol_cache)는 끄고 측정한다.
+
+NNG01~05.tsv 는 배포하지 않는 경우가 있어서, NNP.tsv 의 단어를 NNG 로 바꾼
+임시 사전 파일을 만들어서 측정한다.
+
+    python bench/bench_comp_noun.py
+
+"""
+import pathmagic  # noqa
+import os
+import time
+import random
+import shutil
+import tempfile
+import traceback
+from hinsaem.config import CONFIG
+from hinsaem import eojeol_cache
+from hinsaem.pos_n0 import PosN0
+
+WORD_COUNT = 2000
+LENGTH_LIST = [10, 20, 40, 80]
+
+
+def _make_dict_files(tmp_dir):
+    """ 임시 체언 사전 파일을 만들고 복합명사를 만들 단어 리스트를 리턴한다. """
+    with open(CONFIG["res_dict_nnp"], "r", encoding="UTF-8",
+              newline="") as fp:
+        line_list = fp.readlines()[1:]
+
+    for ret_key, config_key in PosN0._DICT_FILE_LIST:
+        file_path = os.path.join(tmp_dir, config_key + ".tsv")
+        if config_key == "res_dict_nng01":
+            with open(file_path, "w", encoding="UTF-8", newline="") as fp:
+                for line in line_list:
+                    fp.write(line.replace("\tncn", "\tNNG", 1))
+        elif ret_key == "NNG":
+            with open(file_path, "w", encoding="UTF-8", newline="") as fp:
+                fp.write("word\tpos\tcategory\r\n")
+        else:
+            shutil.copyfile(CONFIG[config_key], file_path)
+        CONFIG[config_key] = file_path
+
+    word_list = []
+    for line in line_list:
+        word = line.split("\t")[0]
+        if 2 <= len(word) <= 4 and all(u"가" <= ch <= u"힣" for ch in word):
+            word_list.append(word)
+    return word_list
+
+
+def _make_compound(rand, word_list, length):
+    compound = ""
+    while len(compound) < length:
+        compound += rand.choice(word_list)
+    return compound
+
+
+def bench():
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        CONFIG["res_dict_cache"] = os.path.join(tmp_dir, "cache")
+        CONFIG["eojeol_cache_size"] = 0
+        eojeol_cache.reset()
+        word_list = _make_dict_files(tmp_dir)
+        pos_n0 = PosN0()
+
+        time_stamp_01 = time.perf_counter()
+        pos_n0._noun_trie()
+        print("trie build : %.1f ms" % (
+            (time.perf_counter() - time_stamp_01) * 1000))
+
+        rand = random.Random(0)
+        print("%8s %10s %12s %10s" % ("length", "words/s", "us/syllable",
+                                      "found"))
+        for length in LENGTH_LIST:
+            compound_list = [_make_compound(rand, word_list, length)
+                             for _ in range(WORD_COUNT)]
+            syllable_count = sum(len(word) for word in compound_list)
+            time_stamp_01 = time.perf_counter()
+            found = 0
+            for compound in compound_list:
+                if pos_n0.isCompNoun(compound) is not None:
+                    found += 1
+            elapsed = time.perf_counter() - time_stamp_01
+            print("%8d %10.0f %12.2f %9.1f%%" % (
+                length, WORD_COUNT / elapsed,
+                elapsed / syllable_count * 1000000,
+                found * 100.0 / WORD_COUNT))
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == "__main__":
+    try:
+        bench()
+    except Exception:
+        tb = traceback.format_exc()
+        print(tb)
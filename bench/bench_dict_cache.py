@@ -0,0 +1,71 @@
+"""사전 캐시(dict_cache) 벤치마크
+
+TSV 를 직접 파싱하는 경우와 캐시를 읽는 경우의 사전 로딩 시간을 비교한다.
+
+    python bench/bench_dict_cache.py
+
+"""
+import pathmagic  # noqa
+import time
+import traceback
+from hinsaem.config import CONFIG
+from hinsaem import dict_cache
+from hinsaem import lexicon_registry
+from hinsaem.pos_e import PosE
+from hinsaem.pos_j import PosJ
+from hinsaem.pos_n0 import PosN0
+from hinsaem.pos_nr import PosNR
+
+REPEAT = 5
+
+
+def _read_nnp(file_path):
+    return PosN0._read_pos_dict(["NNP", file_path, ["word", "pos"]])
+
+
+def _load(cls):
+    """ 공용 사전을 버리고 다시 로딩한다. """
+    def func():
+        lexicon_registry.reload(force=True)
+        cls()._tables()
+    return func
+
+
+def _best_time(func):
+    best = None
+    for _ in range(REPEAT):
+        time_stamp_01 = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - time_stamp_01
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def bench():
+    target_list = [
+        ["PosE", _load(PosE)],
+        ["PosJ", _load(PosJ)],
+        ["PosNR", _load(PosNR)],
+        ["NNP.tsv", lambda: dict_cache.load_dict(
+            "BENCH_NNP", CONFIG["res_dict_nnp"], _read_nnp)],
+    ]
+    print("%-10s %12s %12s %8s" % ("dict", "tsv(ms)", "cache(ms)", "ratio"))
+    for name, func in target_list:
+        CONFIG["dict_cache"] = False
+        tsv_time = _best_time(func)
+
+        CONFIG["dict_cache"] = True
+        func()  # 캐시 생성
+        cache_time = _best_time(func)
+        print("%-10s %12.2f %12.2f %7.1fx" % (
+            name, tsv_time * 1000, cache_time * 1000, tsv_time / cache_time))
+    dict_cache.clear("BENCH_NNP")
+
+
+if __name__ == "__main__":
+    try:
+        bench()
+    except Exception:
+        tb = traceback.format_exc()
+        print(tb)
@@ -0,0 +1,136 @@
+"""음절 유틸리티(eumjeol_util) 마이크로 벤치마크
+
+미리 만든 음절 table 을 사용하는 함수와 기존 계산 방법(_parse_eumjeol_slow,
+_build_eumjeol_slow)의 호출 시간을 비교한다.
+NumPy 가 있으면 문장 전체를 한번에 분리하는 parse_eumjeol_array,
+get_jongsung_type_array 와 음절마다 호출하는 경우도 비교한다.
+
+    python bench/bench_eumjeol_util.py
+
+"""
+import pathmagic  # noqa
+import timeit
+import traceback
+from hinsaem import eumjeol_util
+from hinsaem.eumjeol_util import parse_eumjeol, build_eumjeol, change_jaso,\
+    get_jongsung_type, has_jongsung, _parse_eumjeol_slow, _build_eumjeol_slow,\
+    JONGSUNG_TYPE_NONE, JONGSUNG_TYPE_LIEUL, JONGSUNG_TYPE_COMMON,\
+    parse_eumjeol_array, get_jongsung_type_array
+
+NUMBER = 5
+REPEAT = 5
+
+# 모든 한글 음절
+EUMJEOL_LIST = sorted(eumjeol_util._EUMJEOL_TABLE)
+JASO_LIST = [parse_eumjeol(eumjeol) for eumjeol in EUMJEOL_LIST]
+
+
+# #### 기존 방법(table 을 사용하지 않는 경우)
+def _change_jaso_slow(eumjeol, cho, jung, jong):
+    (org_cho, org_jung, org_jong) = _parse_eumjeol_slow(eumjeol)
+    if cho is not None:
+        org_cho = cho
+    if jung is not None:
+        org_jung = jung
+    if jong is not None:
+        org_jong = jong
+    return _build_eumjeol_slow(org_cho, org_jung, org_jong)
+
+
+def _get_jongsung_type_slow(eumjeol):
+    jong = (_parse_eumjeol_slow(eumjeol))[2]
+    if jong == "":
+        return JONGSUNG_TYPE_NONE
+    elif jong == u"ㄹ":
+        return JONGSUNG_TYPE_LIEUL
+    return JONGSUNG_TYPE_COMMON
+
+
+def _has_jongsung_slow(eumjeol):
+    jong = (_parse_eumjeol_slow(eumjeol))[2]
+    if jong == "":
+        return False
+    return JONGSUNG_TYPE_COMMON
+
+
+def _run_parse(func):
+    return lambda: [func(eumjeol) for eumjeol in EUMJEOL_LIST]
+
+
+def _run_build(func):
+    return lambda: [func(cho, jung, jong) for (cho, jung, jong) in JASO_LIST]
+
+
+def _run_change(func):
+    return lambda: [func(eumjeol, None, None, u"ㄹ")
+                    for eumjeol in EUMJEOL_LIST]
+
+
+def _best_time(func):
+    return min(timeit.repeat(func, number=NUMBER, repeat=REPEAT)) / NUMBER
+
+
+def bench_array():
+    """ 음절마다 호출하는 경우와 NumPy 로 한번에 분리하는 경우 비교 """
+    try:
+        import numpy  # noqa
+    except ImportError:
+        print("numpy is not installed, skip array bench")
+        return
+
+    # 공백과 문장기호가 섞인 문서
+    text = " ".join("".join(EUMJEOL_LIST[index:index + 4]) + "."
+                    for index in range(0, len(EUMJEOL_LIST), 4))
+    target_list = [
+        ["parse_eumjeol", lambda: [
+            parse_eumjeol(eumjeol) for eumjeol in text
+            if eumjeol in eumjeol_util._EUMJEOL_TABLE],
+         lambda: parse_eumjeol_array(text)],
+        ["get_jongsung_type", lambda: [
+            get_jongsung_type(eumjeol) for eumjeol in text
+            if eumjeol in eumjeol_util._EUMJEOL_TABLE],
+         lambda: get_jongsung_type_array(text)],
+    ]
+    print("")
+    print("%d characters per call" % len(text))
+    print("%-18s %12s %12s %8s" % ("func", "table(ms)", "numpy(ms)", "ratio"))
+    for name, table_func, array_func in target_list:
+        table_time = _best_time(table_func)
+        array_time = _best_time(array_func)
+        print("%-18s %12.2f %12.2f %7.1fx" % (
+            name, table_time * 1000, array_time * 1000,
+            table_time / array_time))
+
+
+def bench():
+    target_list = [
+        ["parse_eumjeol", _run_parse(_parse_eumjeol_slow),
+         _run_parse(parse_eumjeol)],
+        ["build_eumjeol", _run_build(_build_eumjeol_slow),
+         _run_build(build_eumjeol)],
+        ["change_jaso", _run_change(_change_jaso_slow),
+         _run_change(change_jaso)],
+        ["get_jongsung_type", _run_parse(_get_jongsung_type_slow),
+         _run_parse(get_jongsung_type)],
+        ["has_jongsung", _run_parse(_has_jongsung_slow),
+         _run_parse(has_jongsung)],
+    ]
+    print("%d syllables per call" % len(EUMJEOL_LIST))
+    print("%-18s %12s %12s %8s" % ("func", "calc(ms)", "table(ms)", "ratio"))
+    for name, slow_func, fast_func in target_list:
+        assert slow_func() == [
+            list(item) if isinstance(item, tuple) else item
+            for item in fast_func()], name
+        slow_time = _best_time(slow_func)
+        fast_time = _best_time(fast_func)
+        print("%-18s %12.2f %12.2f %7.1fx" % (
+            name, slow_time * 1000, fast_time * 1000, slow_time / fast_time))
+
+
+if __name__ == "__main__":
+    try:
+        bench()
+        bench_array()
+    except Exception:
+        tb = traceback.format_exc()
+        print(tb)
@@ -0,0 +1,89 @@
+"""체언 사전 AhoCorasick 검색(PosN0.scan_nouns) 벤치마크
+
+res/NNP.tsv 로 만든 automaton 의 생성 시간, 사전 캐시 로딩 시간과
+합성 말뭉치(bench/corpus/synthetic.txt)에서 사전 단어를 모두 찾는 속도를
+부분 문자열을 하나씩 사전에서 조회하는 방법과 비교한다.
+
+NNG01~05.tsv 는 배포하지 않는 경우가 있어서 빈 임시 사전 파일을 사용한다.
+
+    python bench/bench_noun_scan.py
+
+"""
+import pathmagic  # noqa
+import os
+import time
+import shutil
+import tempfile
+import traceback
+from hinsaem.config import CONFIG
+from hinsaem import lexicon_registry
+from hinsaem.pos_n0 import PosN0
+
+CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                           "corpus", "synthetic.txt")
+
+
+def _set_dict_files(tmp_dir):
+    for ret_key, config_key in PosN0._DICT_FILE_LIST:
+        if ret_key != "NNG":
+            continue
+        file_path = os.path.join(tmp_dir, config_key + ".tsv")
+        with open(file_path, "w", encoding="UTF-8", newline="") as fp:
+            fp.write("word\tpos\tcategory\r\n")
+        CONFIG[config_key] = file_path
+
+
+def _probe_substrings(pos_n0, sentence):
+    """ 부분 문자열을 모두 사전에서 조회한다.(비교용) """
+    nnp = pos_n0._nnp
+    count = 0
+    for start in range(len(sentence)):
+        for end in range(start + 1, len(sentence) + 1):
+            if sentence[start:end] in nnp:
+                count += 1
+    return count
+
+
+def _elapsed(func):
+    time_stamp_01 = time.perf_counter()
+    result = func()
+    return (time.perf_counter() - time_stamp_01, result)
+
+
+def bench():
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        CONFIG["res_dict_cache"] = os.path.join(tmp_dir, "cache")
+        CONFIG["dict_cache"] = True
+        _set_dict_files(tmp_dir)
+        with open(CORPUS_PATH, "r", encoding="UTF-8") as fp:
+            sentence_list = [line.strip() for line in fp if line.strip()]
+        char_count = sum(len(sentence) for sentence in sentence_list)
+
+        pos_n0 = PosN0()
+        pos_n0._tables()
+        (elapsed, _) = _elapsed(pos_n0._noun_scanner)
+        print("automaton build      : %8.1f ms" % (elapsed * 1000))
+        lexicon_registry.reload(force=True)
+        (elapsed, _) = _elapsed(PosN0()._noun_scanner)
+        print("automaton cache load : %8.1f ms" % (elapsed * 1000))
+
+        (elapsed, match_count) = _elapsed(lambda: sum(
+            len(pos_n0.scan_nouns(sentence)) for sentence in sentence_list))
+        print("scan_nouns           : %8.0f chars/s, %d matches" % (
+            char_count / elapsed, match_count))
+        (elapsed, match_count) = _elapsed(lambda: sum(
+            _probe_substrings(pos_n0, sentence)
+            for sentence in sentence_list))
+        print("substring probe      : %8.0f chars/s, %d words" % (
+            char_count / elapsed, match_count))
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == "__main__":
+    try:
+        bench()
+    except Exception:
+        tb = traceback.format_exc()
+        print(tb)
@@ -0,0 +1,94 @@
+"""체언 사전(PosN0) 로딩 방법 벤치마크
+
+CONFIG["n0_loader"] 의 "process"(multiprocessing Pool, 결과 pickle),
+"thread"(같은 프로세스, pickle 없음)와 multiprocess_count 가 1 인 경우(차례로 읽기)의
+사전 캐시 없이 TSV 를 읽는 시간을 비교한다.
+
+NNG01~05.tsv 는 배포하지 않는 경우가 있어서, NNP.tsv 의 단어를 이용해 같은 형식의
+임시 사전 파일을 만들어서 측정한다.
+
+    python bench/bench_pos_n0_loader.py
+
+"""
+import pathmagic  # noqa
+import os
+import time
+import shutil
+import tempfile
+import traceback
+from hinsaem.config import CONFIG
+from hinsaem.pos_n0 import PosN0
+
+REPEAT = 3
+# 임시 NNG 사전 파일 하나의 줄 수
+NNG_LINE_COUNT = 200000
+
+
+def _make_dict_files(tmp_dir):
+    """ 임시 체언 사전 파일을 만들고 [파일 경로, ...] 를 리턴한다. """
+    with open(CONFIG["res_dict_nnp"], "r", encoding="UTF-8",
+              newline="") as fp:
+        line_list = fp.readlines()[1:]
+
+    file_path_list = []
+    for ret_key, config_key in PosN0._DICT_FILE_LIST:
+        file_path = os.path.join(tmp_dir, config_key + ".tsv")
+        if ret_key == "NNG":
+            with open(file_path, "w", encoding="UTF-8", newline="") as fp:
+                for index in range(NNG_LINE_COUNT):
+                    line = line_list[index % len(line_list)]
+                    line = line.replace("\tNNP", "\tNNG")
+                    fp.write("%s%d%s" % (config_key[-2:], index, line))
+        else:
+            shutil.copyfile(CONFIG[config_key], file_path)
+        file_path_list.append(file_path)
+    return file_path_list
+
+
+def _best_time(func):
+    best = None
+    for _ in range(REPEAT):
+        time_stamp_01 = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - time_stamp_01
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def bench():
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        file_path_list = _make_dict_files(tmp_dir)
+        pos_n0 = PosN0()
+        process_count = CONFIG["multiprocess_count"]
+        if process_count == "auto" or process_count <= 1:
+            process_count = 2
+
+        case_list = [
+            ["process", "process", process_count],
+            ["thread", "thread", process_count],
+            ["serial", "thread", 1],
+        ]
+        print("%-10s %8s %12s %8s" % ("loader", "workers", "load(ms)",
+                                      "ratio"))
+        base_time = None
+        for name, loader, count in case_list:
+            CONFIG["n0_loader"] = loader
+            CONFIG["multiprocess_count"] = count
+            elapsed = _best_time(
+                lambda: pos_n0._read_dict_tsv(file_path_list))
+            if base_time is None:
+                base_time = elapsed
+            print("%-10s %8d %12.1f %7.2fx" % (
+                name, count, elapsed * 1000, base_time / elapsed))
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == "__main__":
+    try:
+        bench()
+    except Exception:
+        tb = traceback.format_exc()
+        print(tb)
@@ -0,0 +1,104 @@
+"""수사 분석(PosNR.parse, PosNR.check) 벤치마크
+
+임의의 수를 한자어, 고유어 수사로 바꾼 단어 리스트를 만들어서
+수사인지만 검사하는 check 와 값, 위치를 구하는 parse, parse_many 의 속도를 잰다.
+parse 의 값이 만들 때 사용한 수와 같은지도 검사한다.
+
+    python bench/bench_pos_nr.py
+
+"""
+import pathmagic  # noqa
+import time
+import random
+import traceback
+from hinsaem.pos_nr import PosNR
+
+WORD_COUNT = 20000
+REPEAT = 3
+
+_DIGIT = u" 일이삼사오육칠팔구"
+_UNIT = [(1000, u"천"), (100, u"백"), (10, u"십"), (1, u"")]
+_BIG_UNIT = [(10 ** 12, u"조"), (10 ** 8, u"억"), (10 ** 4, u"만"), (1, u"")]
+_PURE_TEN = [u"", u"열", u"스물", u"서른", u"마흔", u"쉰", u"예순", u"일흔",
+             u"여든", u"아흔"]
+_PURE = [u"", u"하나", u"둘", u"셋", u"넷", u"다섯", u"여섯", u"일곱", u"여덟",
+         u"아홉"]
+
+
+def _to_hanja(number):
+    """ 한자어 수사 (ex : 300000 => 삼십만) """
+    word = u""
+    for big_value, big_name in _BIG_UNIT:
+        section = number // big_value % 10000
+        if section == 0:
+            continue
+        for value, name in _UNIT:
+            digit = section // value % 10
+            if digit:
+                word += (u"" if digit == 1 and name else _DIGIT[digit]) + name
+        word += big_name
+    return word
+
+
+def _to_pure(number):
+    """ 고유어 수사, 1 ~ 99 (ex : 25 => 스물다섯) """
+    return _PURE_TEN[number // 10] + _PURE[number % 10]
+
+
+def _make_words(rand):
+    """ (단어, 값) 리스트 """
+    word_list = []
+    for _ in range(WORD_COUNT):
+        kind = rand.random()
+        if kind < 0.5:
+            number = rand.randint(1, 10 ** rand.randint(1, 13))
+            word_list.append((_to_hanja(number), number))
+        elif kind < 0.8:
+            number = rand.randint(1, 99)
+            word_list.append((_to_pure(number), number))
+        else:
+            number = rand.randint(1, 999)
+            word_list.append((_to_hanja(number * 100) + _to_pure(
+                number % 99 + 1), number * 100 + number % 99 + 1))
+    return word_list
+
+
+def _measure(func):
+    best = None
+    for _ in range(REPEAT):
+        time_stamp_01 = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - time_stamp_01
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def bench():
+    pos_nr = PosNR()
+    pos_nr.check(u"하나")
+    pos_nr.parse(u"하나")
+    rand = random.Random(0)
+    word_value_list = _make_words(rand)
+    word_list = [word for (word, _) in word_value_list]
+
+    mismatch = 0
+    for (word, value) in word_value_list:
+        match = pos_nr.parse(word)
+        if match is None or match.end != len(word) or match.value != value:
+            mismatch += 1
+    print("words : %d, parse mismatch : %d" % (len(word_list), mismatch))
+
+    print("%12s %12s" % ("method", "words/s"))
+    for name, func in [
+            ("check", lambda: [pos_nr.check(word) for word in word_list]),
+            ("parse", lambda: [pos_nr.parse(word) for word in word_list]),
+            ("parse_many", lambda: pos_nr.parse_many(word_list))]:
+        print("%12s %12.0f" % (name, len(word_list) / _measure(func)))
+
+
+if __name__ == "__main__":
+    try:
+        bench()
+    except Exception:
+        tb = traceback.format_exc()
+        print(tb)
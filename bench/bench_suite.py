@@ -0,0 +1,273 @@
+"""벤치마크 모음
+
+합성 말뭉치(bench/corpus/synthetic.txt, make_corpus.py 로 생성)로 아래 항목의 시간을 재고
+저장된 기준값(bench/baseline.json)과 비교한다.
+
+* load.* : 사전 로딩 시간(사전 캐시 사용)
+* endswithE, endswithj : 어절마다 PosE.endswithE, PosJ.endswithj 호출
+* sentence : 문장의 모든 어절에 대해 PosJ.endswithj, PosE.endswithE 호출
+* hinsaem : Hinsaem._parse_sen(형태소 사전(res_dict_01)이 있는 경우만)
+
+어절 분석 항목은 eojeol/sec 와 호출 1번의 p50/p99 지연시간(us)을 출력한다.
+어절 분석결과 캐시(eojeol_cache)를 끄고 측정한다.
+분석 중 예외가 난 항목은 측정은 계속하지만 항목별 예외 수를 출력하고 종료 코드 1 로 끝난다.
+
+결과가 기준값보다 tolerance 비율 이상 나빠지면(처리량은 작아지고, 시간은 커지면)
+실패로 표시하고 종료 코드 1 로 끝난다.
+기준값은 측정한 컴퓨터의 절대 시간이다. 저장소의 baseline.json 은 참고용이며
+기준값의 python 버전, platform 이 현재 환경과 다르면 비교하지 않는다.
+새 환경에서는 먼저 --save 로 기준값을 다시 만든다.
+
+    python bench/bench_suite.py              # 기준값과 비교
+    python bench/bench_suite.py --save       # 현재 결과를 기준값으로 저장
+    python bench/bench_suite.py --tolerance 0.5 --limit 200
+
+"""
+import pathmagic  # noqa
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import traceback
+from hinsaem.config import CONFIG
+from hinsaem import eojeol_cache
+from hinsaem import lexicon_registry
+from hinsaem.pos_e import PosE
+from hinsaem.pos_j import PosJ
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+CORPUS_PATH = os.path.join(BENCH_DIR, "corpus", "synthetic.txt")
+BASELINE_PATH = os.path.join(BENCH_DIR, "baseline.json")
+
+REPEAT = 5
+# 사전 로딩은 몇 ms 밖에 걸리지 않아서 더 여러 번 재고 가장 빠른 값을 사용한다.
+LOAD_REPEAT = 20
+TOLERANCE = 0.3
+
+# 값이 클수록 좋은 지표, 나머지는 작을수록 좋은 지표(시간)
+_HIGHER_IS_BETTER = ["eojeol_per_sec"]
+
+
+def read_corpus(limit=None):
+    with open(CORPUS_PATH, "r", encoding="UTF-8") as fp:
+        sentence_list = [line.strip() for line in fp if line.strip()]
+    if limit:
+        sentence_list = sentence_list[:limit]
+    return sentence_list
+
+
+def _percentile(sorted_list, percent):
+    index = int(round((len(sorted_list) - 1) * percent / 100.0))
+    return sorted_list[index]
+
+
+def _time_calls(func, item_list, eojeol_count):
+    """
+    item_list 의 항목마다 func 를 REPEAT 번 호출한다.
+    처리량은 가장 빠른 회차로, 지연시간은 항목마다 가장 빠른 값으로 계산한다.
+    (다른 프로세스 때문에 생기는 측정 잡음을 줄이기 위해서)
+
+    Returns:
+        {"eojeol_per_sec": 초당 어절 수, "p50_us": 중앙값, "p99_us": 99% 값}
+    """
+    best_total = None
+    latency_list = [None] * len(item_list)
+    perf_counter = time.perf_counter
+    for _ in range(REPEAT):
+        total = 0.0
+        for index, item in enumerate(item_list):
+            time_stamp_01 = perf_counter()
+            func(item)
+            elapsed = perf_counter() - time_stamp_01
+            total += elapsed
+            if latency_list[index] is None or elapsed < latency_list[index]:
+                latency_list[index] = elapsed
+        if best_total is None or total < best_total:
+            best_total = total
+
+    total = best_total
+    latency_list.sort()
+    return {"eojeol_per_sec": eojeol_count / total,
+            "p50_us": _percentile(latency_list, 50) * 1e6,
+            "p99_us": _percentile(latency_list, 99) * 1e6}
+
+
+def _time_load(cls):
+    """ 공용 사전을 버리고 사전 캐시에서 다시 로딩하는 시간 """
+    cls()._tables()  # 사전 캐시 생성
+    best = None
+    for _ in range(LOAD_REPEAT):
+        lexicon_registry.reload(force=True)
+        time_stamp_01 = time.perf_counter()
+        cls()._tables()
+        elapsed = time.perf_counter() - time_stamp_01
+        if best is None or elapsed < best:
+            best = elapsed
+    return {"load_ms": best * 1000}
+
+
+def _safe_call(func, name, error_dict):
+    """
+    분석 중 예외가 나는 어절이 있어도 측정은 계속한다.
+    예외가 난 입력은 error_dict[name] 에 저장하고, 처음 예외는 출력한다.
+    """
+    def wrap(item):
+        try:
+            func(item)
+        except Exception:
+            error_set = error_dict.setdefault(name, set())
+            if not error_set:
+                print("%s : %r\n%s" % (name, item, traceback.format_exc()))
+            error_set.add(item)
+    return wrap
+
+
+def run(limit=None):
+    """
+    모든 항목을 측정한다.
+
+    Returns:
+        ({항목: {지표: 값}}, {항목: 예외가 난 입력 set})
+    """
+    sentence_list = read_corpus(limit)
+    eojeol_list = [eojeol for sentence in sentence_list
+                   for eojeol in sentence.split(" ")]
+
+    CONFIG["eojeol_cache_size"] = 0
+    eojeol_cache.reset()
+
+    result = {}
+    error_dict = {}
+    result["load.PosE"] = _time_load(PosE)
+    result["load.PosJ"] = _time_load(PosJ)
+
+    pos_e = PosE()
+    pos_j = PosJ()
+    result["endswithE"] = _time_calls(
+        _safe_call(pos_e.endswithE, "endswithE", error_dict),
+        eojeol_list, len(eojeol_list))
+    result["endswithj"] = _time_calls(
+        _safe_call(pos_j.endswithj, "endswithj", error_dict),
+        eojeol_list, len(eojeol_list))
+
+    def _tag_sentence(sentence):
+        for eojeol in sentence.split(" "):
+            pos_j.endswithj(eojeol)
+            pos_e.endswithE(eojeol)
+    result["sentence"] = _time_calls(
+        _safe_call(_tag_sentence, "sentence", error_dict),
+        sentence_list, len(eojeol_list))
+
+    if os.path.exists(CONFIG["res_dict_01"]):
+        from hinsaem.main import Hinsaem
+        hinsaem = Hinsaem()
+        result["hinsaem"] = _time_calls(
+            _safe_call(hinsaem._parse_sen, "hinsaem", error_dict),
+            sentence_list, len(eojeol_list))
+    return (result, error_dict)
+
+
+def compare(result, baseline, tolerance):
+    """
+    결과를 기준값과 비교한다.
+
+    Returns:
+        [ [항목, 지표, 기준값, 결과값, 변화율, 실패여부], ... ]
+    """
+    row_list = []
+    for name, metric_dict in sorted(result.items()):
+        for metric, value in sorted(metric_dict.items()):
+            base_value = baseline.get(name, {}).get(metric)
+            if base_value is None:
+                row_list.append([name, metric, None, value, None, False])
+                continue
+            change = (value - base_value) / base_value
+            if metric in _HIGHER_IS_BETTER:
+                regressed = change < -tolerance
+            else:
+                regressed = change > tolerance
+            row_list.append([name, metric, base_value, value, change,
+                             regressed])
+    return row_list
+
+
+def _read_baseline():
+    if not os.path.exists(BASELINE_PATH):
+        return None
+    with open(BASELINE_PATH, "r", encoding="UTF-8") as fp:
+        return json.load(fp)
+
+
+def _write_baseline(result, limit):
+    baseline = {"meta": {"python": platform.python_version(),
+                         "platform": platform.platform(), "limit": limit},
+                "result": result}
+    with open(BASELINE_PATH, "w", encoding="UTF-8", newline="\n") as fp:
+        json.dump(baseline, fp, indent=2, sort_keys=True)
+        fp.write("\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Hinsaem benchmark suite")
+    parser.add_argument("--save", action="store_true",
+                        help="save the result as the baseline")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE,
+                        help="allowed regression ratio (default: 0.3)")
+    parser.add_argument("--limit", type=int, default=None,
+                        help="number of corpus sentences to use")
+    args = parser.parse_args(argv)
+
+    (result, error_dict) = run(args.limit)
+    if args.save:
+        _write_baseline(result, args.limit)
+
+    baseline = _read_baseline()
+    if baseline is not None and baseline["meta"].get("limit") != args.limit:
+        print("baseline limit(%s) differs from --limit(%s), skip compare" % (
+            baseline["meta"].get("limit"), args.limit))
+        baseline = None
+    # 기준값은 절대 시간이므로 다른 환경에서 만든 기준값과는 비교하지 않는다.
+    if baseline is not None and (
+            baseline["meta"].get("python") != platform.python_version() or
+            baseline["meta"].get("platform") != platform.platform()):
+        print("baseline was recorded on %s (python %s), skip compare, "
+              "regenerate it with --save" % (
+                  baseline["meta"].get("platform"),
+                  baseline["meta"].get("python")))
+        baseline = None
+
+    row_list = compare(result, baseline["result"] if baseline else {},
+                       args.tolerance)
+    print("%-12s %-15s %12s %12s %8s" % (
+        "bench", "metric", "baseline", "result", "change"))
+    fail_count = 0
+    for name, metric, base_value, value, change, regressed in row_list:
+        print("%-12s %-15s %12s %12.1f %8s %s" % (
+            name, metric,
+            "-" if base_value is None else "%.1f" % base_value, value,
+            "-" if change is None else "%+.1f%%" % (change * 100),
+            "REGRESSION" if regressed else ""))
+        if regressed:
+            fail_count += 1
+
+    for name, error_set in sorted(error_dict.items()):
+        print("%-12s %d input(s) raised an exception" % (
+            name, len(error_set)))
+
+    if fail_count:
+        print("%d metric(s) regressed more than %.0f%%" % (
+            fail_count, args.tolerance * 100))
+    if fail_count or error_dict:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(main())
+    except Exception:
+        tb = traceback.format_exc()
+        print(tb)
+        sys.exit(1)
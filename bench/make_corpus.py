@@ -0,0 +1,107 @@
+"""벤치마크용 합성 말뭉치 생성
+
+res/NNP.tsv(고유명사), res/J.tsv(조사), res/E.tsv(어미)의 항목만 조합해서 문장을 만든다.
+외부 말뭉치를 사용하지 않기 때문에 사전 리소스와 같은 라이센스로 배포할 수 있다.
+
+* 체언+조사 어절 1~4개와 체언+"하"+어미 어절 1~2개로 한 문장을 만든다.
+* 실제 말뭉치처럼 적은 수의 어절이 자주 나오도록 체언은 Zipf 분포(1/순위)로 고른다.
+* 조사, 어미는 앞 음절과 phoneme 제약이 맞는 것만 고른다.
+* seed 가 고정되어 있어서 항상 같은 말뭉치가 만들어진다.
+
+    python bench/make_corpus.py
+
+"""
+import pathmagic  # noqa
+import os
+import csv
+import random
+import traceback
+from hinsaem.config import CONFIG
+from hinsaem.eumjeol_util import check_phoneme_restriction
+
+SEED = 20191029
+SENTENCE_COUNT = 1000
+NOUN_COUNT = 3000
+
+CORPUS_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "corpus", "synthetic.txt")
+
+_JOSA_POS = ["JKS", "JKO", "JKB", "JKG", "JX", "JC"]
+_EOMI_EC_POS = ["EC"]
+_EOMI_EF_POS = ["EF"]
+
+
+def _is_hangul(word):
+    return word != "" and all(u"가" <= ch <= u"힣" for ch in word)
+
+
+def _read_tsv(file_path):
+    with open(file_path, "r", encoding="UTF-8", newline="") as csvfile:
+        return list(csv.DictReader(
+            csvfile, delimiter="\t", dialect="excel-tab"))
+
+
+def _zipf_weights(count):
+    return [1.0 / rank for rank in range(1, count + 1)]
+
+
+def _pick_matched(rnd, item_list, eumjeol):
+    """ eumjeol 과 phoneme 제약이 맞는 항목 중 하나를 고른다. """
+    while True:
+        item = rnd.choice(item_list)
+        if check_phoneme_restriction(eumjeol, item["phoneme"]):
+            return item["word"]
+
+
+def make_corpus(sentence_count=SENTENCE_COUNT, seed=SEED):
+    """ 합성 말뭉치 문장 리스트를 만든다. """
+    rnd = random.Random(seed)
+
+    noun_list = sorted(set(
+        item["word"] for item in _read_tsv(CONFIG["res_dict_nnp"])
+        if _is_hangul(item["word"]) and 2 <= len(item["word"]) <= 4))
+    rnd.shuffle(noun_list)
+    noun_list = noun_list[:NOUN_COUNT]
+    noun_weights = _zipf_weights(len(noun_list))
+
+    josa_list = [item for item in _read_tsv(CONFIG["res_dict_j"])
+                 if _is_hangul(item["word"]) and item["pos"] in _JOSA_POS]
+    eomi_item_list = [item for item in _read_tsv(CONFIG["res_dict_e"])
+                      if _is_hangul(item["word"])]
+    ec_list = [item for item in eomi_item_list
+               if item["pos"] in _EOMI_EC_POS]
+    ef_list = [item for item in eomi_item_list
+               if item["pos"] in _EOMI_EF_POS]
+
+    sentence_list = []
+    for _ in range(sentence_count):
+        eojeol_list = []
+        for noun in rnd.choices(noun_list, noun_weights,
+                                k=rnd.randint(1, 4)):
+            eojeol_list.append(noun + _pick_matched(rnd, josa_list, noun[-1]))
+        if rnd.random() < 0.3:
+            noun = rnd.choices(noun_list, noun_weights)[0]
+            eojeol_list.append(noun + u"하" +
+                               _pick_matched(rnd, ec_list, u"하"))
+        noun = rnd.choices(noun_list, noun_weights)[0]
+        eojeol_list.append(noun + u"하" +
+                           _pick_matched(rnd, ef_list, u"하") + ".")
+        sentence_list.append(" ".join(eojeol_list))
+    return sentence_list
+
+
+def write_corpus(file_path=CORPUS_PATH):
+    sentence_list = make_corpus()
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    with open(file_path, "w", encoding="UTF-8", newline="\n") as fp:
+        for sentence in sentence_list:
+            fp.write(sentence + "\n")
+    print("%d sentences => %s" % (len(sentence_list), file_path))
+
+
+if __name__ == "__main__":
+    try:
+        write_corpus()
+    except Exception:
+        tb = traceback.format_exc()
+        print(tb)
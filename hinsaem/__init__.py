@@ -1,15 +1,29 @@
-import pkgutil
-__version__ = pkgutil.get_data(__package__, 'VERSION').decode('ascii').strip()
-version_info = tuple(int(v) if v.isdigit() else v
-                     for v in __version__.split('.'))
-del pkgutil
-
 # Check minimum required Python version
 
 import sys
-if sys.version_info < (2, 7):
-    print("Scrapy %s requires Python 2.7" % __version__)
+if sys.version_info < (3, 7):
+    print("Hinsaem requires Python 3.7")
     sys.exit(1)
 del sys
 
-from .main import Hinsaem
+
+# import hinsaem 만 할 때는 파일을 읽지 않도록 VERSION 파일과 Hinsaem, AsyncHinsaem class 는
+# 처음 사용할 때 읽는다.(PEP 562)
+def __getattr__(name):
+    if name in ("__version__", "version_info"):
+        import pkgutil
+        version = pkgutil.get_data(__package__, 'VERSION').decode(
+            'ascii').strip()
+        globals()["__version__"] = version
+        globals()["version_info"] = tuple(int(v) if v.isdigit() else v
+                                          for v in version.split('.'))
+        return globals()[name]
+    if name == "Hinsaem":
+        from .main import Hinsaem
+        globals()["Hinsaem"] = Hinsaem
+        return Hinsaem
+    if name == "AsyncHinsaem":
+        from .async_hinsaem import AsyncHinsaem
+        globals()["AsyncHinsaem"] = AsyncHinsaem
+        return AsyncHinsaem
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
@@ -0,0 +1,138 @@
+"""aho_corasick(다중 패턴 검색) Module
+
+이 모듈은 사전 단어 전체를 Aho-Corasick automaton 으로 만들어서 문장이나 문서를
+한번만 읽으면서 사전에 있는 단어를 모두 찾는 기능을 담당한다.
+
+부분 문자열을 하나씩 잘라서 사전을 조회하면 문장 길이의 제곱에 비례하지만,
+automaton 은 문장 길이와 찾은 단어 수에 비례한다.
+어절 안에 들어 있는 단어, 어절 경계(공백)에 걸친 단어도 찾는다.
+
+automaton 은 dict_cache 로 저장할 수 있도록 int 와 array 로만 이루어져 있다.
+
+* goto : {(node << 21) | 음절 code: 자식 node}, 모든 node 의 전이를 하나의 dict 에 저장한다.
+* fail : node 별 실패 전이 node
+* output : node 에서 끝나는 단어의 index, 없으면 -1
+* output_link : 실패 전이를 따라가면서 처음 만나는 단어가 끝나는 node, 없으면 0(root)
+
+"""
+import array
+import collections
+
+# unicode code point 는 21 bit 이다.
+_CHAR_BITS = 21
+
+
+class AhoCorasick(object):
+    """
+    Aho-Corasick automaton
+    """
+
+    def __init__(self, word_dict=None):
+        """
+        Args :
+            word_dict (dict) : {단어: 값} 형태의 사전(ex : {"서울": [...]})
+        """
+        self._goto = {}
+        self._fail = array.array("i", [0])
+        self._output = array.array("i", [-1])
+        self._output_link = array.array("i", [0])
+        # [(단어, 값), ...]
+        self._entries = []
+        if word_dict is not None:
+            self._build(word_dict)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _build(self, word_dict):
+        goto = self._goto
+        output = [-1]
+        # node 별 [(음절 code, 자식 node), ...], 실패 전이를 계산할 때만 사용한다.
+        children = [[]]
+        for word, value in word_dict.items():
+            if word == "":
+                continue
+            node = 0
+            for ch in word:
+                key = (node << _CHAR_BITS) | ord(ch)
+                child = goto.get(key)
+                if child is None:
+                    child = len(output)
+                    goto[key] = child
+                    output.append(-1)
+                    children.append([])
+                    children[node].append((ord(ch), child))
+                node = child
+            output[node] = len(self._entries)
+            self._entries.append((word, value))
+
+        fail = [0] * len(output)
+        output_link = [0] * len(output)
+        # 너비 우선으로 실패 전이를 계산한다.(부모의 실패 전이가 먼저 계산된다.)
+        queue = collections.deque(child for (_, child) in children[0])
+        while queue:
+            node = queue.popleft()
+            for (code, child) in children[node]:
+                queue.append(child)
+                state = fail[node]
+                while True:
+                    target = goto.get((state << _CHAR_BITS) | code)
+                    if target is not None or state == 0:
+                        break
+                    state = fail[state]
+                if target is None or target == child:
+                    target = 0
+                fail[child] = target
+                output_link[child] = target if output[target] >= 0 else \
+                    output_link[target]
+
+        self._fail = array.array("i", fail)
+        self._output = array.array("i", output)
+        self._output_link = array.array("i", output_link)
+
+    def iter_match(self, text, ignore_space=False):
+        """
+        text 를 한번 읽으면서 사전 단어를 모두 찾는다.
+
+        Args :
+            text (str) : 문장 또는 문서
+            ignore_space (bool) : True 이면 공백을 건너뛰고 찾는다.
+                어절 경계에 걸친 단어(ex : "서울 대학교" => "서울대학교")도 찾는다.
+        Returns:
+            (start, end, 단어, 값) 을 끝 위치 순서로 yield 한다.
+            같은 위치에서 끝나는 단어는 긴 단어부터 yield 한다.
+            text[start:end] 는 단어이다.(ignore_space 이면 공백이 들어 있을 수 있다.)
+            ex) iter_match("서울대학교") => (0, 2, "서울", ...),
+                (0, 5, "서울대학교", ...), (2, 5, "대학교", ...)
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        output_link = self._output_link
+        entries = self._entries
+        # ignore_space 인 경우 automaton 에 넣은 음절의 text 위치
+        index_list = []
+        node = 0
+        for index, ch in enumerate(text):
+            if ignore_space and ch.isspace():
+                continue
+            index_list.append(index)
+            code = ord(ch)
+            while True:
+                child = goto.get((node << _CHAR_BITS) | code)
+                if child is not None:
+                    node = child
+                    break
+                if node == 0:
+                    break
+                node = fail[node]
+
+            state = node if output[node] >= 0 else output_link[node]
+            while state > 0:
+                (word, value) = entries[output[state]]
+                if ignore_space:
+                    start = index_list[len(index_list) - len(word)]
+                else:
+                    start = index + 1 - len(word)
+                yield (start, index + 1, word, value)
+                state = output_link[state]
@@ -0,0 +1,252 @@
+"""async_hinsaem(asyncio 형태소 분석 서비스) Module
+
+이 모듈은 asyncio 서비스에서 event loop 를 막지 않고 문장을 형태소 분석하는 기능을 담당한다.
+
+동시에 들어온 여러 `await tag(sentence)` 요청을 micro-batch 로 모아서 worker 에 넘기고,
+batch 의 분석이 끝나면 요청마다 결과를 돌려준다.
+
+* batch 는 max_batch 개가 모이거나, 첫 요청 후 max_wait 초가 지나면 보낸다.
+* worker 는 Hinsaem.analyze_many 와 같이 "process"(사전을 미리 로딩한 ProcessPool) 또는
+  "thread"(Hinsaem 객체 하나를 공유하는 ThreadPool)를 사용한다.
+* 처리중인 batch 가 worker 수의 2배가 되면 새 요청은 대기열에서 기다린다.
+* stats() 로 대기열 길이, 처리중인 batch 수, batch 크기를 볼 수 있다.
+
+사용법::
+
+    async with AsyncHinsaem(workers=4) as hinsaem:
+        pos_list = await hinsaem.tag("빨리 학교에 가자.")
+
+"""
+import asyncio
+import functools
+import collections
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from .config import CONFIG
+from . import main
+
+# batch 를 보낸 이유
+FLUSH_SIZE = "size"         # max_batch 개가 모였다.
+FLUSH_TIME = "time"         # max_wait 초가 지났다.
+FLUSH_BACKLOG = "backlog"   # 처리중인 batch 가 끝나서 대기열을 보낸다.
+
+
+class AsyncHinsaem(object):
+    """
+    micro-batch 로 형태소 분석을 하는 asyncio 분석기
+
+    하나의 event loop 에서만 사용한다.
+    """
+
+    def __init__(self, workers=None, max_batch=None, max_wait=None,
+                 mode=None, hinsaem_class=None):
+        """
+        Args :
+            workers (int or "auto") : worker 수, None 이면
+                CONFIG["multiprocess_count"], "auto" 이면 CPU 수
+            max_batch (int) : batch 최대 문장 수, None 이면
+                CONFIG["async_max_batch"]
+            max_wait (float) : 첫 요청 후 batch 를 보낼 때까지 기다리는 최대 시간(초),
+                None 이면 CONFIG["async_max_wait"]
+            mode (str) : "process", "thread" 또는 "auto",
+                None 이면 CONFIG["analyze_many_mode"](Hinsaem.analyze_many 참고)
+            hinsaem_class : 분석기 class, None 이면 Hinsaem
+        """
+        if workers is None:
+            workers = CONFIG["multiprocess_count"]
+        if workers == "auto":
+            workers = mp.cpu_count()
+        if max_batch is None:
+            max_batch = CONFIG.get("async_max_batch", 32)
+        if max_wait is None:
+            max_wait = CONFIG.get("async_max_wait", 0.01)
+        if mode is None:
+            mode = CONFIG.get("analyze_many_mode", "process")
+        if mode == "auto":
+            mode = "process" if main._gil_enabled() else "thread"
+        if mode not in ("process", "thread"):
+            raise ValueError("unknown mode : %s" % mode)
+        if max_batch < 1:
+            raise ValueError("max_batch must be >= 1")
+        if max_wait < 0:
+            raise ValueError("max_wait must be >= 0")
+
+        self.workers = max(1, workers)
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.mode = mode
+        self._hinsaem_class = hinsaem_class or main.Hinsaem
+        self._max_in_flight = self.workers * 2
+
+        self._loop = None
+        self._executor = None
+        self._analyze_func = None
+        self._closed = False
+        # [(문장, future), ...] 아직 보내지 않은 요청
+        self._pending = []
+        self._timer = None
+        # 처리중인 batch 의 asyncio future
+        self._in_flight = set()
+        self._in_flight_sentences = 0
+        self._batch_count = 0
+        self._sentence_count = 0
+        self._max_batch_size = 0
+        self._batch_size_hist = collections.Counter()
+        self._flush_count = collections.Counter()
+        self._elapsed = 0.0
+
+    async def start(self):
+        """
+        worker 를 시작하고 사전을 로딩한다. tag 를 처음 호출할 때 자동으로 호출된다.
+        """
+        if self._closed:
+            raise RuntimeError("AsyncHinsaem is closed")
+        if self._executor is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        if self.mode == "thread":
+            hinsaem = self._hinsaem_class()
+            self._executor = ThreadPoolExecutor(self.workers)
+            self._analyze_func = functools.partial(
+                main._analyze_chunk_with, hinsaem)
+            # 모든 thread 가 같은 사전을 사용한다.
+            await self._loop.run_in_executor(self._executor, hinsaem._tables)
+        else:
+            self._executor = ProcessPoolExecutor(
+                self.workers, initializer=main._init_worker,
+                initargs=(self._hinsaem_class, dict(CONFIG)))
+            self._analyze_func = main._analyze_chunk
+            # worker 프로세스를 모두 띄워서 initializer 에서 사전을 로딩해 둔다.
+            await asyncio.gather(*[
+                self._loop.run_in_executor(
+                    self._executor, self._analyze_func, (-1, []))
+                for _ in range(self.workers)])
+
+    async def tag(self, sentence):
+        """
+        문장을 형태소 분석한다.
+
+        Args :
+            sentence (str) : 문장
+        Returns:
+            Hinsaem._parse_sen(sentence) 의 결과
+        """
+        if self._executor is None:
+            await self.start()
+        if self._closed:
+            raise RuntimeError("AsyncHinsaem is closed")
+        future = self._loop.create_future()
+        self._pending.append((sentence, future))
+        if len(self._pending) >= self.max_batch:
+            self._flush(FLUSH_SIZE)
+        elif self._timer is None:
+            self._timer = self._loop.call_later(
+                self.max_wait, self._flush, FLUSH_TIME)
+        return await future
+
+    async def tag_many(self, sentences):
+        """ 여러 문장을 동시에 요청하고, 결과를 입력 순서대로 리턴한다. """
+        return await asyncio.gather(*[self.tag(sen) for sen in sentences])
+
+    def _flush(self, reason):
+        """ 대기열의 요청을 max_batch 개씩 worker 에 보낸다. """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        while self._pending and len(self._in_flight) < self._max_in_flight:
+            batch = self._pending[:self.max_batch]
+            del self._pending[:self.max_batch]
+            # 기다리던 요청이 취소되었으면 보내지 않는다.
+            batch = [item for item in batch if not item[1].done()]
+            if batch:
+                self._dispatch(batch, reason)
+        if self._pending and self._timer is None and \
+                len(self._in_flight) < self._max_in_flight:
+            self._timer = self._loop.call_later(
+                self.max_wait, self._flush, FLUSH_TIME)
+
+    def _dispatch(self, batch, reason):
+        batch_index = self._batch_count
+        self._batch_count += 1
+        self._sentence_count += len(batch)
+        self._max_batch_size = max(self._max_batch_size, len(batch))
+        self._batch_size_hist[len(batch)] += 1
+        self._flush_count[reason] += 1
+        self._in_flight_sentences += len(batch)
+
+        chunk = (batch_index, [sentence for (sentence, _) in batch])
+        task = self._loop.run_in_executor(
+            self._executor, self._analyze_func, chunk)
+        self._in_flight.add(task)
+        task.add_done_callback(functools.partial(self._on_done, batch))
+
+    def _on_done(self, batch, task):
+        self._in_flight.discard(task)
+        self._in_flight_sentences -= len(batch)
+        if task.cancelled():
+            error = asyncio.CancelledError()
+        else:
+            error = task.exception()
+        if error is not None:
+            # batch 의 문장 하나라도 분석에 실패하면 batch 의 모든 요청이 실패한다.
+            for (_, future) in batch:
+                if not future.done():
+                    future.set_exception(error)
+        else:
+            (result_list, chunk_info) = task.result()
+            self._elapsed += chunk_info["elapsed"]
+            for (_, future), result in zip(batch, result_list):
+                if not future.done():
+                    future.set_result(result)
+        if self._pending:
+            self._flush(FLUSH_BACKLOG)
+
+    def stats(self):
+        """
+        Returns:
+            {"queue_depth": 보내지 않은 요청 수,
+             "in_flight": 처리중인 batch 수,
+             "in_flight_sentences": 처리중인 문장 수,
+             "batches": 보낸 batch 수, "sentences": 보낸 문장 수,
+             "mean_batch_size": 평균 batch 크기,
+             "max_batch_size": 최대 batch 크기,
+             "batch_size_hist": {batch 크기: batch 수},
+             "flush": {보낸 이유("size", "time", "backlog"): batch 수},
+             "elapsed": worker 의 분석시간 합(초)}
+        """
+        return {
+            "queue_depth": len(self._pending),
+            "in_flight": len(self._in_flight),
+            "in_flight_sentences": self._in_flight_sentences,
+            "batches": self._batch_count,
+            "sentences": self._sentence_count,
+            "mean_batch_size": (self._sentence_count / self._batch_count
+                                if self._batch_count else 0.0),
+            "max_batch_size": self._max_batch_size,
+            "batch_size_hist": dict(self._batch_size_hist),
+            "flush": dict(self._flush_count),
+            "elapsed": self._elapsed}
+
+    async def close(self):
+        """ 대기열과 처리중인 batch 를 모두 끝내고 worker 를 종료한다. """
+        if self._closed:
+            return
+        self._closed = True
+        if self._executor is None:
+            return
+        while self._pending or self._in_flight:
+            if self._pending:
+                self._flush(FLUSH_BACKLOG)
+            if self._in_flight:
+                await asyncio.wait(set(self._in_flight))
+        executor = self._executor
+        self._executor = None
+        await self._loop.run_in_executor(
+            None, functools.partial(executor.shutdown, wait=True))
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
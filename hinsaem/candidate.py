@@ -0,0 +1,72 @@
+"""candidate(분석 후보) Module
+
+이 모듈은 PosE.endswithE, PosJ.endswithj 의 분석 후보 하나를 나타내는 Candidate 를 담당한다.
+
+Candidate 는 (left, postag, mark, meta) 4개 항목의 tuple 이다.
+
+* 이전의 [left_word, postag_tuple, mark, posinfo] 리스트처럼 candidate[0] 으로도,
+  candidate.left 처럼 이름으로도 읽을 수 있다.
+* 변경할 수 없고, hash 가 가능해서 중복 제거할 때 후보 자체를 set 의 key 로 사용한다.
+* 항목이 모두 변경 불가능하므로 eojeol_cache 에 저장할 때 다시 복사하지 않는다.
+
+top_k 는 beam 모드(endswithE, endswithj 의 k)에서 후보를 빈도순으로 k 개만 남긴다.
+
+"""
+import heapq
+import collections
+from .pos_util import meta_freq
+
+_CandidateBase = collections.namedtuple(
+    "Candidate", ["left", "postag", "mark", "meta"])
+
+
+class Candidate(_CandidateBase):
+    """
+    분석 후보
+
+    Attributes :
+        left (str) : 어미, 조사를 제외한 앞 부분(ex : "빠르")
+        postag (tuple) : ((형태소, pos), ...), ex) (("고", "EC"),)
+        mark (str) : 문장기호, 없으면 None
+        meta : 형태소 정보(PosInfo), 여러 형태소를 합친 경우 union_meta 결과 dict
+    """
+    __slots__ = ()
+
+    def __hash__(self):
+        # meta 가 dict 인 경우가 있어서 meta 는 hash 에 넣지 않는다.
+        # (같은 Candidate 는 hash 가 같기만 하면 된다.)
+        return hash((self[0], self[1], self[2]))
+
+
+def top_k(candidate_iter, k, register=None, unique=True):
+    """
+    meta 빈도(meta_freq)가 높은 후보 k 개를 리턴한다. 같은 후보는 하나만 남긴다.
+
+    후보를 모두 모으지 않고 크기가 k 인 heap 만 유지한다.
+    빈도가 같으면 먼저 나온 후보가 앞에 온다.(빈도가 없는 사전은 앞의 k 개)
+
+    Args :
+        candidate_iter : Candidate iterable
+        k (int) : 남길 후보 수
+        register (str) : 빈도 종류, None 이면 CONFIG["freq_register"]
+        unique (bool) : False 이면 같은 후보도 중복해서 남긴다.
+    Returns:
+        [Candidate, ...], 빈도가 높은 순서
+    """
+    if k < 1:
+        raise ValueError("k must be >= 1")
+    heap = []
+    seen_set = set()
+    for seq, candidate in enumerate(candidate_iter):
+        if unique:
+            if candidate in seen_set:
+                continue
+            seen_set.add(candidate)
+        # 빈도가 같으면 seq 가 큰(나중에 나온) 후보가 먼저 빠진다.
+        item = (meta_freq(candidate.meta, register), -seq, candidate)
+        if len(heap) < k:
+            heapq.heappush(heap, item)
+        elif item[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, item)
+    heap.sort(key=lambda item: item[:2], reverse=True)
+    return [item[2] for item in heap]
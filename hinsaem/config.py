@@ -1,21 +1,84 @@
+"""config(설정) Module
+
+res/config.json 설정을 담당한다.
+CONFIG 는 dict 처럼 사용하지만, 처음 사용할 때 res/config.json 을 읽는다.
+그래서 hinsaem 패키지를 import 만 할 때는 파일을 읽지 않는다.
+
+"""
 import os
 import json
+import threading
+from collections.abc import MutableMapping
 
 _config_file_full_path = os.path.join(
     os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
     "res", "config.json")
 _lib_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
-CONFIG = {}
-with open(_config_file_full_path, encoding='utf8') as data_file:
-    CONFIG = json.load(data_file)
 
-for key, value in CONFIG.items():
-    if "res_" in key:
-        CONFIG[key] = os.path.join(_lib_path, value)
+def _read_config(file_path):
+    with open(file_path, encoding='utf8') as data_file:
+        config = json.load(data_file)
+
+    for key, value in config.items():
+        if "res_" in key:
+            config[key] = os.path.join(_lib_path, value)
+
+    config["sentence_end_mark"] = [".", "!", "?"]
+    config["sentence_mark"] = [",", ".", "!", "?"]
+    return config
+
+
+class LazyConfig(MutableMapping):
+    """
+    처음 사용할 때 설정 파일을 읽는 설정 dict
+    """
+
+    def __init__(self, file_path):
+        self._file_path = file_path
+        self._data = None
+        self._lock = threading.Lock()
+
+    def _get_data(self):
+        data = self._data
+        if data is None:
+            with self._lock:
+                if self._data is None:
+                    self._data = _read_config(self._file_path)
+                data = self._data
+        return data
+
+    def is_loaded(self):
+        """ 설정 파일을 읽었는지 여부 """
+        return self._data is not None
+
+    def __getitem__(self, key):
+        return self._get_data()[key]
+
+    def __setitem__(self, key, value):
+        self._get_data()[key] = value
+
+    def __delitem__(self, key):
+        del self._get_data()[key]
+
+    def __iter__(self):
+        return iter(self._get_data())
+
+    def __len__(self):
+        return len(self._get_data())
+
+    def __contains__(self, key):
+        return key in self._get_data()
+
+    def get(self, key, default=None):
+        return self._get_data().get(key, default)
+
+    def __repr__(self):
+        if self._data is None:
+            return "<LazyConfig %s (not loaded)>" % self._file_path
+        return repr(self._data)
 
 
-CONFIG["sentence_end_mark"] = [".", "!", "?"]
-CONFIG["sentence_mark"] = [",", ".", "!", "?"]
+CONFIG = LazyConfig(_config_file_full_path)
 
 # pprint(CONFIG)
@@ -0,0 +1,531 @@
+"""conjugation_rule(용언 활용 규칙) Module
+
+이 모듈은 용언 불규칙, 모음축약 규칙 파일(res/conjugation_rule.json)을 읽어서
+어간 후보, 어미 후보로 원어간, 원어미를 찾는 ConjugationRuleSet 으로 compile 하는
+기능을 담당한다. PosE, PosN 은 compile 된 같은 규칙을 공유한다.
+
+규칙 파일
+    * "sets" : 규칙에서 "@이름" 으로 사용하는 음절(단어) 리스트,
+      "_" 로 시작하는 key 는 설명이다.
+    * "rules" : 규칙 리스트, 파일 순서대로 검사한다.
+
+규칙 하나는 아래 항목으로 이루어진다.
+    * "type" : 규칙 이름(ex : "IRR_D"), PosE.Eojel_Type 의 이름과 같다.
+    * "group" : 규칙 묶음(ex : "irregular"), 묶음마다 어간 끝음절을 처음 값으로 한다.
+    * "chain" : 같은 chain 의 규칙은 처음 적용된 규칙 하나만 적용한다.(if, elif)
+    * "when" : 적용 조건, 모든 조건을 만족해야 한다.
+        - "stem", "eomi" : 어간 후보, 어미 후보가 리스트에 있는지
+        - "last", "org_last", "first", "prev" : 음절이 리스트에 있는지
+        - "last.cho" 처럼 음절 이름 뒤에 ".cho", ".jung", ".jong" : 자소가 리스트에
+          있는지(받침이 없으면 "")
+        - "min_stem_len" : 어간 후보의 최소 길이
+        - "pos_filter_without" : pos_filter 에 없어야 하는 품사
+        - "unless" : 앞에서 적용되면 안되는 규칙 이름
+        - "any" : 조건 리스트 중 하나를 만족하는지
+    * "eogan", "eomi", "last" : 원어간, 원어미, 음운 조건을 확인할 어간 끝음절 template
+    * "set_last" : 적용되면 같은 group 의 뒤 규칙이 사용하는 어간 끝음절(last) template
+
+음절 이름
+    * stem : 어간 후보, eomi : 어미 후보(ex : stem[:-1], eomi[1:])
+    * org_last : 어간 후보 끝음절, last : 현재 어간 끝음절(set_last 로 바뀔 수 있다.)
+    * first : 어미 후보 첫음절, prev : 어간 후보 끝에서 두번째 음절
+    * eogan : 규칙으로 만든 원어간("last" template 에서 사용)
+    * harmony : 어간 끝음절이 양성모음이면 "아", 아니면 "어"
+
+template 은 "{음절 이름}" 을 값으로 바꾼다. "{last|jong=ㄷ}" 처럼 "|" 뒤에 자소를
+바꿀 수 있고, "{어|jong=org_last.jong}" 처럼 한글 음절 하나를 바로 쓸 수 있다.
+
+"""
+import re
+import json
+import logging
+from operator import itemgetter
+from types import MappingProxyType
+from .config import CONFIG
+from .lexicon_registry import get_tables
+from .eumjeol_util import parse_eumjeol, change_jaso, YANG_VOWEL
+
+logger = logging.getLogger(__name__)
+
+#: 규칙 파일 형식 version
+RULE_FILE_VERSION = 1
+
+_JASO_INDEX = {"cho": 0, "jung": 1, "jong": 2}
+_NAME_LIST = ["stem", "eomi", "last", "org_last", "first", "prev", "eogan",
+              "harmony"]
+# 어간 끝음절, 어미 첫음절만 알면 index 를 만들 때 값을 알 수 있는 음절 이름
+_SYLLABLE_NAME_LIST = ["last", "org_last", "first"]
+_REF_RE = re.compile(
+    r"^(?P<name>[a-z_]+)"
+    r"(?:\[(?P<start>-?\d*)(?P<colon>:)?(?P<stop>-?\d*)\])?"
+    r"(?:\.(?P<part>cho|jung|jong))?$")
+_TEMPLATE_RE = re.compile(r"\{([^{}]*)\}")
+_NO_JASO = (None, None, None)
+
+
+def _jaso(eumjeol):
+    """ 음절의 (초성, 중성, 종성), 한글 음절이 아니면 (None, None, None) """
+    try:
+        return parse_eumjeol(eumjeol) or _NO_JASO
+    except (IndexError, TypeError):
+        return _NO_JASO
+
+
+def _is_hangul_syllable(text):
+    return len(text) == 1 and u"가" <= text <= u"힣"
+
+
+def _compile_getter(name, index, part):
+    """ context 에서 음절 이름의 값을 읽는 함수 """
+    if name == "harmony":
+        def get_name(context):
+            if _jaso(context["org_last"])[1] in YANG_VOWEL:
+                return u"아"
+            return u"어"
+    else:
+        get_name = itemgetter(name)
+    if isinstance(index, int):
+        index = slice(index, index + 1 or None)
+    get_text = get_name
+    if index is not None:
+        def get_text(context):
+            return get_name(context)[index]
+    if part is None:
+        return get_text
+
+    def get_jaso(context):
+        return _jaso(get_text(context))[part]
+    return get_jaso
+
+
+class _Ref(object):
+    """ 규칙 안의 음절 이름(ex : "stem[:-1]", "org_last.jong") """
+    __slots__ = ("text", "name", "index", "part", "get")
+
+    def __init__(self, text):
+        self.text = text
+        match = _REF_RE.match(text)
+        if match is None or match.group("name") not in _NAME_LIST:
+            raise ValueError("unknown name in conjugation rule : %s" % text)
+        self.name = match.group("name")
+        self.index = None
+        if match.group("colon"):
+            self.index = slice(
+                int(match.group("start")) if match.group("start") else None,
+                int(match.group("stop")) if match.group("stop") else None)
+        elif match.group("start"):
+            self.index = int(match.group("start"))
+        part = match.group("part")
+        self.part = None if part is None else _JASO_INDEX[part]
+        # 값, 자소(.cho 같은)는 없으면 None
+        self.get = _compile_getter(self.name, self.index, self.part)
+
+
+class _Literal(object):
+    """ template 안의 한글 음절, 자소(ex : "{어|jong=ㄷ}" 의 "어", "ㄷ") """
+    __slots__ = ("value", "get")
+
+    def __init__(self, value):
+        self.value = value
+        self.get = lambda context: value
+
+
+def _compile_value(text):
+    """ 자소 변경 값, 음절 이름(ex : org_last.jong) 또는 자소(빈 문자열 가능) """
+    if _REF_RE.match(text) and text.split(".")[0].split("[")[0] in _NAME_LIST:
+        return _Ref(text)
+    return _Literal(text)
+
+
+class _Template(object):
+    """ 원어간, 원어미를 만드는 template(ex : "{stem[:-1]}{last|jong=ㄷ}") """
+    __slots__ = ("text", "ref_list", "part_list")
+
+    def __init__(self, text):
+        self.text = text
+        self.ref_list = []
+        # [context 를 받아서 문자열을 리턴하는 함수]
+        self.part_list = []
+        position = 0
+        for match in _TEMPLATE_RE.finditer(text):
+            if match.start() > position:
+                self.part_list.append(
+                    _Literal(text[position:match.start()]).get)
+            self.part_list.append(self._compile_part(match.group(1)))
+            position = match.end()
+        if position < len(text):
+            self.part_list.append(_Literal(text[position:]).get)
+
+    def _compile_part(self, text):
+        source_text, _, change_text = text.partition("|")
+        if _is_hangul_syllable(source_text):
+            source = _Literal(source_text)
+        else:
+            source = _Ref(source_text)
+            self.ref_list.append(source)
+        change_list = [None, None, None]
+        for item in change_text.split(",") if change_text else []:
+            key, _, value = item.partition("=")
+            if key.strip() not in _JASO_INDEX:
+                raise ValueError(
+                    "unknown jaso in conjugation rule : %s" % text)
+            value = _compile_value(value.strip())
+            if isinstance(value, _Ref):
+                self.ref_list.append(value)
+            change_list[_JASO_INDEX[key.strip()]] = value
+
+        get_source = source.get
+        if change_list == [None, None, None]:
+            return lambda context: get_source(context) or ""
+        (get_cho, get_jung, get_jong) = [
+            (lambda context: None) if item is None else item.get
+            for item in change_list]
+
+        def get_changed(context):
+            return change_jaso(get_source(context), get_cho(context),
+                               get_jung(context), get_jong(context)) or ""
+        return get_changed
+
+    def names(self):
+        """ template 에서 사용하는 음절 이름 """
+        return set(ref.name for ref in self.ref_list)
+
+    def render(self, context):
+        return "".join([get_part(context) for get_part in self.part_list])
+
+
+class _Condition(object):
+    """ 규칙의 "when" 조건 """
+    __slots__ = ("check_list", "any_list", "min_stem_len",
+                 "pos_filter_without", "unless", "gate_list")
+
+    def __init__(self, when, sets):
+        # [(값을 읽는 함수, frozenset(허용 값))]
+        self.check_list = []
+        self.any_list = []
+        self.min_stem_len = 0
+        self.pos_filter_without = ()
+        self.unless = ()
+        # 어간 끝음절, 어미 첫음절로 검사할 수 있는 조건
+        # [(음절 이름, 값을 읽는 함수, frozenset(허용 값))]
+        self.gate_list = []
+        for key, value in when.items():
+            if key == "any":
+                self.any_list = [_Condition(item, sets) for item in value]
+            elif key == "min_stem_len":
+                self.min_stem_len = int(value)
+            elif key == "pos_filter_without":
+                self.pos_filter_without = tuple(value)
+            elif key == "unless":
+                self.unless = tuple(value)
+            else:
+                self._add_check(key, frozenset(_get_set(value, sets)))
+
+    def _add_check(self, key, value_set):
+        ref = _Ref(key)
+        if ref.name in ["eogan", "harmony"]:
+            raise ValueError(
+                "unknown condition in conjugation rule : %s" % key)
+        self.check_list.append((ref.get, value_set))
+        if ref.name in ["stem", "eomi"] and ref.index is None and\
+                ref.part is None:
+            # 어간, 어미 전체는 끝음절, 첫음절만 검사한다.
+            if ref.name == "stem":
+                self.gate_list.append(
+                    ("org_last", itemgetter("org_last"),
+                     frozenset(word[-1:] for word in value_set)))
+            else:
+                self.gate_list.append(
+                    ("first", itemgetter("first"),
+                     frozenset(word[:1] for word in value_set)))
+        elif ref.name in _SYLLABLE_NAME_LIST and ref.index is None:
+            self.gate_list.append((ref.name, ref.get, value_set))
+
+    def match(self, context, pos_filter, matched_set):
+        if len(context["stem"]) < self.min_stem_len:
+            return False
+        for pos in self.pos_filter_without:
+            if pos in pos_filter:
+                return False
+        for name in self.unless:
+            if name in matched_set:
+                return False
+        for get_value, value_set in self.check_list:
+            if get_value(context) not in value_set:
+                return False
+        if self.any_list:
+            for condition in self.any_list:
+                if condition.match(context, pos_filter, matched_set):
+                    return True
+            return False
+        return True
+
+    def may_match(self, org_last, first, last_list):
+        """
+        어간 끝음절, 어미 첫음절만으로 적용될 수 있는지 확인한다.
+        (어간 전체 같은 나머지 조건은 만족한다고 본다.)
+
+        Args :
+            last_list : 현재 어간 끝음절(last)이 될 수 있는 음절 리스트,
+                None 이면 알 수 없다.
+        """
+        context = {"org_last": org_last, "first": first}
+        for name, get_value, value_set in self.gate_list:
+            if name != "last":
+                if get_value(context) not in value_set:
+                    return False
+            elif last_list is not None:
+                for last in last_list:
+                    if get_value({"last": last}) in value_set:
+                        break
+                else:
+                    return False
+        if self.any_list:
+            for condition in self.any_list:
+                if condition.may_match(org_last, first, last_list):
+                    return True
+            return False
+        return True
+
+
+def _get_set(value, sets):
+    """ 조건 값, "@이름" 이면 sets 의 리스트 """
+    if isinstance(value, str):
+        if not value.startswith("@"):
+            raise ValueError("conjugation rule set must start with @ : %s" %
+                             value)
+        return sets[value[1:]]
+    return value
+
+
+class ConjugationRule(object):
+    """
+    활용 규칙 하나
+
+    Attributes :
+        name (str) : 규칙 이름(ex : "IRR_D")
+        group (str) : 규칙 묶음(ex : "irregular")
+        chain (str) : 같은 chain 에서 하나만 적용, 없으면 None
+        desc (str) : 설명
+        checked (int) : 검사 횟수
+        hits (int) : 적용 횟수
+    """
+    __slots__ = ("name", "group", "chain", "desc", "condition", "eogan",
+                 "eomi", "last", "set_last", "checked", "hits")
+
+    def __init__(self, rule_dict, sets):
+        self.name = rule_dict["type"]
+        self.group = rule_dict.get("group", "")
+        self.chain = rule_dict.get("chain")
+        self.desc = rule_dict.get("desc", "")
+        self.condition = _Condition(rule_dict.get("when", {}), sets)
+        self.eogan = _Template(rule_dict["eogan"])
+        self.eomi = _Template(rule_dict["eomi"])
+        self.last = _Template(rule_dict["last"])
+        self.set_last = None
+        if rule_dict.get("set_last"):
+            self.set_last = _Template(rule_dict["set_last"])
+        self.checked = 0
+        self.hits = 0
+        if "eogan" in self.eogan.names() or "eogan" in self.eomi.names():
+            raise ValueError(
+                "eogan can be used only in last template : %s" % self.name)
+
+    def __repr__(self):
+        return "ConjugationRule(%s, %s)" % (self.name, self.desc)
+
+
+class ConjugationRuleSet(object):
+    """
+    compile 된 활용 규칙
+
+    (어간 끝음절, 어미 첫음절) 로 적용될 수 있는 규칙을 처음 나온 음절 조합마다
+    찾아서 index 에 저장하고, find() 는 index 의 규칙만 검사한다.
+    """
+    # index 에 저장하는 최대 (어간 끝음절, 어미 첫음절) 수
+    INDEX_MAX_SIZE = 100000
+
+    def __init__(self, rule_list):
+        self.rule_list = tuple(rule_list)
+        # {(어간 끝음절, 어미 첫음절): (ConjugationRule, ...)}
+        self._index = {}
+
+    def __len__(self):
+        return len(self.rule_list)
+
+    def names(self):
+        """ 규칙 이름 리스트(중복 제외, 파일 순서) """
+        name_list = []
+        for rule in self.rule_list:
+            if rule.name not in name_list:
+                name_list.append(rule.name)
+        return name_list
+
+    def get_rules(self, org_last, first):
+        """
+        어간 끝음절, 어미 첫음절로 적용될 수 있는 규칙
+
+        Returns:
+            (ConjugationRule, ...), 파일 순서
+        """
+        key = (org_last, first)
+        rule_tuple = self._index.get(key)
+        if rule_tuple is None:
+            rule_tuple = self._compile_rules(org_last, first)
+            if len(self._index) < self.INDEX_MAX_SIZE:
+                self._index[key] = rule_tuple
+        return rule_tuple
+
+    def _compile_rules(self, org_last, first):
+        if org_last == "":
+            return ()
+        rule_list = []
+        group = None
+        last_list = None
+        for rule in self.rule_list:
+            if rule.group != group:
+                group = rule.group
+                last_list = [org_last]
+            if not rule.condition.may_match(org_last, first, last_list):
+                continue
+            rule_list.append(rule)
+            if rule.set_last is not None and last_list is not None:
+                # set_last 가 어간 전체 같은 값을 사용하면 뒤의 규칙은
+                # 어간 끝음절로 거를 수 없다.
+                if rule.set_last.names() <= set(_SYLLABLE_NAME_LIST):
+                    last_list.append(rule.set_last.render(
+                        {"org_last": org_last, "first": first,
+                         "last": org_last}))
+                else:
+                    last_list = None
+        return tuple(rule_list)
+
+    def find(self, candidate_eogan, candidate_eomi, pos_filter):
+        """
+        어간 후보, 어미 후보에 적용되는 규칙으로 원어간, 원어미를 찾는다.
+
+        Args :
+            candidate_eogan (str) : 어간 후보
+            candidate_eomi (str) : 어미 후보
+            pos_filter : 가능한 형태소 품사
+        Returns:
+            [(eogan, eomi, last_eumjeol_eogan, name), ...]
+            eogan, eomi : 원어간, 원어미
+            last_eumjeol_eogan : 음운 조건을 확인해야 하는 어간의 마지막 음절
+            name : 규칙 이름
+        """
+        # 어간이 없는 경우는 없다.
+        if candidate_eogan == "":
+            return []
+        org_last = candidate_eogan[-1]
+        rule_tuple = self.get_rules(org_last, candidate_eomi[:1])
+        if not rule_tuple:
+            return []
+
+        context = {"stem": candidate_eogan, "eomi": candidate_eomi,
+                   "org_last": org_last, "last": org_last,
+                   "first": candidate_eomi[:1],
+                   "prev": candidate_eogan[-2:-1]}
+        eogan_eomi_list = []
+        matched_set = set()
+        chain_set = set()
+        group = None
+        for rule in rule_tuple:
+            if rule.group != group:
+                group = rule.group
+                context["last"] = org_last
+            if rule.chain is not None and rule.chain in chain_set:
+                continue
+            rule.checked += 1
+            if not rule.condition.match(context, pos_filter, matched_set):
+                continue
+            rule.hits += 1
+            eogan = rule.eogan.render(context)
+            eomi = rule.eomi.render(context)
+            context["eogan"] = eogan
+            eogan_eomi_list.append(
+                (eogan, eomi, rule.last.render(context), rule.name))
+            matched_set.add(rule.name)
+            if rule.chain is not None:
+                chain_set.add(rule.chain)
+            if rule.set_last is not None:
+                context["last"] = rule.set_last.render(context)
+        return eogan_eomi_list
+
+    def stats(self):
+        """
+        규칙별 검사/적용 횟수
+        (여러 thread 에서 분석하는 경우 정확하지 않을 수 있다.)
+
+        Returns:
+            {규칙 이름: {"checked": 검사 횟수, "hits": 적용 횟수}}
+        """
+        stats = {name: {"checked": 0, "hits": 0} for name in self.names()}
+        for rule in self.rule_list:
+            stats[rule.name]["checked"] += rule.checked
+            stats[rule.name]["hits"] += rule.hits
+        return stats
+
+    def reset_stats(self):
+        """ 규칙별 검사/적용 횟수를 0 으로 한다. """
+        for rule in self.rule_list:
+            rule.checked = 0
+            rule.hits = 0
+
+
+def load_rules(file_path):
+    """
+    규칙 파일을 읽어서 compile 한다.
+
+    Args :
+        file_path (str) : 규칙 파일(json) 경로
+    Returns:
+        ConjugationRuleSet
+    """
+    with open(file_path, encoding="utf8") as fp:
+        rule_file = json.load(fp)
+    return compile_rules(rule_file)
+
+
+def compile_rules(rule_file):
+    """
+    규칙 파일 내용을 compile 한다.
+
+    Args :
+        rule_file (dict) : {"version": 1, "sets": {...}, "rules": [...]}
+    Returns:
+        ConjugationRuleSet
+    """
+    version = rule_file.get("version", RULE_FILE_VERSION)
+    if version != RULE_FILE_VERSION:
+        raise ValueError("unknown conjugation rule version : %s" % version)
+    sets = {name: value for name, value in rule_file.get("sets", {}).items()
+            if not name.startswith("_")}
+    rule_list = [ConjugationRule(rule_dict, sets)
+                 for rule_dict in rule_file.get("rules", [])]
+    logger.debug("conjugation rule : %d", len(rule_list))
+    return ConjugationRuleSet(rule_list)
+
+
+def get_ruleset():
+    """
+    CONFIG["res_conjugation_rule"] 규칙을 compile 한 공용 ConjugationRuleSet,
+    처음 호출할 때 compile 해서 사전 등록소(lexicon_registry)에 등록한다.
+    """
+    file_path = CONFIG["res_conjugation_rule"]
+    tables = get_tables(
+        "CONJUGATION_RULE", file_path,
+        lambda: {"RULESET": load_rules(file_path)})
+    return tables["RULESET"]
+
+
+def with_ruleset(tables):
+    """
+    분석기 사전 tables 에 공용 규칙("CONJUGATION_RULE")을 추가한다.
+
+    Args :
+        tables : get_tables() 결과
+    Returns:
+        변경할 수 없는 {"KEY": table, ..., "CONJUGATION_RULE": ConjugationRuleSet}
+    """
+    return MappingProxyType(dict(tables, CONJUGATION_RULE=get_ruleset()))
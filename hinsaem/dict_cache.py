@@ -0,0 +1,216 @@
+"""dict_cache(사전 캐시) Module
+
+이 모듈은 res/*.tsv 사전을 읽어서 만든 결과를 바이너리(pickle) 파일로 저장해 두고,
+다음 로딩 때 TSV 를 다시 파싱하지 않고 저장된 파일을 읽도록 하는 기능을 담당한다.
+
+캐시 파일은 헤더와 본문 두 개의 pickle 로 이루어져 있다.
+헤더에는 캐시 형식 버전과 원본 사전 파일의 크기, 수정시간, sha1 해시가 들어 있어서
+본문을 읽기 전에 캐시가 유효한지 확인할 수 있다.
+
+유효성 검사 순서
+1. 캐시 형식 버전이 다르면 무효
+2. 원본 파일의 크기, 수정시간이 같으면 유효
+3. 수정시간이 다르더라도 sha1 해시가 같으면 유효(파일을 touch 만 한 경우)
+
+캐시 미리 만들기(compile)::
+
+    python -m hinsaem.dict_cache
+
+"""
+import os
+import pickle
+import hashlib
+import traceback
+import logging
+from .config import CONFIG
+
+logger = logging.getLogger(__name__)
+
+#: 캐시 파일 형식 버전, 사전 로딩 결과 형식이 바뀌면 값을 올린다.
+DICT_CACHE_VERSION = 6
+
+_CACHE_EXT = ".pickle"
+
+
+def _cache_path(name):
+    return os.path.join(CONFIG["res_dict_cache"], name + _CACHE_EXT)
+
+
+def _file_sha1(file_path):
+    sha1 = hashlib.sha1()
+    with open(file_path, "rb") as fp:
+        for block in iter(lambda: fp.read(1 << 20), b""):
+            sha1.update(block)
+    return sha1.hexdigest()
+
+
+def _as_path_list(file_paths):
+    if isinstance(file_paths, str):
+        return [file_paths]
+    return list(file_paths)
+
+
+def source_signature(file_paths):
+    """원본 사전 파일들의 서명 정보를 만든다.
+
+    Args :
+        file_paths (str or list) : 원본 사전 파일 경로
+    Returns:
+        [ [file_path, size, mtime_ns, sha1], ... ]
+    """
+    signature = []
+    for file_path in _as_path_list(file_paths):
+        stat = os.stat(file_path)
+        signature.append([file_path, stat.st_size, stat.st_mtime_ns,
+                          _file_sha1(file_path)])
+    return signature
+
+
+def is_fresh(signature, file_paths):
+    """저장된 서명 정보가 현재 원본 사전 파일과 일치하는지 검사한다.
+
+    Args :
+        signature : source_signature 로 만든 서명 정보
+        file_paths (str or list) : 원본 사전 파일 경로
+    Returns:
+        일치하면 True
+    """
+    path_list = _as_path_list(file_paths)
+    if len(signature) != len(path_list):
+        return False
+    for (_, size, mtime_ns, sha1), file_path in zip(signature, path_list):
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return False
+        if stat.st_size != size:
+            return False
+        # 수정시간이 같으면 해시 계산을 생략한다.
+        if stat.st_mtime_ns == mtime_ns:
+            continue
+        if _file_sha1(file_path) != sha1:
+            return False
+    return True
+
+
+def read_cache(name, file_paths):
+    """유효한 캐시가 있으면 캐시 내용을, 없으면 None 을 리턴한다."""
+    cache_path = _cache_path(name)
+    if not os.path.exists(cache_path):
+        return None
+    try:
+        with open(cache_path, "rb") as fp:
+            header = pickle.load(fp)
+            if header.get("version") != DICT_CACHE_VERSION or\
+                    header.get("name") != name:
+                return None
+            if not is_fresh(header["sources"], file_paths):
+                return None
+            return pickle.load(fp)
+    except Exception:
+        # 캐시가 깨진 경우에는 원본을 다시 읽는다.
+        logger.warning("dict cache broken : %s\n%s",
+                       cache_path, traceback.format_exc())
+        return None
+
+
+def write_cache(name, file_paths, data):
+    """원본 사전의 서명 정보와 함께 data 를 캐시로 저장한다."""
+    cache_path = _cache_path(name)
+    header = {"version": DICT_CACHE_VERSION, "name": name,
+              "sources": source_signature(file_paths)}
+    tmp_path = "%s.%d.tmp" % (cache_path, os.getpid())
+    replaced = False
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, "wb") as fp:
+            pickle.dump(header, fp, pickle.HIGHEST_PROTOCOL)
+            pickle.dump(data, fp, pickle.HIGHEST_PROTOCOL)
+        # 다른 프로세스가 중간 상태의 파일을 읽지 않도록 교체한다.
+        os.replace(tmp_path, cache_path)
+        replaced = True
+    except OSError:
+        # 읽기 전용 설치 환경 같은 경우 캐시 없이 동작한다.
+        logger.warning("dict cache write fail : %s", cache_path)
+    finally:
+        # pickle 오류 등 어떤 예외가 나도 임시 파일을 남기지 않는다.
+        if not replaced and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def load_dict(name, file_paths, read_func):
+    """캐시가 유효하면 캐시를 읽고, 아니면 원본 사전을 읽은 후 캐시를 저장한다.
+
+    Args :
+        name (str) : 캐시 이름, 사전 로딩 결과 형식마다 달라야 한다.
+        file_paths (str or list) : 원본 사전 파일 경로
+        read_func : 원본 사전을 읽는 함수, read_func(file_paths) 형태로 호출한다.
+    Returns:
+        read_func 의 결과 또는 캐시된 결과
+    """
+    if not CONFIG.get("dict_cache", True):
+        return read_func(file_paths)
+
+    data = read_cache(name, file_paths)
+    if data is not None:
+        return data
+
+    data = read_func(file_paths)
+    write_cache(name, file_paths, data)
+    return data
+
+
+def clear(name=None):
+    """캐시 파일을 삭제한다.
+
+    캐시 디렉토리의 파일 이름은 "<name>.<종류>" 형태이다.
+    (lexicon_store 의 mmap 파일도 같이 삭제된다.)
+
+    Args :
+        name (str) : 삭제하려는 캐시 이름, None 이면 모든 캐시를 삭제한다.
+    """
+    cache_dir = CONFIG["res_dict_cache"]
+    if not os.path.isdir(cache_dir):
+        return
+    for file_name in os.listdir(cache_dir):
+        if name is not None and file_name.split(".")[0] != name:
+            continue
+        os.remove(os.path.join(cache_dir, file_name))
+
+
+def compile_all():
+    """모든 사전의 캐시를 새로 만든다.
+
+    사전이 없는 분석기의 경우 오류를 출력하고 다음 사전을 처리한다.
+    """
+    from .main import Hinsaem
+    from .pos_e import PosE
+    from .pos_j import PosJ
+    from .pos_n0 import PosN0
+    from .pos_nr import PosNR
+
+    clear()
+    for cls in [PosE, PosJ, PosNR, PosN0, Hinsaem]:
+        try:
+            cls()._tables()
+            logger.info("dict cache compiled : %s", cls.__name__)
+        except Exception:
+            tb = traceback.format_exc()
+            print(tb)
+
+    # 체언 사전 AhoCorasick automaton
+    try:
+        PosN0()._noun_scanner()
+        logger.info("dict cache compiled : PosN0 scanner")
+    except Exception:
+        tb = traceback.format_exc()
+        print(tb)
+
+
+if __name__ == "__main__":
+    try:
+        logging.basicConfig(level=logging.INFO)
+        compile_all()
+    except Exception:
+        tb = traceback.format_exc()
+        print(tb)
@@ -0,0 +1,171 @@
+"""eojeol_cache(어절 분석결과 캐시) Module
+
+이 모듈은 어절 분석결과를 저장해 두는 LRU 캐시를 담당한다.
+
+한국어 말뭉치의 어절은 Zipf 분포를 따르기 때문에 "있다.", "것은", "그는" 같은 적은 수의
+어절이 대부분을 차지한다. 같은 어절을 다시 분석하지 않도록 PosE.endswithE,
+PosJ.endswithj, Hinsaem._parse_sen 의 어절 분석결과를 프로세스 하나에 하나 있는
+공용 캐시에 저장한다.
+
+* 캐시 key 는 (분석기 class 이름, 분석 종류, 어절, 분석결과가 달라지는 옵션...) 이다.
+  같은 class, 같은 옵션의 분석기 객체들은 캐시를 공유한다.
+  사전은 프로세스 공용(lexicon_registry)이므로 사전을 바꾸면 lexicon_registry.reload() 로
+  캐시도 비워야 한다.
+* 캐시된 분석결과는 리스트를 tuple 로 바꾼 변경 불가능한 값이다.
+  (posinfo dict 는 사전의 값을 그대로 공유한다.)
+* 캐시 크기는 CONFIG["eojeol_cache_size"] 이고, 0 이면 캐시를 사용하지 않는다.
+* hit/miss/eviction 횟수는 stats() 로 확인한다.
+
+"""
+import threading
+import collections
+from .config import CONFIG
+
+#: CONFIG 에 eojeol_cache_size 가 없을 때의 캐시 크기
+DEFAULT_CACHE_SIZE = 100000
+
+_MISSING = object()
+
+
+class LRUCache(object):
+    """
+    크기가 정해진 LRU 캐시
+
+    가장 오래 사용하지 않은 항목부터 버린다. 여러 thread 에서 같이 사용할 수 있다.
+    """
+
+    def __init__(self, maxsize):
+        """
+        Args :
+            maxsize (int) : 최대 항목 수
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """ key 의 값을 리턴한다. 없으면 default 를 리턴한다. """
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """ key 의 값을 저장한다. 최대 항목 수를 넘으면 오래된 항목을 버린다. """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """ 모든 항목과 hit/miss/eviction 횟수를 지운다. """
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self):
+        """
+        Returns:
+            {"size": 항목 수, "maxsize": 최대 항목 수, "hits": hit 횟수,
+             "misses": miss 횟수, "evictions": 버린 항목 수}
+        """
+        with self._lock:
+            return {"size": len(self._data), "maxsize": self.maxsize,
+                    "hits": self.hits, "misses": self.misses,
+                    "evictions": self.evictions}
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+
+_shared_cache = None
+_shared_lock = threading.Lock()
+
+
+def shared_cache():
+    """
+    프로세스 공용 캐시를 리턴한다. 처음 호출할 때 CONFIG["eojeol_cache_size"]
+    크기로 만든다. 크기가 0 이면 None 을 리턴한다.
+    """
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_lock:
+            if _shared_cache is None:
+                maxsize = CONFIG.get("eojeol_cache_size", DEFAULT_CACHE_SIZE)
+                if maxsize <= 0:
+                    return None
+                _shared_cache = LRUCache(maxsize)
+    return _shared_cache
+
+
+def reset():
+    """
+    공용 캐시를 버린다. 다음에 사용할 때 CONFIG["eojeol_cache_size"] 크기로
+    새로 만든다.
+    """
+    global _shared_cache
+    with _shared_lock:
+        _shared_cache = None
+
+
+def stats():
+    """ 공용 캐시의 hit/miss/eviction 정보(LRUCache.stats), 캐시가 없으면 None """
+    cache = shared_cache()
+    if cache is None:
+        return None
+    return cache.stats()
+
+
+def freeze(value):
+    """
+    분석결과의 리스트를 tuple 로 바꾼다. dict, PosInfo 는 그대로 둔다.
+    Candidate 같은 tuple 하위 class 는 이미 변경 불가능하므로 그대로 둔다.
+
+    ex) [["빠르", [("고", "EC")], None, {...}]]
+        => (("빠르", (("고", "EC"),), None, {...}),)
+    """
+    value_type = type(value)
+    if value_type is list or value_type is tuple:
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def cached_call(owner, key, func, *args):
+    """
+    공용 캐시에 owner 의 key 분석결과가 있으면 리턴하고, 없으면 func(*args) 의 결과를
+    freeze 해서 저장한 후 리턴한다.
+
+    Args :
+        owner : 분석기 객체, class 가 같으면 캐시를 공유한다.
+        key (tuple) : (분석 종류, 어절, 분석결과가 달라지는 옵션...)
+        func : 캐시에 없을 때 호출하는 분석 함수
+    Returns:
+        freeze 된 func(*args) 결과
+    """
+    cache = shared_cache()
+    if cache is None:
+        return freeze(func(*args))
+
+    cache_key = (type(owner).__name__,) + key
+
+    result = cache.get(cache_key, _MISSING)
+    if result is _MISSING:
+        result = freeze(func(*args))
+        cache.put(cache_key, result)
+    return result
@@ -5,6 +5,12 @@
 음절은 한국어에서 한글자를 의미하는 것으로 음절을 음소로 분해하거나
 음소를 다시 음절을 합치는 등의 유틸리티 기능이 있다.
 
+한글 음절(가~힣, 11,172자)의 자소 분해 결과와 자소별 index 는 모듈을 로딩할 때
+미리 table 로 만들어 둔다. 한글 음절이 아닌 경우에는 기존 계산 방법을 그대로 사용한다.
+
+문장 전체를 한번에 자소 index 로 분리하는 parse_eumjeol_array,
+get_jongsung_type_array 는 NumPy 가 필요하다.(선택 사항, 사용할 때 import 한다.)
+
 """
 import traceback
 
@@ -33,6 +39,77 @@ _JONGSUNG_LIST = [u'', u'ㄱ', u'ㄲ', u'ㄳ', u'ㄴ', u'ㄵ', u'ㄶ', u'ㄷ', u
 #: 양성모음
 YANG_VOWEL = [u"ㅏ", u"ㅑ", u"ㅗ", u"ㅛ"]
 
+# #### phoneme 제약 bit
+#: 받침없음
+PHONEME_VO = 1
+#: ㄹ받침
+PHONEME_LQ = 2
+#: ㄹ제외한받침
+PHONEME_FS = 4
+#: 모음이 ㅏ,ㅗ
+PHONEME_YANG1 = 8
+#: 모음이 ㅏ,ㅑ,ㅗ
+PHONEME_YANG2 = 16
+#: 모음이 ㅏ,ㅗ 제외
+PHONEME_EUM1 = 32
+#: 제한없음(NUL)
+PHONEME_ALL = 63
+
+_PHONEME_BIT_LIST = [
+    ("VO", PHONEME_VO), ("LQ", PHONEME_LQ), ("FS", PHONEME_FS),
+    ("YANG1", PHONEME_YANG1), ("YANG2", PHONEME_YANG2),
+    ("EUM1", PHONEME_EUM1)]
+
+# 자소 => index
+_CHOSUNG_INDEX = {jaso: index for index, jaso in enumerate(_CHOSUNG_LIST)}
+_JUNGSUNG_INDEX = {jaso: index for index, jaso in enumerate(_JUNGSUNG_LIST)}
+_JONGSUNG_INDEX = {jaso: index for index, jaso in enumerate(_JONGSUNG_LIST)}
+
+
+def _phoneme_feature(jung, jong):
+    """ 음절의 중성, 종성이 만족하는 phoneme 제약 bit 를 모두 합친다. """
+    if jong == "":
+        feature = PHONEME_VO
+    elif jong == u"ㄹ":
+        feature = PHONEME_LQ
+    else:
+        feature = PHONEME_FS
+    if jung in [u'ㅏ', u'ㅗ']:
+        feature |= PHONEME_YANG1
+    else:
+        feature |= PHONEME_EUM1
+    if jung in [u'ㅏ', u'ㅑ', u'ㅗ']:
+        feature |= PHONEME_YANG2
+    return feature
+
+
+def _build_eumjeol_table():
+    """ {음절: (초성, 중성, 종성)}, {음절: 종성 종류},
+    {음절: phoneme 제약 bit} table 을 만든다. """
+    eumjeol_table = {}
+    jongsung_type_table = {}
+    phoneme_feature_table = {}
+    # _HANGUL_CODE_END 는 마지막 음절(힣)이 아니므로 음절 수로 계산한다.
+    for code in range(_HANGUL_CODE_START, _HANGUL_CODE_START +
+                      _CHOSUNG * _JUNGSUNG * _JONGSUNG):
+        base = code - _HANGUL_CODE_START
+        jaso = (_CHOSUNG_LIST[base // (_JUNGSUNG * _JONGSUNG)],
+                _JUNGSUNG_LIST[base % (_JUNGSUNG * _JONGSUNG) // _JONGSUNG],
+                _JONGSUNG_LIST[base % _JONGSUNG])
+        eumjeol_table[chr(code)] = jaso
+        phoneme_feature_table[chr(code)] = _phoneme_feature(jaso[1], jaso[2])
+        if jaso[2] == "":
+            jongsung_type_table[chr(code)] = JONGSUNG_TYPE_NONE
+        elif jaso[2] == u"ㄹ":
+            jongsung_type_table[chr(code)] = JONGSUNG_TYPE_LIEUL
+        else:
+            jongsung_type_table[chr(code)] = JONGSUNG_TYPE_COMMON
+    return (eumjeol_table, jongsung_type_table, phoneme_feature_table)
+
+
+(_EUMJEOL_TABLE, _JONGSUNG_TYPE_TABLE, _PHONEME_FEATURE_TABLE) =\
+    _build_eumjeol_table()
+
 
 def parse_eumjeol(eumjeol):
     """음절을 자소로 분리함
@@ -44,8 +121,17 @@ def parse_eumjeol(eumjeol):
             cho : 초성
             jung : 중성(모음)
             jong : 종성(받침, 없으면 "")
-            ex) ["ㄱ", "ㅏ", "ㄴ"]
+            ex) ("ㄱ", "ㅏ", "ㄴ")
+            한글 음절이면 미리 만든 table 의 tuple 을 리턴한다.
     """
+    jaso = _EUMJEOL_TABLE.get(eumjeol)
+    if jaso is not None:
+        return jaso
+    return _parse_eumjeol_slow(eumjeol)
+
+
+def _parse_eumjeol_slow(eumjeol):
+    """ table 에 없는 문자의 자소 분리, 기존 계산 방법을 그대로 사용한다. """
     if eumjeol in ["", " "]:
         return [None, None, None]
 
@@ -97,6 +183,9 @@ def get_jongsung_type(eumjeol):
         Ex):
             change_jaso("간", "ㅁ","","") => "만"
     """
+    jongsung_type = _JONGSUNG_TYPE_TABLE.get(eumjeol)
+    if jongsung_type is not None:
+        return jongsung_type
     jong = (parse_eumjeol(eumjeol))[2]
     if jong == "":
         return JONGSUNG_TYPE_NONE
@@ -106,6 +195,11 @@ def get_jongsung_type(eumjeol):
 
 
 def has_jongsung(eumjeol):
+    jongsung_type = _JONGSUNG_TYPE_TABLE.get(eumjeol)
+    if jongsung_type is not None:
+        if jongsung_type == JONGSUNG_TYPE_NONE:
+            return False
+        return JONGSUNG_TYPE_COMMON
     jong = (parse_eumjeol(eumjeol))[2]
     if jong == "":
         return False
@@ -154,7 +248,135 @@ def check_phoneme_restriction(eumjeol, phoneme):
     return False
 
 
+def compile_phoneme(phoneme):
+    """사전의 phoneme 제약 문자열을 bitmask 로 바꿈
+
+        check_phoneme_restriction 과 같이 "NUL" 은 모든 음절을 허용하고,
+        그 외에는 제약 이름(VO, LQ, FS, YANG1, YANG2, EUM1)이 포함되어 있는지로 판단한다.
+
+        Args :
+            phoneme (str) : phoneme 제약, ex) "VO|LQ"
+        Returns:
+            phoneme 제약 bitmask, ex) PHONEME_VO | PHONEME_LQ
+    """
+    if phoneme == "NUL":
+        return PHONEME_ALL
+    phoneme_mask = 0
+    for name, bit in _PHONEME_BIT_LIST:
+        if name in phoneme:
+            phoneme_mask |= bit
+    return phoneme_mask
+
+
+def check_phoneme_mask(eumjeol, phoneme_mask, phoneme):
+    """compile_phoneme 으로 만든 bitmask 로 phoneme 제약을 검사함
+
+        한글 음절이면 미리 만든 음절의 phoneme 제약 bit 와 AND 한 번으로 검사하고,
+        그 외(None 등)에는 check_phoneme_restriction 으로 검사한다.
+
+        Args :
+            eumjeol (str) : 검사하려는 음절
+            phoneme_mask (int) : compile_phoneme(phoneme) 결과
+            phoneme (str) : phoneme 제약 문자열
+        Returns:
+            제약을 만족하면 True
+    """
+    feature = _PHONEME_FEATURE_TABLE.get(eumjeol)
+    if feature is not None:
+        return feature & phoneme_mask != 0
+    return check_phoneme_restriction(eumjeol, phoneme)
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "numpy is required for the eumjeol_util array functions")
+    return numpy
+
+
+def eumjeol_code_array(text):
+    """문자열을 code point 배열로 바꿈
+
+        Args :
+            text (str or array) : 문자열 또는 code point 배열
+        Returns:
+            numpy int32 배열
+    """
+    np = _numpy()
+    if isinstance(text, str):
+        return np.frombuffer(text.encode("utf-32-le"),
+                             dtype=np.uint32).astype(np.int32)
+    return np.asarray(text, dtype=np.int32)
+
+
+def parse_eumjeol_array(text):
+    """문자열의 모든 음절을 NumPy 연산으로 한번에 자소 index 로 분리함
+
+        Args :
+            text (str or array) : 문자열(문장) 또는 code point 배열
+        Returns:
+            ( cho, jung, jong ) numpy int8 배열
+            cho : 초성 index(_CHOSUNG_LIST 순서)
+            jung : 중성 index(_JUNGSUNG_LIST 순서)
+            jong : 종성 index(_JONGSUNG_LIST 순서, 0 은 받침없음)
+            한글 음절이 아닌 문자의 index 는 모두 -1 이다.
+            ex) parse_eumjeol_array("간 a") => ([0, -1, -1], [0, -1, -1],
+                [4, -1, -1])
+    """
+    np = _numpy()
+    base = eumjeol_code_array(text) - _HANGUL_CODE_START
+    valid = (base >= 0) & (base < _CHOSUNG * _JUNGSUNG * _JONGSUNG)
+    base = np.where(valid, base, 0)
+    cho = np.where(valid, base // (_JUNGSUNG * _JONGSUNG), -1)
+    jung = np.where(valid, base % (_JUNGSUNG * _JONGSUNG) // _JONGSUNG, -1)
+    jong = np.where(valid, base % _JONGSUNG, -1)
+    return (cho.astype(np.int8), jung.astype(np.int8), jong.astype(np.int8))
+
+
+def get_jongsung_type_array(text):
+    """문자열의 모든 음절의 종성(받침) 종류를 NumPy 연산으로 한번에 구함
+
+        Args :
+            text (str or array) : 문자열(문장) 또는 code point 배열
+        Returns:
+            | numpy int8 배열
+            | JONGSUNG_TYPE_NONE : 종성이 없음
+            | JONGSUNG_TYPE_LIEUL : ㄹ
+            | JONGSUNG_TYPE_COMMON : ㄹ을 제외한 받침
+            | 0 : 한글 음절이 아님
+    """
+    np = _numpy()
+    (_, _, jong) = parse_eumjeol_array(text)
+    jongsung_type = np.full(jong.shape, JONGSUNG_TYPE_COMMON, dtype=np.int8)
+    jongsung_type[jong == 0] = JONGSUNG_TYPE_NONE
+    jongsung_type[jong == _JONGSUNG_INDEX[u"ㄹ"]] = JONGSUNG_TYPE_LIEUL
+    jongsung_type[jong < 0] = 0
+    return jongsung_type
+
+
 def build_eumjeol(cho, jung, jong):
+    """초성, 중성, 종성을 음절로 합침
+
+        Args :
+            cho : 초성
+            jung : 중성(모음)
+            jong : 종성(받침, 없으면 "")
+        Returns:
+            음절, ex) build_eumjeol("ㄱ", "ㅏ", "ㄴ") => "간"
+    """
+    try:
+        return chr(_HANGUL_CODE_START +
+                   _CHOSUNG_INDEX[cho] * _JUNGSUNG * _JONGSUNG +
+                   _JUNGSUNG_INDEX[jung] * _JONGSUNG +
+                   _JONGSUNG_INDEX[jong])
+    except (KeyError, TypeError):
+        # 잘못된 자소는 기존과 같이 ValueError 를 발생시킨다.
+        return _build_eumjeol_slow(cho, jung, jong)
+
+
+def _build_eumjeol_slow(cho, jung, jong):
     eumjeol = _HANGUL_CODE_START +\
         _CHOSUNG_LIST.index(cho) * _JUNGSUNG * _JONGSUNG
     eumjeol += _JUNGSUNG_LIST.index(jung) * _JONGSUNG
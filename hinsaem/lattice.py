@@ -0,0 +1,381 @@
+"""lattice(어절 형태소 lattice) Module
+
+이 모듈은 어절 하나의 형태소 분석 후보를 lattice 로 만들고, Viterbi 로 점수가 높은
+분석결과 k 개를 찾는 기능을 담당한다.
+
+lattice 의 node 는 (아직 분석하지 않은 앞부분, 다음 형태소 조건) 이고,
+edge 는 앞부분의 뒤에서 떼어낸 형태소이다.
+
+* 시작 node 는 어절 전체(문장기호 제외)이다.
+* 조사, 어미 edge : PosJ.endswithj, PosE.endswithE 의 Candidate 하나가 edge 하나이다.
+  불규칙 활용으로 앞부분이 바뀌어도(ex : 길어 => 긷 + 어) Candidate.left 로 이어진다.
+* 단어 edge : 앞부분의 끝이 체언 사전(PosN0), 수사(PosNR), 형태소 사전에 있는 단어이다.
+  복합명사처럼 앞부분을 여러 단어로 나눌 수 있다.
+* 미등록어 edge : 사전에 없는 앞부분 전체를 NA 로 분석한다.
+  점수는 글자 수에 비례해서 낮아지므로 사전 단어로 나눌 수 있으면 나눈 경로가 점수가 높다.
+* 끝 node 는 앞부분이 없는("") node 이다.
+
+edge 점수는 형태소 정보(meta)의 빈도(spoken 또는 writing, 만분율)의 log 이다.
+경로 점수는 edge 점수의 합이므로 union_meta 로 경로의 meta 를 합친 빈도(독립 확률의 곱)와
+같은 순서가 된다. 빈도가 없는 edge 는 edge 종류별 기본 빈도를 사용한다.
+
+"""
+import math
+import heapq
+import collections
+from .config import CONFIG
+from .pos_util import union_meta, meta_freq
+from .pos_e import PosE
+from .pos_j import PosJ
+from .pos_n0 import PosN0
+from .pos_nr import PosNR
+
+#: edge 종류
+EDGE_EOMI = "E"
+EDGE_JOSA = "J"
+EDGE_NOUN = "N"
+EDGE_NUMERAL = "NR"
+EDGE_WORD = "W"
+EDGE_UNKNOWN = "UNK"
+
+_LatticeEdgeBase = collections.namedtuple(
+    "LatticeEdge", ["source", "target", "postag", "kind", "meta", "score"])
+_LatticePathBase = collections.namedtuple(
+    "LatticePath", ["postag", "score", "meta"])
+
+
+class LatticeEdge(_LatticeEdgeBase):
+    """
+    lattice edge
+
+    Attributes :
+        source : 시작 node
+        target : 끝 node
+        postag (tuple) : ((형태소, pos), ...), ex) (("었", "EP"), ("다", "EF"))
+        kind (str) : edge 종류(EDGE_EOMI, EDGE_JOSA, ...)
+        meta : 형태소 정보, 없으면 None
+        score (float) : edge 점수
+    """
+    __slots__ = ()
+
+
+class LatticePath(_LatticePathBase):
+    """
+    분석결과 하나
+
+    Attributes :
+        postag (tuple) : ((형태소, pos), ...), 어절 순서
+        score (float) : 경로 점수(edge 점수의 합)
+        meta (dict) : union_meta 로 합친 경로의 meta
+    """
+    __slots__ = ()
+
+    def postag_str(self):
+        """ ex) "사람/NNG + 은/JX" """
+        return " + ".join(word + "/" + pos for word, pos in self.postag)
+
+
+class Lattice(object):
+    """
+    형태소 lattice, edge 는 순환하지 않아야 한다.(DAG)
+    """
+
+    def __init__(self, start, end):
+        self.start = start
+        self.end = end
+        # {source: {(target, postag): LatticeEdge}}
+        self._edge_dict = collections.OrderedDict()
+
+    def add_edge(self, source, target, postag, kind, meta, score):
+        """
+        edge 를 추가한다. 같은 (source, target, postag) edge 는 점수가 높은 것 하나만 둔다.
+        """
+        edge_dict = self._edge_dict.setdefault(
+            source, collections.OrderedDict())
+        self._edge_dict.setdefault(target, collections.OrderedDict())
+        key = (target, postag)
+        edge = edge_dict.get(key)
+        if edge is None or edge.score < score:
+            edge_dict[key] = LatticeEdge(
+                source, target, postag, kind, meta, score)
+
+    def edges(self, node=None):
+        """ node 에서 나가는 edge 리스트, node 가 None 이면 모든 edge """
+        if node is not None:
+            return list(self._edge_dict.get(node, {}).values())
+        return [edge for edge_dict in self._edge_dict.values()
+                for edge in edge_dict.values()]
+
+    def nodes(self):
+        """ node 리스트, 위상 정렬 순서 """
+        in_degree = dict.fromkeys(self._edge_dict, 0)
+        for edge in self.edges():
+            in_degree[edge.target] += 1
+        queue = collections.deque(
+            node for node, degree in in_degree.items() if degree == 0)
+        node_list = []
+        while queue:
+            node = queue.popleft()
+            node_list.append(node)
+            for edge in self._edge_dict[node].values():
+                in_degree[edge.target] -= 1
+                if in_degree[edge.target] == 0:
+                    queue.append(edge.target)
+        if len(node_list) != len(in_degree):
+            raise ValueError("lattice has a cycle")
+        return node_list
+
+    def best_paths(self, k=1):
+        """
+        시작 node 에서 끝 node 까지 점수가 높은 경로 k 개를 찾는다.(k-best Viterbi)
+        형태소가 같은 경로는 점수가 높은 것 하나만 리턴한다.
+
+        Returns:
+            [(점수, (LatticeEdge, ...)), ...], 점수가 높은 순서
+        """
+        if k < 1:
+            raise ValueError("k must be >= 1")
+        # {node: [(점수, (LatticeEdge, ...)), ...]}, node 까지의 점수가 높은 경로 k 개
+        best = {self.start: [(0.0, ())]}
+        for node in self.nodes():
+            path_list = best.get(node)
+            if not path_list or node == self.end:
+                continue
+            for edge in self._edge_dict[node].values():
+                target_list = best.setdefault(edge.target, [])
+                for (score, edge_path) in path_list:
+                    target_list.append((score + edge.score,
+                                        edge_path + (edge,)))
+                if len(target_list) > k * 4:
+                    best[edge.target] = self._top_k(target_list, k)
+            # node 로 들어오는 경로는 모두 찾았다.
+            best[node] = self._top_k(path_list, k)
+
+        path_list = best.get(self.end, [])
+        # 형태소가 같은 경로 제거, 형태소가 같아도 edge 가 다를 수 있다.
+        result_list = []
+        postag_set = set()
+        for (score, edge_path) in sorted(
+                path_list, key=lambda item: -item[0]):
+            postag = tuple(pair for edge in edge_path for pair in edge.postag)
+            if postag in postag_set:
+                continue
+            postag_set.add(postag)
+            result_list.append((score, edge_path))
+            if len(result_list) >= k:
+                break
+        return result_list
+
+    @staticmethod
+    def _top_k(path_list, k):
+        return heapq.nlargest(k, path_list, key=lambda item: item[0])
+
+
+def freq_score(meta, default_freq, register="writing"):
+    """
+    edge 점수, 빈도(만분율)의 log
+
+    Args :
+        meta : 형태소 정보(dict, PosInfo), 없으면 None
+        default_freq (float) : meta 에 빈도가 없을 때 사용하는 빈도
+        register (str) : 빈도 종류("spoken" 또는 "writing")
+    """
+    freq = meta_freq(meta, register)
+    if freq <= 0:
+        freq = default_freq
+    return math.log(freq / 10000)
+
+
+class EojeolLattice(object):
+    """
+    어절 lattice 분석기
+
+    PosE, PosJ, PosN0, PosNR 와 형태소 사전(word_dict)으로 어절 lattice 를 만들고
+    점수가 높은 분석결과를 찾는다. 각 분석기는 어절마다 한번만 호출한다.
+    """
+    # 조사 앞에 올 수 있는 형태소
+    NOUN_POS = ["NNG", "NNP", "NNB", "NND", "NNU", "NR", "NP", "XSN", "MAG",
+                "NA"]
+    # 어미 앞에 올 수 있는 형태소
+    STEM_POS = ["VV", "VA", "VX", "VCP", "VCN", "XSV", "XSA", "NA"]
+    # 하나로 어절이 될 수 있는 형태소(체언, 부사, 관형사, 감탄사)
+    SINGLE_POS = ["NNG", "NNP", "NNB", "NND", "NNU", "NR", "NP", "XSN",
+                  "MAG", "MAJ", "MM", "IC", "NA"]
+    # 단어 edge 로 만들지 않는 형태소(조사, 어미는 PosJ, PosE 로 찾는다.)
+    EXCLUDE_POS = ["JKS", "JKC", "JKG", "JKO", "JKB", "JKV", "JKQ", "JC",
+                   "JX", "EP", "EC", "EF", "ETN", "ETM"]
+    # 체언 사전 key 별 pos, 사전 pos 가 NOUN_POS 에 없으면 사용한다.
+    # N_.tsv 는 접사(XPN, XSN)도 있어서 사전 pos 를 그대로 사용한다.
+    _NOUN_DICT_POS = [("_nng", "NNG"), ("_nnp", "NNP"), ("_n_else", None)]
+
+    # edge 종류별 기본 빈도(만분율), meta 에 빈도가 없을 때 사용한다.
+    # 미등록어는 글자 하나의 빈도이다.
+    DEFAULT_FREQ = {EDGE_EOMI: 100.0, EDGE_JOSA: 100.0, EDGE_NOUN: 100.0,
+                    EDGE_WORD: 100.0, EDGE_NUMERAL: 50.0, EDGE_UNKNOWN: 1.0}
+
+    # node 의 다음 형태소 조건
+    _NEED_START = "START"
+    _NEED_NOUN = "N"
+    _NEED_STEM = "V"
+
+    def __init__(self, word_dict=None, register=None):
+        """
+        Args :
+            word_dict : 형태소 사전 {단어: [pos, ...]}(Hinsaem._word_dict),
+                None 이면 체언, 수사 사전만 사용한다.
+            register (str) : 점수에 사용할 빈도("spoken" 또는 "writing"),
+                None 이면 CONFIG["freq_register"]
+        """
+        self.word_dict = word_dict if word_dict is not None else {}
+        if register is None:
+            register = CONFIG.get("freq_register", "writing")
+        self.register = register
+        self._pos_e = PosE()
+        self._pos_j = PosJ()
+        self._pos_n0 = PosN0()
+        self._pos_nr = PosNR()
+        self._need_pos = {self._NEED_START: frozenset(self.SINGLE_POS),
+                          self._NEED_NOUN: frozenset(self.NOUN_POS),
+                          self._NEED_STEM: frozenset(self.STEM_POS)}
+
+    def analyze(self, eojeol, k=1):
+        """
+        어절을 분석해서 점수가 높은 분석결과 k 개를 리턴한다.
+
+        Args :
+            eojeol (str) : 어절
+            k (int) : 분석결과 수
+        Returns:
+            [LatticePath, ...], 점수가 높은 순서, 분석할 수 없으면 []
+            ex) self.analyze("사람은") => [LatticePath(postag=(("사람", "NNG"),
+                ("은", "JX")), score=-18.4, meta={})]
+        """
+        (text, mark) = self._split_mark(eojeol)
+        if text == "":
+            return []
+        lattice = self.build(eojeol)
+        mark_postag = ()
+        if mark is not None:
+            mark_pos = "SF" if mark in CONFIG["sentence_end_mark"] else "SP"
+            mark_postag = ((mark, mark_pos),)
+
+        path_list = []
+        for (score, edge_path) in lattice.best_paths(k):
+            # 뒤에서부터 떼어낸 형태소이므로 어절 순서로 바꾼다.
+            postag = tuple(pair for edge in reversed(edge_path)
+                           for pair in edge.postag)
+            meta = {}
+            for index, edge in enumerate(edge_path):
+                edge_meta = edge.meta if edge.meta is not None else {}
+                meta = edge_meta if index == 0 else union_meta(meta, edge_meta)
+            path_list.append(LatticePath(postag + mark_postag, score,
+                                         dict(meta)))
+        return path_list
+
+    def build(self, eojeol):
+        """
+        어절 lattice 를 만든다.
+
+        Returns:
+            Lattice, node 는 (앞부분, 다음 형태소 조건)
+        """
+        (text, _) = self._split_mark(eojeol)
+        start = (text, self._NEED_START)
+        end = ("", None)
+        lattice = Lattice(start, end)
+        default_freq = self.DEFAULT_FREQ
+        register = self.register
+
+        # 조사, 어미 edge, 두 분석기는 한글이 아닌 글자를 처리하지 못한다.
+        node_list = [start]
+        if all(u"가" <= char <= u"힣" for char in text):
+            for (kind, need, candidate_list) in [
+                    (EDGE_JOSA, self._NEED_NOUN,
+                     self._pos_j.endswithj(eojeol)),
+                    (EDGE_EOMI, self._NEED_STEM,
+                     self._pos_e.endswithE(eojeol))]:
+                for candidate in candidate_list or []:
+                    # 조사, 어미만으로 된 어절은 없다.
+                    if candidate.left == "":
+                        continue
+                    target = (candidate.left, need)
+                    lattice.add_edge(
+                        start, target, tuple(candidate.postag), kind,
+                        candidate.meta, freq_score(
+                            candidate.meta, default_freq[kind], register))
+                    node_list.append(target)
+
+        # 단어, 미등록어 edge, 앞부분이 짧아지므로 순환하지 않는다.
+        word_edge_dict = {}
+        visited = set()
+        while node_list:
+            node = node_list.pop()
+            if node in visited:
+                continue
+            visited.add(node)
+            (left, need) = node
+            need_pos = self._need_pos.get(need)
+            for (index, word, pos, kind, meta) in self._word_edges(
+                    left, word_edge_dict):
+                if need_pos is not None and pos not in need_pos:
+                    continue
+                target = (left[:index], None) if index > 0 else end
+                lattice.add_edge(node, target, ((word, pos),), kind, meta,
+                                 freq_score(meta, default_freq[kind],
+                                            register))
+                if target != end:
+                    node_list.append(target)
+            lattice.add_edge(
+                node, end, ((left, "NA"),), EDGE_UNKNOWN, None,
+                freq_score(None, default_freq[EDGE_UNKNOWN], register) *
+                len(left))
+        return lattice
+
+    def _word_edges(self, left, word_edge_dict):
+        """
+        앞부분의 끝에 있는 사전 단어, 같은 어절 안에서는 다시 찾지 않는다.
+
+        Returns:
+            [(index, 단어, pos, edge 종류, meta), ...], 단어는 left[index:]
+        """
+        edge_list = word_edge_dict.get(left)
+        if edge_list is not None:
+            return edge_list
+        edge_list = []
+        exclude_pos = self.EXCLUDE_POS
+        noun_pos = self.NOUN_POS
+        for index in range(len(left) - 1, -1, -1):
+            word = left[index:]
+            pos_set = set()
+            for (table_name, table_pos) in self._NOUN_DICT_POS:
+                for posinfo in getattr(self._pos_n0, table_name).get(
+                        word, ()):
+                    pos = posinfo["pos"]
+                    if table_pos is not None and pos not in noun_pos:
+                        pos = table_pos
+                    if pos not in pos_set:
+                        pos_set.add(pos)
+                        edge_list.append(
+                            (index, word, pos, EDGE_NOUN, posinfo))
+            if "NR" not in pos_set and (
+                    word in self._pos_nr._nr_multi_dict or
+                    (u"가" <= word[:1] <= u"힣" and
+                     self._pos_nr.check(word))):
+                pos_set.add("NR")
+                edge_list.append((index, word, "NR", EDGE_NUMERAL, None))
+            for pos in self.word_dict.get(word, ()):
+                if pos in exclude_pos or pos in pos_set:
+                    continue
+                pos_set.add(pos)
+                edge_list.append((index, word, pos, EDGE_WORD, None))
+        word_edge_dict[left] = edge_list
+        return edge_list
+
+    @staticmethod
+    def _split_mark(eojeol):
+        """ (문장기호를 뺀 어절, 문장기호), 문장기호가 없으면 None """
+        if len(eojeol) > 1 and eojeol[-1] in CONFIG["sentence_mark"]:
+            return (eojeol[:-1], eojeol[-1])
+        if eojeol in CONFIG["sentence_mark"]:
+            return ("", eojeol)
+        return (eojeol, None)
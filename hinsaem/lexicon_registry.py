@@ -0,0 +1,207 @@
+"""lexicon_registry(프로세스 공용 사전 등록소) Module
+
+이 모듈은 분석기(PosE, PosJ, PosN, PosN0, PosNR, Hinsaem)가 사용하는 사전을
+프로세스 하나에 한번만 로딩하고, 모든 분석기 객체가 같은 사전을 공유하도록 하는 기능을 담당한다.
+
+* 사전은 (사전 이름, 원본 사전 경로, lexicon_backend) 로 등록한다.
+* 처음 로딩할 때 원본 사전 내용의 sha1 해시를 계산해 두고, 경로가 달라도 내용이 같으면
+  같은 사전을 공유한다.
+* 공유하는 사전은 변경할 수 없다. dict 는 MappingProxyType, set 은 frozenset,
+  dict 의 list 값은 tuple 로 바꾼다.
+* 사전 파일을 고친 후 reload() 를 호출하면 내용이 바뀐 사전을 버리고, 분석기들은
+  다음 조회 때 새 사전을 로딩한다.
+
+사전을 사용하는 class 는 SharedTableOwner 를 상속하고, 사전 속성을 SharedTable 로
+선언하고, _readDict() 에서 get_tables() 로 사전을 받는다.
+
+여러 thread 에서 같은 분석기 객체를 처음 조회해도 사전은 한번만 로딩하고(_lock),
+모든 thread 가 같은 변경할 수 없는 사전을 받는다.
+
+"""
+import hashlib
+import logging
+import threading
+import weakref
+from types import MappingProxyType
+from . import dict_cache
+from . import eojeol_cache
+
+logger = logging.getLogger(__name__)
+
+# {(사전 이름, 원본 사전 경로, lexicon_backend): [내용 해시, tables]}
+_entries = {}
+# {(사전 이름, lexicon_backend, 내용 해시): tables}
+_tables_by_digest = {}
+# 사전을 로딩한 분석기 객체, reload() 때 로딩한 사전을 버리게 한다.
+_owners = weakref.WeakSet()
+# 다른 사전을 이용해서 만드는 사전(ex : PosN => E.tsv)이 있어서 RLock 을 사용한다.
+_lock = threading.RLock()
+
+
+def _path_key(file_paths):
+    if isinstance(file_paths, str):
+        return file_paths
+    return tuple(file_paths)
+
+
+def content_digest(file_paths):
+    """
+    원본 사전 파일 내용의 해시, 파일이 없으면 None
+
+    Args :
+        file_paths (str or list) : 원본 사전 파일 경로
+    """
+    try:
+        signature = dict_cache.source_signature(file_paths)
+    except OSError:
+        return None
+    sha1 = hashlib.sha1()
+    for (_, _, _, file_sha1) in signature:
+        sha1.update(file_sha1.encode("ascii"))
+    return sha1.hexdigest()
+
+
+def freeze_tables(tables):
+    """
+    로딩한 사전을 변경할 수 없게 바꾼다.
+    dict 의 list 값은 새로 만들지 않고 그 자리에서 tuple 로 바꾼다.
+
+    Args :
+        tables (dict) : {"KEY": table, ...}
+    Returns:
+        MappingProxyType({"KEY": 변경할 수 없는 table, ...})
+    """
+    frozen = {}
+    for key, table in tables.items():
+        if isinstance(table, dict):
+            for word, value in table.items():
+                if type(value) is list:
+                    table[word] = tuple(value)
+            table = MappingProxyType(table)
+        elif isinstance(table, (set, frozenset)):
+            table = frozenset(table)
+        frozen[key] = table
+    return MappingProxyType(frozen)
+
+
+def get_tables(name, file_paths, load_func, backend="dict"):
+    """
+    공용 사전을 리턴한다. 처음이면 load_func() 로 로딩해서 등록한다.
+
+    Args :
+        name (str) : 사전 이름(ex : "E", "J", "N0")
+        file_paths (str or list) : 원본 사전 파일 경로
+        load_func : 사전을 로딩하는 함수, {"KEY": table, ...} 를 리턴한다.
+        backend (str) : lexicon_backend("dict" 또는 "mmap")
+    Returns:
+        변경할 수 없는 {"KEY": table, ...}
+    """
+    key = (name, _path_key(file_paths), backend)
+    entry = _entries.get(key)
+    if entry is not None:
+        return entry[1]
+
+    with _lock:
+        entry = _entries.get(key)
+        if entry is not None:
+            return entry[1]
+
+        digest = content_digest(file_paths)
+        tables = None
+        if digest is not None:
+            tables = _tables_by_digest.get((name, backend, digest))
+        if tables is None:
+            tables = freeze_tables(load_func())
+            if digest is not None:
+                _tables_by_digest[(name, backend, digest)] = tables
+        _entries[key] = [digest, tables]
+        return tables
+
+
+def reload(force=False):
+    """
+    원본 사전 내용이 바뀐 사전을 버린다. 사전을 사용하던 분석기는 다음 조회 때
+    바뀐 사전을 새로 로딩한다. 어절 분석결과 캐시(eojeol_cache)도 비운다.
+
+    분석중인 다른 thread 가 있으면 그 분석은 이전 사전으로 끝난다.
+
+    Args :
+        force (bool) : True 이면 내용이 바뀌지 않은 사전도 모두 버린다.
+    Returns:
+        버린 사전의 (사전 이름, 원본 사전 경로, lexicon_backend) 리스트
+    """
+    with _lock:
+        dropped_list = []
+        for key, (digest, _) in list(_entries.items()):
+            if force or content_digest(key[1]) != digest:
+                del _entries[key]
+                dropped_list.append(key)
+
+        used_set = set(id(tables) for (_, tables) in _entries.values())
+        for digest_key, tables in list(_tables_by_digest.items()):
+            if id(tables) not in used_set:
+                del _tables_by_digest[digest_key]
+
+        for owner in list(_owners):
+            owner._drop_tables()
+        eojeol_cache.reset()
+
+    if dropped_list:
+        logger.info("lexicon reload : %s", dropped_list)
+    return dropped_list
+
+
+def registered():
+    """ 등록된 사전 key 리스트 """
+    with _lock:
+        return list(_entries)
+
+
+class SharedTable(object):
+    """
+    처음 사용할 때 사전을 로딩하는 분석기 속성
+
+    분석기의 _tables()["key"] 값을 돌려주고, 객체 속성으로 저장해 두어서
+    두번째 부터는 일반 속성처럼 바로 읽는다.
+    """
+
+    def __init__(self, key):
+        self.key = key
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        value = obj._tables()[self.key]
+        obj.__dict__[self.name] = value
+        return value
+
+
+class SharedTableOwner(object):
+    """
+    SharedTable 속성을 가진 분석기의 기본 class
+
+    하위 class 는 _readDict() 에서 get_tables() 의 결과를 리턴한다.
+    """
+
+    def _tables(self):
+        """ 사전 table dict, 처음 호출할 때 _readDict 로 로딩한다. """
+        tables = self.__dict__.get("_table_dict")
+        if tables is None:
+            tables = self._readDict()
+            self._table_dict = tables
+            # WeakSet 은 thread 에 안전하지 않다.
+            with _lock:
+                _owners.add(self)
+        return tables
+
+    def _drop_tables(self):
+        """ 로딩한 사전을 버린다. 다음 조회 때 다시 로딩한다. """
+        self.__dict__.pop("_table_dict", None)
+        for cls in type(self).__mro__:
+            for name, value in vars(cls).items():
+                if isinstance(value, SharedTable):
+                    self.__dict__.pop(name, None)
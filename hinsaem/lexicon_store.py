@@ -0,0 +1,260 @@
+"""lexicon_store(mmap 사전 저장소) Module
+
+이 모듈은 {단어: [posinfo, ...]} 형태의 큰 사전을 읽기 전용 mmap 파일로 저장하고
+조회하는 기능을 담당한다.
+
+여러 분석 프로세스를 띄우는 경우 각 프로세스가 사전마다 Python dict 를 만들면
+메모리 사용량이 프로세스 수 만큼 늘어난다. mmap 파일을 사용하면 모든 프로세스가
+같은 물리 페이지(OS 페이지 캐시)를 공유하고, 조회한 단어의 posinfo 만 Python 객체로
+만든다.
+
+파일 구조(little endian)::
+
+    magic(4byte, "HSLX")
+    header_len(uint32) + header(json)
+    index : count * (key_offset, key_length, value_offset, value_length) uint32
+    key 영역 : utf-8 로 인코딩된 단어, 바이트 순서로 정렬
+    value 영역 : pickle 로 직렬화된 posinfo 리스트
+
+header 에는 파일 형식 버전, 항목 수, 원본 사전의 서명 정보(dict_cache.source_signature)가
+들어 있다. 원본 사전이 바뀌면 mmap 파일을 다시 만든다.
+
+"""
+import os
+import json
+import mmap
+import pickle
+import struct
+import logging
+from .config import CONFIG
+from . import dict_cache
+
+logger = logging.getLogger(__name__)
+
+#: mmap 파일 형식 버전
+LEXICON_STORE_VERSION = 1
+
+_MAGIC = b"HSLX"
+_UINT32 = struct.Struct("<I")
+_INDEX_ITEM = struct.Struct("<IIII")
+_LEXICON_EXT = ".lex"
+
+
+class MmapLexicon(object):
+    """mmap 파일을 이용한 읽기 전용 사전
+
+    dict 와 같은 방법으로 조회한다.
+    (in, [], get, len, iter, keys, items)
+    """
+
+    def __init__(self, file_path):
+        self._file_path = file_path
+        self._open()
+
+    def _open(self):
+        with open(self._file_path, "rb") as fp:
+            self._mm = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mm[:4] != _MAGIC:
+            raise ValueError("invalid lexicon file : %s" % self._file_path)
+        (header_len,) = _UINT32.unpack_from(self._mm, 4)
+        header_start = 4 + _UINT32.size
+        self.header = json.loads(
+            self._mm[header_start:header_start + header_len].decode("utf-8"))
+        self._count = self.header["count"]
+        self._index_start = header_start + header_len
+        self._key_start = self._index_start + _INDEX_ITEM.size * self._count
+        self._value_start = self._key_start + self.header["key_size"]
+
+    # 다른 프로세스에 전달할 때는 파일 경로만 넘기고 다시 mmap 한다.
+    def __getstate__(self):
+        return {"_file_path": self._file_path}
+
+    def __setstate__(self, state):
+        self._file_path = state["_file_path"]
+        self._open()
+
+    def _index_item(self, pos):
+        return _INDEX_ITEM.unpack_from(
+            self._mm, self._index_start + _INDEX_ITEM.size * pos)
+
+    def _key_bytes(self, index_item):
+        start = self._key_start + index_item[0]
+        return self._mm[start:start + index_item[1]]
+
+    def _find(self, word):
+        """ 이진 탐색으로 단어의 index 항목을 찾는다. 없으면 None """
+        key = word.encode("utf-8")
+        low = 0
+        high = self._count
+        while low < high:
+            mid = (low + high) // 2
+            index_item = self._index_item(mid)
+            mid_key = self._key_bytes(index_item)
+            if mid_key < key:
+                low = mid + 1
+            elif mid_key > key:
+                high = mid
+            else:
+                return index_item
+        return None
+
+    def _value(self, index_item):
+        start = self._value_start + index_item[2]
+        return pickle.loads(self._mm[start:start + index_item[3]])
+
+    def __contains__(self, word):
+        return self._find(word) is not None
+
+    def __getitem__(self, word):
+        index_item = self._find(word)
+        if index_item is None:
+            raise KeyError(word)
+        return self._value(index_item)
+
+    def get(self, word, default=None):
+        index_item = self._find(word)
+        if index_item is None:
+            return default
+        return self._value(index_item)
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        for pos in range(self._count):
+            yield self._key_bytes(self._index_item(pos)).decode("utf-8")
+
+    def keys(self):
+        return iter(self)
+
+    def items(self):
+        for pos in range(self._count):
+            index_item = self._index_item(pos)
+            yield (self._key_bytes(index_item).decode("utf-8"),
+                   self._value(index_item))
+
+    def close(self):
+        self._mm.close()
+
+
+def build_lexicon(file_path, word_dict, sources=None):
+    """{단어: 값} 사전을 mmap 파일로 저장한다.
+
+    Args :
+        file_path (str) : 저장하려는 mmap 파일 경로
+        word_dict (dict) : {단어: 값} 형태의 사전
+        sources : 원본 사전의 서명 정보(dict_cache.source_signature)
+    """
+    key_blob = bytearray()
+    value_blob = bytearray()
+    index_blob = bytearray()
+    key_list = sorted(word.encode("utf-8") for word in word_dict)
+    for key in key_list:
+        value = pickle.dumps(word_dict[key.decode("utf-8")],
+                             pickle.HIGHEST_PROTOCOL)
+        index_blob += _INDEX_ITEM.pack(
+            len(key_blob), len(key), len(value_blob), len(value))
+        key_blob += key
+        value_blob += value
+
+    header = json.dumps({
+        "version": LEXICON_STORE_VERSION, "count": len(key_list),
+        "key_size": len(key_blob), "sources": sources or []},
+        ensure_ascii=False).encode("utf-8")
+
+    tmp_path = "%s.%d.tmp" % (file_path, os.getpid())
+    try:
+        with open(tmp_path, "wb") as fp:
+            fp.write(_MAGIC)
+            fp.write(_UINT32.pack(len(header)))
+            fp.write(header)
+            fp.write(index_blob)
+            fp.write(key_blob)
+            fp.write(value_blob)
+        # 이미 mmap 으로 열려 있는 파일은 그대로 두고 새 파일로 교체한다.
+        os.replace(tmp_path, file_path)
+    except Exception:
+        # 디스크 부족 등으로 저장하지 못하면 임시 파일을 남기지 않는다.
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _lexicon_path(name, key):
+    return os.path.join(CONFIG["res_dict_cache"],
+                        "%s.%s%s" % (name, key, _LEXICON_EXT))
+
+
+def _open_lexicon(file_path, file_paths):
+    """ 유효한 mmap 파일이면 MmapLexicon 을, 아니면 None 을 리턴한다. """
+    if not os.path.exists(file_path):
+        return None
+    try:
+        lexicon = MmapLexicon(file_path)
+    except (ValueError, OSError):
+        return None
+    if lexicon.header.get("version") != LEXICON_STORE_VERSION or\
+            not dict_cache.is_fresh(lexicon.header["sources"], file_paths):
+        lexicon.close()
+        return None
+    return lexicon
+
+
+def load_tables(name, file_paths, read_func, lexicon_keys, trie_keys=None):
+    """사전 로딩 결과 중 lexicon_keys 에 해당하는 사전은 mmap 으로, 나머지는
+    사전 캐시로 로딩한다.
+
+    trie_keys 의 SuffixTrie 는 단어만 사전 캐시에 저장하고(keys_only),
+    값은 mmap 사전에서 읽도록 bind 한다.
+
+    Args :
+        name (str) : 캐시 이름
+        file_paths (str or list) : 원본 사전 파일 경로
+        read_func : 원본 사전을 읽는 함수, read_func(file_paths) 형태로 호출한다.
+            결과는 {"KEY": table, ...} 형태의 dict 이어야 한다.
+        lexicon_keys (list) : mmap 으로 저장할 사전의 key
+        trie_keys (dict) : {SuffixTrie 의 key: 값을 읽을 lexicon_keys 의 key}
+            (ex : {"EOMI_TRIE": "EOMI"})
+    Returns:
+        {"KEY": table, ...}, lexicon_keys 의 table 은 MmapLexicon
+    """
+    rest_name = name + ".REST"
+    tables = dict_cache.read_cache(rest_name, file_paths)
+    if tables is not None:
+        for key in lexicon_keys:
+            lexicon = _open_lexicon(_lexicon_path(name, key), file_paths)
+            if lexicon is None:
+                tables = None
+                break
+            tables[key] = lexicon
+    if tables is not None:
+        return _bind_tries(tables, trie_keys)
+
+    data = read_func(file_paths)
+    try:
+        os.makedirs(CONFIG["res_dict_cache"], exist_ok=True)
+        sources = dict_cache.source_signature(file_paths)
+        for key in lexicon_keys:
+            build_lexicon(_lexicon_path(name, key), data[key], sources)
+    except OSError:
+        # mmap 파일을 만들 수 없으면 메모리의 사전을 그대로 사용한다.
+        logger.warning("lexicon store write fail : %s", name)
+        return data
+
+    tables = {}
+    for key, value in data.items():
+        if key in (trie_keys or {}):
+            tables[key] = value.keys_only()
+        elif key not in lexicon_keys:
+            tables[key] = value
+    dict_cache.write_cache(rest_name, file_paths, tables)
+    for key in lexicon_keys:
+        tables[key] = MmapLexicon(_lexicon_path(name, key))
+    return _bind_tries(tables, trie_keys)
+
+
+def _bind_tries(tables, trie_keys):
+    """ keys_only SuffixTrie 가 mmap 사전에서 값을 읽도록 한다. """
+    for trie_key, lexicon_key in (trie_keys or {}).items():
+        tables[trie_key].bind(tables[lexicon_key])
+    return tables
@@ -34,20 +34,36 @@ Todo:
 
 
 """
+import sys
 import csv
+import time
+import itertools
+import threading
 import traceback
 import logging
+import collections
+import multiprocessing as mp
+from concurrent.futures import ThreadPoolExecutor
 from .config import CONFIG
+from . import dict_cache
+from . import eojeol_cache
+from .lattice import EojeolLattice
+from .lexicon_registry import SharedTable, SharedTableOwner, get_tables
 from .eumjeol_util import has_jongsung, parse_eumjeol, build_eumjeol
 
 logger = logging.getLogger(__name__)
 
+# analyze_many 의 worker 프로세스마다 한번만 만드는 분석기
+_worker_hinsaem = None
 
-class Hinsaem(object):
+
+class Hinsaem(SharedTableOwner):
     """형태소 분석 기본 Class
 
     자동으로 사전정보 로딩
     어절별 형태소 분석
+
+    객체 하나를 여러 thread 에서 같이 사용할 수 있다.(pos_base 의 Thread 안전성 참고)
     """
     GROUP_N = ["NNG", "NNP", "NNB", "NR", "NP"]     # 체언
     GROUP_MA = ["MAG", "MAJ"]   # 부사
@@ -85,21 +101,29 @@ class Hinsaem(object):
     # 문장기호
     SENTENSE_MARK = [",", ".", "!", "?"]
 
-    def __init__(self):
-        json_info = self._readDict()
-        self._word_dict = json_info["ALL"]
-        self._josa_set = json_info["JOSA"]
-        self._josa_last = json_info["JOSA_LAST"]
-        self._eomi_set = json_info["EOMI"]
-        self._eomi_last = json_info["EOMI_LAST"]
+    # 형태소 사전, 처음 조회할 때 로딩하고 모든 Hinsaem 객체가 공유한다.
+    _word_dict = SharedTable("ALL")
+    _josa_set = SharedTable("JOSA")
+    _josa_last = SharedTable("JOSA_LAST")
+    _eomi_set = SharedTable("EOMI")
+    _eomi_last = SharedTable("EOMI_LAST")
+
+    # 어절 lattice 분석기를 thread 마다 따로 만들지 않도록 한다.
+    _lattice_lock = threading.Lock()
 
     def _readDict(self):
+        """형태소 사전을 로딩한다. 유효한 캐시가 있으면 캐시를 읽는다."""
+        file_path = CONFIG["res_dict_01"]
+        return get_tables(
+            "MAIN", file_path,
+            lambda: dict_cache.load_dict("MAIN", file_path, self._readTsv))
+
+    def _readTsv(self, file_path0):
         multi_dict = {}
         josa_set = set({})
         josa_last = set({})
         eomi_set = set({})
         eomi_last = set({})
-        file_path0 = CONFIG["res_dict_01"]
         with open(file_path0, 'r', encoding='UTF-8', newline='') as csvfile:
             next(csvfile, None)
             for line in csv.reader(
@@ -133,7 +157,7 @@ class Hinsaem(object):
         return config_dict
 
     def _parse_sen(self, sen):
-        """문장을 어절로 나눔
+        """문장을 어절로 나눔, 어절 분석결과는 eojeol_cache 에 저장해 두고 다시 사용한다.
 
         Args:
             sen (str): 문장
@@ -142,11 +166,131 @@ class Hinsaem(object):
             List[str,str,...] : 어절 리스트
         """
         word_list = []
+        # 분석결과가 달라지는 설정은 캐시 key 에 넣는다.
+        analyzer = (CONFIG.get("eojeol_analyzer", "first"),
+                    CONFIG.get("lattice_k", 1),
+                    CONFIG.get("freq_register", "writing"))
         for eojeol in sen.split(" "):
-            pos_info = self._parse_eojeol(eojeol)
+            pos_info = eojeol_cache.cached_call(
+                self, ("MAIN", eojeol, analyzer), self._parse_eojeol, eojeol)
             word_list.append(pos_info)
         return word_list
 
+    def analyze_many(self, sentences, workers=None, chunksize=64,
+                     report=False, mode=None):
+        """여러 문장을 형태소 분석한다.
+
+        workers 가 2 이상이면 문장을 chunk 단위로 나누어 여러 worker 에서 분석한다.
+        결과는 입력 순서대로 돌려준다.
+
+        * "process" : multiprocessing Pool, worker 프로세스는 initializer 에서
+          사전을 한번만 로딩하고, self 를 pickle 해서 넘기지 않는다.
+        * "thread" : ThreadPoolExecutor, 모든 thread 가 self 와 사전을 같이 사용하고
+          결과를 pickle 하지 않는다. GIL 이 있으면 분석은 동시에 하나의 thread 만
+          실행되고, free-threaded CPython(python3.13t 등)에서는 CPU 수 만큼 빨라진다.
+
+        Args:
+            sentences (iterable) : 문장 iterable, 전체를 한번에 읽지 않고
+                처리중인 chunk 수 만큼만 미리 읽는다.
+            workers (int or "auto") : worker 프로세스 수,
+                None 이면 CONFIG["multiprocess_count"], "auto" 이면 CPU 수,
+                1 이하이면 현재 프로세스에서 분석한다.
+            chunksize (int) : worker 에 한번에 넘기는 문장 수
+            report (bool) : True 이면 chunk 마다 (결과 리스트, chunk_info) 를
+                돌려준다.
+            mode (str) : "process", "thread" 또는 "auto"(GIL 이 없으면 "thread",
+                있으면 "process"), None 이면 CONFIG["analyze_many_mode"]
+
+        Returns:
+            (generator) 문장마다 _parse_sen 의 결과
+            report 가 True 이면 chunk 마다 (결과 리스트, chunk_info)
+            chunk_info : {"chunk": chunk 번호, "sentences": 문장 수,
+                "eojeols": 어절 수, "elapsed": 분석시간(초),
+                "sen_per_sec": 초당 문장 수, "eojeol_per_sec": 초당 어절 수}
+        """
+        if workers is None:
+            workers = CONFIG["multiprocess_count"]
+        if workers == "auto":
+            workers = mp.cpu_count()
+        if chunksize < 1:
+            raise ValueError("chunksize must be >= 1")
+        if mode is None:
+            mode = CONFIG.get("analyze_many_mode", "process")
+        if mode == "auto":
+            mode = "process" if _gil_enabled() else "thread"
+        if mode not in ("process", "thread"):
+            raise ValueError("unknown analyze_many mode : %s" % mode)
+        # generator 가 아닌 함수에서 인자를 검사해야 호출할 때 바로 오류가 난다.
+        return self._analyze_many(sentences, workers, chunksize, report, mode)
+
+    def _analyze_many(self, sentences, workers, chunksize, report, mode):
+        """ 인자 검사가 끝난 analyze_many 의 generator """
+        chunk_iter = _iter_chunk(sentences, chunksize)
+        if workers <= 1:
+            for chunk in chunk_iter:
+                yield from _chunk_output(
+                    _analyze_chunk_with(self, chunk), report)
+            return
+
+        max_pending = workers * 2
+        if mode == "thread":
+            # 첫 chunk 들이 사전 로딩을 기다리지 않도록 미리 로딩한다.
+            self._tables()
+            with ThreadPoolExecutor(workers) as executor:
+                yield from _ordered_output(
+                    chunk_iter,
+                    lambda chunk: executor.submit(
+                        _analyze_chunk_with, self, chunk).result,
+                    max_pending, report)
+            return
+
+        with mp.Pool(workers, initializer=_init_worker,
+                     initargs=(type(self), dict(CONFIG))) as pool:
+            yield from _ordered_output(
+                chunk_iter,
+                lambda chunk: pool.apply_async(_analyze_chunk, (chunk,)).get,
+                max_pending, report)
+
+    def analyze_eojeol(self, eojeol, k=None):
+        """어절 lattice 를 만들어 점수가 높은 분석결과 k 개를 찾는다.
+
+        체언, 수사, 조사, 어미 분석기를 어절마다 한번만 호출하고,
+        Viterbi 로 모든 분석 후보 중 점수가 높은 것을 고른다.
+        분석결과는 eojeol_cache 에 (어절, k, 빈도 종류)로 저장해 두고 다시 사용한다.
+
+        Args:
+            eojeol (str) : 어절
+            k (int) : 분석결과 수, None 이면 CONFIG["lattice_k"]
+            점수에 사용하는 빈도 종류는 CONFIG["freq_register"] 이다.
+
+        Returns:
+            (LatticePath, ...), 점수가 높은 순서
+            self.analyze_eojeol("사람은")[0].postag_str()
+            => "사람/NNG + 은/JX"
+        """
+        if k is None:
+            k = CONFIG.get("lattice_k", 1)
+        register = CONFIG.get("freq_register", "writing")
+        return eojeol_cache.cached_call(
+            self, ("LATTICE", eojeol, k, register),
+            self._analyze_eojeol_lattice, eojeol, k, register)
+
+    def _analyze_eojeol_lattice(self, eojeol, k, register):
+        # 사전을 다시 로딩(reload)하거나 빈도 종류가 바뀌면 lattice 분석기도 다시 만든다.
+        word_dict = self._word_dict
+
+        def is_stale(lattice):
+            return (lattice is None or lattice.word_dict is not word_dict or
+                    lattice.register != register)
+        lattice = self.__dict__.get("_lattice")
+        if is_stale(lattice):
+            with self._lattice_lock:
+                lattice = self.__dict__.get("_lattice")
+                if is_stale(lattice):
+                    lattice = self._lattice = EojeolLattice(
+                        word_dict, register)
+        return lattice.analyze(eojeol, k)
+
     # todo : 동일한 형태소가 여러개 인 경우, 후보군 생성 필요함
     def _parse_eojeol(self, eojeol):
         """어절을 형태소 단위로 나눔, 후보가 여러가 일 때, 리스트로 전달함
@@ -161,6 +305,15 @@ class Hinsaem(object):
             self._parse_eojeol("나는")
             => ["나/NP + 는/JX", "나/VV + 는/ETD"]
         """
+        # 문장기호만 있는 어절은 분석하지 않는다.
+        if eojeol in self.SENTENSE_MARK:
+            return []
+
+        # lattice 분석기, CONFIG["eojeol_analyzer"] 가 "lattice" 인 경우
+        if CONFIG.get("eojeol_analyzer", "first") == "lattice":
+            return [path.postag_str()
+                    for path in self.analyze_eojeol(eojeol)]
+
         word_dict = self._word_dict
 
         # 단일어 검사(체언, 부사, 관형사, 감탄사 검사)
@@ -170,14 +323,52 @@ class Hinsaem(object):
             if union_set != {}:
                 return [eojeol, list(union_set)[0]]
 
-        [josa_check, josa] = self._check_josa_in_eojeol(eojeol)
-        if josa_check:
+        josa = self._check_josa_in_eojeol(eojeol)
+        if josa is not None:
             return josa
 
         # 어미검사
-        [eomi_check, eomi] = self._check_eomi_in_eojeol(eojeol)
+        eomi = self._check_eomi_in_eojeol(eojeol)
+        if eomi is not None and eomi[0] is not False:
+            return eomi
         return []
 
+    def _check_josa_in_eojeol(self, eojeol):
+        """
+        조사로 종결하는지 검사하고, 조사와 그 외로 구별함
+
+        Arg :
+            eojeol : 어절
+        Returns:
+            List[ left_word, word, mark ] or None
+            left_word : 뒷 조사를 제외한 부분
+            word : 조사로 추정되는 단어
+            mark : 문장기호
+        """
+        last_char = eojeol[-1]
+
+        # 문장 종결 기호가 있는지 확인한다.
+        mark = None
+        if last_char in self.SENTENSE_MARK:
+            mark = last_char
+            last_char = eojeol[-2]
+            new_eojeol = eojeol[:-1]
+        else:
+            new_eojeol = eojeol
+
+        # 마지막 어절의 음절이 조사마지막 음절리스트에 있는지 확인한다.
+        if last_char not in self._josa_last:
+            return None
+
+        # 최장 조사부터 검사한다.
+        josa_set = self._josa_set
+        for index in range(1, len(new_eojeol)):
+            candidate_word = new_eojeol[index:]
+            left_word = new_eojeol[:index]
+            if candidate_word in josa_set:
+                return [left_word, candidate_word, mark]
+        return None
+
     def _check_eomi_in_eojeol(self, eojeol):
         """
         어미로 종결하는지 검사하고, 어미와 그 외로 구별함
@@ -323,9 +514,83 @@ class Hinsaem(object):
         return False
 
 
+def _iter_chunk(sentences, chunksize):
+    """ 문장을 chunksize 개씩 묶어서 (chunk 번호, 문장 리스트) 로 돌려준다. """
+    sentence_iter = iter(sentences)
+    for chunk_index in itertools.count():
+        sentence_list = list(itertools.islice(sentence_iter, chunksize))
+        if not sentence_list:
+            return
+        yield (chunk_index, sentence_list)
+
+
+def _init_worker(hinsaem_class, config):
+    """ analyze_many worker 초기화, 부모 프로세스의 설정으로 사전을 로딩한다. """
+    global _worker_hinsaem
+    CONFIG.update(config)
+    _worker_hinsaem = hinsaem_class()
+    # 첫 chunk 의 처리시간에 사전 로딩 시간이 들어가지 않도록 미리 로딩한다.
+    _worker_hinsaem._tables()
+
+
+def _analyze_chunk(chunk):
+    return _analyze_chunk_with(_worker_hinsaem, chunk)
+
+
+def _analyze_chunk_with(hinsaem, chunk):
+    """ chunk 의 문장을 분석하고 (결과 리스트, chunk_info) 를 리턴한다. """
+    (chunk_index, sentence_list) = chunk
+    time_stamp_01 = time.time()
+    result_list = [hinsaem._parse_sen(sen) for sen in sentence_list]
+    elapsed = time.time() - time_stamp_01
+
+    eojeol_count = sum(len(result) for result in result_list)
+    chunk_info = {
+        "chunk": chunk_index, "sentences": len(sentence_list),
+        "eojeols": eojeol_count, "elapsed": elapsed,
+        "sen_per_sec": len(sentence_list) / elapsed if elapsed else 0.0,
+        "eojeol_per_sec": eojeol_count / elapsed if elapsed else 0.0}
+    return (result_list, chunk_info)
+
+
+def _ordered_output(chunk_iter, submit, max_pending, report):
+    """
+    submit(chunk) 로 chunk 를 worker 에 넘기고, 결과를 입력 순서대로 돌려준다.
+    submit 은 결과를 기다리는 함수를 리턴한다.
+    입력을 모두 읽어 두지 않도록 처리중인 chunk 수를 max_pending 개로 제한한다.
+    """
+    pending = collections.deque()
+    for chunk in chunk_iter:
+        pending.append(submit(chunk))
+        if len(pending) >= max_pending:
+            yield from _chunk_output(pending.popleft()(), report)
+    while pending:
+        yield from _chunk_output(pending.popleft()(), report)
+
+
+def _gil_enabled():
+    """ GIL 이 있으면 True, free-threaded CPython 에서 GIL 이 꺼져 있으면 False """
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def _chunk_output(chunk_result, report):
+    (result_list, chunk_info) = chunk_result
+    if report:
+        logger.info(
+            "chunk %(chunk)d : %(sentences)d sentences, %(eojeols)d eojeols,"
+            " %(eojeol_per_sec).1f eojeol/sec", chunk_info)
+        return [chunk_result]
+    return result_list
+
+
 if __name__ == "__main__":
+    # 말뭉치 스트리밍 분석(hinsaem.stream 참고)
+    # python -m hinsaem.main [input] [-o output] [-f tsv|jsonl] [-w workers]
+    from .stream import main
     try:
-        print("Hello, Hinsaem Pos Tagger")
+        main()
     except Exception:
         tb = traceback.format_exc()
-        print(tb)
+        print(tb, file=sys.stderr)
+        sys.exit(1)
@@ -2,14 +2,69 @@
     PosBase(형태소 관련 기본 기능) Module
     ~~~~~~~~
 
+사전은 분석기 객체를 만들 때가 아니라 처음 조회할 때 로딩한다.(SharedTable)
+로딩한 사전은 프로세스 공용 사전 등록소(lexicon_registry)에 등록하고, 같은 사전을
+사용하는 모든 객체가 공유한다.
+
+Thread 안전성
+분석기 객체의 상태는 변경할 수 없는 공용 사전과 생성할 때 정한 설정(읽기 전용 속성)뿐이고,
+분석 중에 객체를 변경하지 않는다. 어절 분석결과 캐시(eojeol_cache)는 lock 을 사용한다.
+그래서 분석기 객체 하나를 여러 thread 에서 복사하지 않고 같이 사용할 수 있다.
+규칙 적용 횟수 같은 통계(stats)는 여러 thread 에서 분석하면 정확하지 않을 수 있다.
 
 """
+from .config import CONFIG
+from . import dict_cache
+from . import lexicon_store
+from .lexicon_registry import SharedTableOwner, get_tables
 
 
-class PosBase(object):
+class PosBase(SharedTableOwner):
     """ 형태소 관련 기본기능 모듈
 
     """
+    def _load_tables(self, name, file_paths, read_func, lexicon_keys,
+                     trie_keys=None):
+        """
+        사전을 로딩한다. CONFIG["lexicon_backend"] 에 따라서
+        "dict" 이면 사전 캐시(dict_cache)를 이용해 Python dict 로,
+        "mmap" 이면 lexicon_keys 에 해당하는 큰 사전을 mmap 파일(lexicon_store)로 로딩한다.
+        이미 로딩한 사전이면 프로세스 공용 사전(lexicon_registry)을 그대로 리턴한다.
+
+        Arg :
+            name : 캐시 이름
+            file_paths : 원본 사전 파일 경로(리스트 가능)
+            read_func : 원본 사전을 읽는 함수
+            lexicon_keys : mmap 으로 로딩할 사전의 key 리스트
+            trie_keys : {SuffixTrie 의 key: lexicon_keys 의 key},
+                mmap 이면 Trie 에는 단어만 저장하고 값은 mmap 사전에서 읽는다.
+
+        Returns:
+            변경할 수 없는 {"KEY": table, ...}
+        """
+        backend = CONFIG.get("lexicon_backend", "dict")
+
+        def _load():
+            if backend == "mmap":
+                return lexicon_store.load_tables(
+                    name, file_paths, read_func, lexicon_keys, trie_keys)
+            return dict_cache.load_dict(name, file_paths, read_func)
+        return get_tables(name, file_paths, _load, backend)
+
+    @staticmethod
+    def _get_beam(k):
+        """
+        endswithE, endswithj 의 k 를 (k, register) 로 바꾼다.
+        k 가 None 이면 CONFIG["beam_k"] 를 사용하고, beam 모드가 아니면 None
+        """
+        if k is None:
+            k = CONFIG.get("beam_k")
+        if k is None:
+            return None
+        if k < 1:
+            raise ValueError("k must be >= 1")
+        return (k, CONFIG.get("freq_register", "writing"))
+
     def _pos_select(self, word, pos, comppostag):
         """
         복합형태소가 있는 경우 복합형태소가 선택되고
@@ -23,8 +23,14 @@ import traceback
 import logging
 from .config import CONFIG
 from .pos_base import PosBase
+from .lexicon_registry import SharedTable
+from . import eojeol_cache
+from .suffix_trie import SuffixTrie
 from .eumjeol_util import check_phoneme_restriction, JONGSUNG_TYPE_NONE,\
     JONGSUNG_TYPE_LIEUL, JONGSUNG_TYPE_COMMON
+from .eumjeol_util import check_phoneme_mask
+from .posinfo import PosInfo
+from .candidate import Candidate, top_k
 from .eumjeol_util import get_jongsung_type, has_jongsung, parse_eumjeol,\
     build_eumjeol
 
@@ -57,31 +63,34 @@ class PosJ(PosBase):
     # 복합조사 series
     _SERIES_POS = ["JSE"]
 
-    #
-    def __init__(self):
-        config_dict = self._readDict()
-        self._josa_list = config_dict["JOSA"]
-        self._josa_last = config_dict["JOSA_LAST"]
-        self._josa_jungjong = config_dict["JOSA_JUNGJONG"]
-        self._josa_jungjong_start = config_dict["JOSA_JUNGJONG_START"]
-        self._josa_jungjong_only = config_dict["JOSA_JUNGJONG_ONLY"]
+    # 조사 사전, 처음 조회할 때 로딩하고 모든 PosJ 객체가 공유한다.
+    _josa_list = SharedTable("JOSA")
+    _josa_trie = SharedTable("JOSA_TRIE")
+    _josa_jungjong = SharedTable("JOSA_JUNGJONG")
+    _josa_jungjong_start = SharedTable("JOSA_JUNGJONG_START")
+    _josa_jungjong_only = SharedTable("JOSA_JUNGJONG_ONLY")
 
     def _readDict(self):
+        """조사 사전을 로딩한다. 유효한 캐시가 있으면 캐시를 읽는다."""
+        return self._load_tables(
+            "J", CONFIG["res_dict_j"], self._readTsv, ["JOSA"],
+            {"JOSA_TRIE": "JOSA"})
+
+    def _readTsv(self, file_path0):
         multi_dict = {}
         josa_jungjong = {}
         josa_jungjong_only = {}
         josa_jungjong_start = set({})
-        josa_last = set({})
 
-        file_path0 = CONFIG["res_dict_j"]
         with open(file_path0, 'r', encoding='UTF-8', newline='') as csvfile:
             # next(csvfile, None)
             for item in csv.DictReader(
                     csvfile, delimiter="\t", dialect="excel-tab"):
                 try:
                     word = item["word"]
-                    posinfo = {"pos": item["pos"], "pos2": item["pos2"],
-                               "phoneme": item["phoneme"]}
+                    # 같은 (pos, pos2, phoneme) 은 같은 PosInfo 객체를 공유한다.
+                    posinfo = PosInfo(
+                        item["pos"], item["pos2"], item["phoneme"])
                     if word[0] < u"가" and len(word) == 1:
                         # 중성,종성만으로 이루어진 조사(ex : ㄴ)
                         if word not in josa_jungjong_only:
@@ -98,8 +107,6 @@ class PosJ(PosBase):
                         # 중성, 종성으로 시작하는 조사의 시작 중종성 저정
                         josa_jungjong_start.add(word[0])
 
-                    # # 조사음절 마지막 음절 Set을 따로 만든다.
-                    josa_last.add(word[-1])
                     if word not in multi_dict:
                         multi_dict[word] = []
                     multi_dict[word].append(posinfo)
@@ -108,18 +115,23 @@ class PosJ(PosBase):
                     tb = traceback.format_exc()
                     print(tb)
 
-        config_dict = {"JOSA": multi_dict, "JOSA_LAST": josa_last,
+        # 조사를 뒤에서부터 저장한 Trie, 첫 단계가 조사 마지막 음절 Set 역할을 한다.
+        config_dict = {"JOSA": multi_dict,
+                       "JOSA_TRIE": SuffixTrie(multi_dict),
                        "JOSA_JUNGJONG": josa_jungjong,
                        "JOSA_JUNGJONG_START": josa_jungjong_start,
                        "JOSA_JUNGJONG_ONLY": josa_jungjong_only}
         return config_dict
 
-    def endswithj(self, eojeol):
+    def endswithj(self, eojeol, k=None):
         """
         조사로 종결하는지 검사하고, 조사와 그 외로 구별함
 
         Args :
             eojeol
+            k (int) : beam 크기, 빈도(CONFIG["freq_register"])가 높은 후보
+                k 개만 남긴다. None 이면 CONFIG["beam_k"],
+                둘 다 None 이면 모든 후보를 찾는다.
         Returns:
             [ leftword, word, mark, meta ] or None
             leftword : 뒷 조사를 제외한 부분
@@ -128,8 +140,19 @@ class PosJ(PosBase):
             meta : postag(word/pos)에 따른 기타정보
             ex) ["집", "으로/JKB, None, {"으로/JKB" :
                 { "spoken" : 222.5219782, "writing" : 316.9873731 }}]
-        """
 
+            같은 어절의 분석결과는 eojeol_cache 에 저장해 두고 다시 사용하며,
+            각 후보는 변경할 수 없는 Candidate(tuple) 이다.
+        """
+        beam = self._get_beam(k)
+        candiate_list = eojeol_cache.cached_call(
+            self, ("J", eojeol, beam), self._endswithj, eojeol, beam)
+        if candiate_list is None:
+            return None
+        return list(candiate_list)
+
+    def _endswithj(self, eojeol, beam=None):
+        """ 캐시를 사용하지 않는 endswithj, beam 은 (k, register) 또는 None """
         last_char = eojeol[-1]
 
         # 문장 종결 기호가 있는지 확인한다.
@@ -144,22 +167,30 @@ class PosJ(PosBase):
             pos_filter = self._GROUP_JOSA
 
         # #### 마지막 어절의 음절이 조사마지막 음절리스트에 있는지 확인한다.
-        if last_char not in self._josa_last:
+        if last_char not in self._josa_trie:
             # 받침으로 결합하는 조사에 대한 예외처리한다.
             (_, _, jong) = parse_eumjeol(last_char)
             if jong not in self._josa_jungjong_only:
                 return None
 
+        # 어절을 뒤에서부터 한번 따라가면서 사전에 있는 조사를 모두 찾는다.
+        # {분리index: 조사 posinfo 리스트}
+        regular_josa_dict = {}
+        for (index, _, posinfo_list) in self._josa_trie.iter_suffix(
+                new_eojeol, 1):
+            regular_josa_dict[index] = posinfo_list
+
         # 여러 가능성을 고려한 체언후보, 조사 조합 분리
-        # [ [분리index, 전체어절, 체언후보, 조사후보], [분리index, 전체어절, 체언후보, 조사후보], ... ]
+        # [ [분리index, 전체어절, 체언후보, 조사후보, posinfo 리스트], ... ]
         leftword_josa_list = []
 
         for index in range(1, len(new_eojeol)+1):
             leftword = new_eojeol[:index]
             josa = new_eojeol[index:]
-            if leftword != "" and josa != "":
+            if index in regular_josa_dict:
                 leftword_josa_list.append(
-                    [index, leftword, josa, leftword[-1]])
+                    [index, leftword, josa, leftword[-1],
+                     regular_josa_dict[index]])
 
             # #  받침으로 시작하는 어미처리
             # # 체언후보 + 조사가 한 음절에서 합쳐지는 경우, leftword를 검사할 때 분리한다.
@@ -169,23 +200,34 @@ class PosJ(PosBase):
                 leftword = leftword[:-1] + last_eumjeol_left
                 josa = jong + josa
                 leftword_josa_list.append(
-                    [index, leftword, josa, last_eumjeol_left])
+                    [index, leftword, josa, last_eumjeol_left, None])
 
-        candiate_list = []
+        candiate_iter = self._iter_candiate(
+            eojeol, mark, pos_filter, leftword_josa_list, beam)
+        if beam is not None:
+            return top_k(candiate_iter, *beam)
+        return list(candiate_iter)
+
+    def _iter_candiate(self, eojeol, mark, pos_filter, leftword_josa_list,
+                       beam=None):
+        """
+        체언후보, 조사 조합마다 _endswithj 의 후보를 하나씩 만든다.
+        beam 이 있으면 조합마다 빈도가 높은 k 개만 만든다.
+        """
         # 최장 음절을 가정하고 최장음절부터 겹치는 조사가 있는지 검사한다.
         for item in leftword_josa_list:
             index = item[0]
             leftword = item[1]
             josa = item[2]
             last_eumjeol_left = item[3]
+            posinfo_list = item[4]
 
-            new_candiate_list = self._get_candiate_info_list(
+            candiate_list = self._get_candiate_info_list(
                 index, eojeol, leftword, josa, last_eumjeol_left, mark,
-                pos_filter)
-            if len(new_candiate_list) > 0:
-                candiate_list.extend(new_candiate_list)
-
-        return candiate_list
+                pos_filter, posinfo_list)
+            if beam is not None:
+                candiate_list = top_k(candiate_list, *beam)
+            yield from candiate_list
 
     def _jungjong_only_josa(self, eojeol, mark):
         last_eumjeol = eojeol[-1]
@@ -195,16 +237,15 @@ class PosJ(PosBase):
         leftword = eojeol[:-1] + build_eumjeol(cho, jung, "")
         candiate_list = []
         for posinfo in self._josa_jungjong_only[jong]:
-            pos = posinfo["pos"]
-            postag_tuple = [(jong, pos)]
-            candiate_info = [leftword, postag_tuple,
-                             mark, {tuple(postag_tuple): posinfo}]
-            candiate_list.append(candiate_info)
+            pos = posinfo.pos
+            postag_tuple = ((jong, pos),)
+            candiate_list.append(Candidate(
+                leftword, postag_tuple, mark, {postag_tuple: posinfo}))
         return candiate_list
 
     def _get_candiate_info_list(
             self, index, eojeol, candidate_leftword, candidate_josa,
-            last_eumjeol_left, mark, pos_filter,):
+            last_eumjeol_left, mark, pos_filter, posinfo_list=None):
         """
         전달된 어간후보, 어미후가가 적당한 후보가 맞는지 확인 하고 맞으면
         candiate_info_list 를 리턴한다.
@@ -217,6 +258,8 @@ class PosJ(PosBase):
             last_eumjeol_left : 음운 조건을 확인해야 하는 나머지단어
             pos_filter : 어미후보의 가능한 pos 리스트
             mark : 문장기호(없는 경우 None)
+            posinfo_list : 이미 찾은 조사후보의 posinfo 리스트,
+                None 이면 사전에서 찾는다.
         Returns:
             [ leftword, postag_tuple, mark, posinfo] or None
             leftword : 뒷 조사를 제외한 부분
@@ -226,18 +269,20 @@ class PosJ(PosBase):
         """
         candiate_list = []
 
-        if candidate_josa in self._josa_list:
-            for posinfo in self._josa_list[candidate_josa]:
-                if check_phoneme_restriction(
-                        last_eumjeol_left, posinfo["phoneme"]):
+        if posinfo_list is None:
+            posinfo_list = self._josa_list.get(candidate_josa)
+        if posinfo_list is not None:
+            for posinfo in posinfo_list:
+                if check_phoneme_mask(
+                        last_eumjeol_left, posinfo.phoneme_mask,
+                        posinfo.phoneme):
                     postag_tuple = self._pos_select(
-                        candidate_josa, posinfo["pos"], posinfo["pos2"])
+                        candidate_josa, posinfo.pos, posinfo.pos2)
                     # 추출하려는 형태소가 아니면 패스
                     if postag_tuple[-1][1] not in pos_filter:
                         continue
 
-                    candiate_info = [candidate_leftword,
-                                     postag_tuple, mark, posinfo]
-                    candiate_list.append(candiate_info)
+                    candiate_list.append(Candidate(
+                        candidate_leftword, postag_tuple, mark, posinfo))
 
         return candiate_list
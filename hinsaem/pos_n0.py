@@ -19,23 +19,44 @@ import time
 import traceback
 import enum
 import logging
+import collections
 import multiprocessing as mp
 from multiprocessing import current_process
+from concurrent.futures import ThreadPoolExecutor
 
 
 from .config import CONFIG
 from .pos_util import union_meta
 from .pos_base import PosBase
+from .lexicon_registry import SharedTable, get_tables
+from .prefix_trie import PrefixTrie
+from .aho_corasick import AhoCorasick
+from . import dict_cache
+from . import eojeol_cache
 from .eumjeol_util import check_phoneme_restriction, JONGSUNG_TYPE_NONE,\
     JONGSUNG_TYPE_LIEUL, JONGSUNG_TYPE_COMMON, YANG_VOWEL
 from .eumjeol_util import get_jongsung_type, has_jongsung, parse_eumjeol,\
     build_eumjeol, change_jaso
 
-mp.log_to_stderr()
-logger_mp = mp.get_logger()
-logger_mp.setLevel(logging.INFO)
 logger = logging.getLogger(__name__)
 
+_NounMatchBase = collections.namedtuple(
+    "NounMatch", ["start", "end", "word", "pos", "category"])
+
+
+class NounMatch(_NounMatchBase):
+    """
+    PosN0.scan_nouns 로 찾은 사전 단어 하나
+
+    Attributes :
+        start (int) : 문장에서 단어가 시작하는 위치
+        end (int) : 문장에서 단어가 끝나는 위치, sentence[start:end]
+        word (str) : 사전 단어
+        pos (str) : "NNG" 또는 "NNP"
+        category (str) : 사전의 category(ex : "지명"), 없으면 ""
+    """
+    __slots__ = ()
+
 
 class PosN0(PosBase):
     """
@@ -43,35 +64,74 @@ class PosN0(PosBase):
     """
     GROUP_NOUN = ["NNP", "NNG", "NND", "NNU",  "NP", "NR"]
 
-    #
-    def __init__(self):
-        config_dict = self._read_dict()
-        self._nng = config_dict["NNG"]
-        self._nnp = config_dict["NNP"]
-        self._n_else = config_dict["N_"]
+    # 사전 종류와 사전 파일 경로의 CONFIG key
+    _DICT_FILE_LIST = [
+        # ["NNG", "res_dict_nng"],
+        ["NNG", "res_dict_nng01"],
+        ["NNG", "res_dict_nng02"],
+        ["NNG", "res_dict_nng03"],
+        ["NNG", "res_dict_nng04"],
+        ["NNG", "res_dict_nng05"],
+        ["NNP", "res_dict_nnp"],
+        ["N_", "res_dict_n_"],
+    ]
+
+    # 체언 사전, 처음 조회할 때 로딩하고 모든 PosN0 객체가 공유한다.
+    _nng = SharedTable("NNG")
+    _nnp = SharedTable("NNP")
+    _n_else = SharedTable("N_")
+
+    # 복합명사를 이루는 N_.tsv 의 접두사, 접미사
+    COMP_AFFIX_POS = ["XPN", "XSN"]
+
+    # 복합명사 분리 비용, 비용의 합이 가장 작은 분리를 고른다.
+    # 조각이 적을수록 좋고, 한 음절 명사는 접사보다 비용이 크다.(ex : 사람+들/XSN)
+    _COMP_NOUN_COST = 1.0
+    _COMP_SHORT_NOUN_COST = 1.5
+    _COMP_AFFIX_COST = 1.2
 
-    def _read_dict(self):
-        logger_mp.info("_read_dict start")
+    def _readDict(self):
+        """체언 사전을 로딩한다. 유효한 캐시가 있으면 캐시를 읽는다."""
+        file_path_list = [CONFIG[config_key]
+                          for _, config_key in self._DICT_FILE_LIST]
+        return self._load_tables(
+            "N0", file_path_list, self._read_dict_tsv, ["NNG", "NNP", "N_"])
+
+    def _read_dict_tsv(self, file_path_list):
+        """
+        체언 사전 파일들을 읽는다. CONFIG["n0_loader"] 에 따라서
+        "thread" 이면 같은 프로세스의 thread 에서 읽어서 결과를 pickle 하지 않고,
+        "process" 이면 multiprocessing Pool 에서 읽고 결과를 pickle 해서 받는다.
+        CONFIG["multiprocess_count"] 가 1 이면 Pool, thread 없이 차례로 읽는다.
+        """
+        logger.debug("_read_dict start")
         processCount = CONFIG["multiprocess_count"]
         if processCount == "auto":
             processCount = mp.cpu_count()
-        pool = mp.Pool(processCount)
+        loader = CONFIG.get("n0_loader", "thread")
         params_list = []
-        # params_list.append(["NNG", CONFIG["res_dict_nng"], ["word", "pos"]])
-        params_list.append(["NNG", CONFIG["res_dict_nng01"], ["word", "pos"]])
-        params_list.append(["NNG", CONFIG["res_dict_nng02"], ["word", "pos"]])
-        params_list.append(["NNG", CONFIG["res_dict_nng03"], ["word", "pos"]])
-        params_list.append(["NNG", CONFIG["res_dict_nng04"], ["word", "pos"]])
-        params_list.append(["NNG", CONFIG["res_dict_nng05"], ["word", "pos"]])
-
-        params_list.append(["NNP", CONFIG["res_dict_nnp"], ["word", "pos"]])
-        params_list.append(["N_", CONFIG["res_dict_n_"], ["word", "pos"]])
+        for (ret_key, _), file_path in zip(self._DICT_FILE_LIST,
+                                           file_path_list):
+            params_list.append([ret_key, file_path, ["word", "pos"]])
 
         time_stamp_01 = time.time()
 
+        if processCount <= 1:
+            result_list = [PosN0._read_pos_dict(params)
+                           for params in params_list]
+        elif loader == "process":
+            with mp.Pool(processCount) as pool:
+                result_list = pool.map(PosN0._read_pos_dict, params_list)
+        elif loader == "thread":
+            with ThreadPoolExecutor(processCount) as executor:
+                result_list = list(executor.map(
+                    PosN0._read_pos_dict, params_list))
+        else:
+            raise ValueError("unknown n0_loader : %s" % loader)
+
         result_dict = {"NNG": {}}
-        for result in pool.map(PosN0._read_pos_dict, params_list):
-            logger_mp.info("_read_dict result for")
+        for result in result_list:
+            logger.debug("_read_dict result for")
             key = list(result.keys())[0]
             if key == "NNG":
                 result_dict["NNG"].update(result["NNG"])
@@ -89,32 +149,173 @@ class PosN0(PosBase):
         ret_key = params[0]
         file_path = params[1]
         # sel_filter_list = params[2]
-        logger_mp.info("_read_pos_dict start")
+        logger.debug("_read_pos_dict start")
         word_dict = {}
+        # 같은 pos, category 의 posinfo 는 하나의 객체를 공유한다.
+        # 메모리 사용량과 사전 캐시 로딩 시간이 줄어든다.
+        posinfo_dict = {}
         with open(file_path, "r", encoding="UTF-8", newline="") as csvfile:
+            # 첫 줄은 헤더(word, pos, ...)이다.
+            next(csvfile, None)
             # csv.DictReader를 사용하는 것 보다 직접 읽는게 속도가 더 빠르다.
-            for line in csvfile.readlines():
+            for line in csvfile:
                 item_list = line.split("\t")
                 key = item_list[0]
+                posinfo_key = (item_list[1], item_list[2])
+                if posinfo_key not in posinfo_dict:
+                    posinfo_dict[posinfo_key] = {"pos": item_list[1],
+                                                 "category": item_list[2]}
                 if key not in word_dict:
                     word_dict[key] = []
-                word_dict[key].append({"pos": item_list[1],
-                                       "category": item_list[2]})
+                word_dict[key].append(posinfo_dict[posinfo_key])
         return {ret_key: word_dict}
 
+    def _noun_trie(self):
+        """
+        체언 사전(NNG, NNP)과 N_.tsv 의 접사(XPN, XSN)로 만든 PrefixTrie
+        처음 사용할 때 만들고, 모든 PosN0 객체가 공유한다.
+        """
+        file_path_list = [CONFIG[config_key]
+                          for _, config_key in self._DICT_FILE_LIST]
+        return get_tables("N0_TRIE", file_path_list,
+                          self._build_noun_trie)["NOUN_TRIE"]
+
+    def _build_noun_trie(self):
+        # {단어: [pos, ...]}, 같은 단어는 NNG, NNP, 접사 순서
+        word_dict = {}
+        for (table, table_pos) in [(self._nng, "NNG"), (self._nnp, "NNP"),
+                                   (self._n_else, None)]:
+            for word, posinfo_list in table.items():
+                for posinfo in posinfo_list:
+                    pos = table_pos
+                    if pos is None:
+                        pos = posinfo["pos"]
+                        if pos not in self.COMP_AFFIX_POS:
+                            continue
+                    pos_list = word_dict.setdefault(word, [])
+                    if pos not in pos_list:
+                        pos_list.append(pos)
+        return {"NOUN_TRIE": PrefixTrie(
+            {word: tuple(pos_list) for word, pos_list in word_dict.items()})}
+
+    def _noun_scanner(self):
+        """
+        체언 사전(NNG, NNP)으로 만든 AhoCorasick automaton
+        사전 캐시(dict_cache)에 저장해 두고 다음 로딩 때는 캐시를 읽는다.
+        모든 PosN0 객체가 공유한다.
+        """
+        file_path_list = [CONFIG[config_key]
+                          for ret_key, config_key in self._DICT_FILE_LIST
+                          if ret_key in ["NNG", "NNP"]]
+        return get_tables(
+            "N0_SCAN", file_path_list,
+            lambda: dict_cache.load_dict(
+                "N0_SCAN", file_path_list,
+                lambda _: self._build_noun_scanner()))["SCANNER"]
+
+    def _build_noun_scanner(self):
+        # {단어: ((pos, category), ...)}
+        word_dict = {}
+        for (table, pos) in [(self._nng, "NNG"), (self._nnp, "NNP")]:
+            for word, posinfo_list in table.items():
+                for posinfo in posinfo_list:
+                    entry_list = word_dict.setdefault(word, [])
+                    entry = (pos, posinfo["category"].strip())
+                    if entry not in entry_list:
+                        entry_list.append(entry)
+        return {"SCANNER": AhoCorasick(
+            {word: tuple(entry_list)
+             for word, entry_list in word_dict.items()})}
+
+    def scan_nouns(self, sentence, ignore_space=False):
+        """
+        문장이나 문서에서 체언 사전(NNG, NNP)에 있는 단어를 모두 찾는다.
+
+        AhoCorasick automaton 으로 문장을 한번만 읽는다. 어절 안에 들어 있는 단어도 찾고,
+        ignore_space 이면 어절 경계에 걸친 단어도 찾는다.
+
+        Args :
+            sentence (str) : 문장 또는 문서
+            ignore_space (bool) : True 이면 공백을 건너뛰고 찾는다.
+        Returns:
+            [NounMatch, ...], 끝 위치 순서
+            ex) scan_nouns("서울특별시청") => [NounMatch(0, 2, "서울", "NNP", "지명"),
+                NounMatch(0, 5, "서울특별시", "NNP", "지명"), ...]
+        """
+        match_list = []
+        for (start, end, word, entry_tuple) in \
+                self._noun_scanner().iter_match(sentence, ignore_space):
+            for (pos, category) in entry_tuple:
+                match_list.append(NounMatch(start, end, word, pos, category))
+        return match_list
+
     def isCompNoun(self, eojeol):
         """
         복합명사 검사하고 가장 높은 후보군을 추출해 복합명사 또는 단일 명사 제공
 
+        체언 사전 PrefixTrie 로 어절의 각 위치에서 시작하는 명사, 접사를 찾고,
+        동적계획법으로 비용의 합이 가장 작은 분리를 고른다.
+        접두사(XPN)는 어절 맨 앞에만, 접미사(XSN)는 명사 뒤에만 올 수 있다.
+        위치마다 Trie 를 가장 긴 사전 단어 길이 만큼만 따라가므로 어절 길이에 비례한다.
+
         Args :
             eojeol (str) : 검사하려는 어절
         Returns:
             [postag1, postag2, ...] or None
+            사전 단어로 어절 전체를 나눌 수 없으면 None
 
             ex) ["사람/NNG","들/XSN"]
         """
-        # # 한 문자이면 복합명사가 아니다.
-        if len(eojeol) == 1:
-            pass
+        if eojeol == "":
+            return None
+        postag_list = eojeol_cache.cached_call(
+            self, ("N0_COMP", eojeol), self._isCompNoun, eojeol)
+        if postag_list is None:
+            return None
+        return list(postag_list)
+
+    def _isCompNoun(self, eojeol):
+        """ 캐시를 사용하지 않는 isCompNoun """
+        trie = self._noun_trie()
+        eojeol_len = len(eojeol)
+        # best[index] : {마지막 조각 pos: (비용, 조각 수, 마지막 조각 시작,
+        #   앞 조각 pos)}, 접미사는 앞 조각이 명사인지 알아야 해서 pos 별로 저장한다.
+        best = [{} for _ in range(eojeol_len + 1)]
+        best[0][None] = (0.0, 0, None, None)
+        for start in range(eojeol_len):
+            if not best[start]:
+                continue
+            for (end, word, pos_tuple) in trie.iter_prefix(eojeol, start):
+                for pos in pos_tuple:
+                    if pos == "XPN":
+                        if start != 0 or end == eojeol_len:
+                            continue
+                        piece_cost = self._COMP_AFFIX_COST
+                    elif pos == "XSN":
+                        piece_cost = self._COMP_AFFIX_COST
+                    elif len(word) == 1:
+                        piece_cost = self._COMP_SHORT_NOUN_COST
+                    else:
+                        piece_cost = self._COMP_NOUN_COST
+                    for (prev_pos, (cost, count, _, _)) in \
+                            best[start].items():
+                        # 접미사는 명사 뒤에만 온다.(ex : 비/XPN + 들/XSN 안됨)
+                        if pos == "XSN" and prev_pos in (None, "XPN", "XSN"):
+                            continue
+                        item = (cost + piece_cost, count + 1, start, prev_pos)
+                        old_item = best[end].get(pos)
+                        if old_item is None or item[:2] < old_item[:2]:
+                            best[end][pos] = item
 
-        return False
+        if not best[eojeol_len]:
+            return None
+        pos = min(best[eojeol_len],
+                  key=lambda pos: best[eojeol_len][pos][:2])
+        postag_list = []
+        end = eojeol_len
+        while end > 0:
+            (_, _, start, prev_pos) = best[end][pos]
+            postag_list.append(eojeol[start:end] + "/" + pos)
+            (end, pos) = (start, prev_pos)
+        postag_list.reverse()
+        return postag_list
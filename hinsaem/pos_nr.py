@@ -21,7 +21,7 @@
 4. 한자어 서수사
     제일, 제이, 제삼, ...
 
-
+check 는 수사인지만 검사하고, parse 는 수사의 값과 위치를 구한다.(ex : 삼십만 => 300000)
 
 Todo:
     *
@@ -32,22 +32,55 @@ import csv
 import copy
 import traceback
 import logging
+import collections
 from .config import CONFIG
+from .pos_base import PosBase
+from .lexicon_registry import SharedTable
 from .eumjeol_util import get_jongsung_type, JONGSUNG_TYPE_NONE,\
     JONGSUNG_TYPE_LIEUL, JONGSUNG_TYPE_COMMON
 from .eumjeol_util import has_jongsung, parse_eumjeol, build_eumjeol
 
 logger = logging.getLogger(__name__)
 
+_NumeralMatchBase = collections.namedtuple(
+    "NumeralMatch", ["start", "end", "value", "max_value", "ordinal"])
+
+
+class NumeralMatch(_NumeralMatchBase):
+    """
+    PosNR.parse 로 찾은 수사
+
+    Attributes :
+        start (int) : 단어에서 수사가 시작하는 위치
+        end (int) : 단어에서 수사가 끝나는 위치, word[start:end]
+        value (int) : 수사의 값, 어림수(수천, 몇십)는 None
+        max_value (int) : 범위 수사(한두, 대여섯)의 큰 값, 범위가 아니면 value 와 같다.
+        ordinal (bool) : 서수사(스물다섯째, 제삼)이면 True
+    """
+    __slots__ = ()
+
+
+# parse 의 수사 조각 종류
+_TOKEN_DIGIT = "DIGIT"          # 한자어 숫자(일, 이, ...)
+_TOKEN_UNIT = "UNIT"            # 한자어 자리(십, 백, 천)
+_TOKEN_BIG_UNIT = "BIG_UNIT"    # 한자어 큰 자리(만, 억, 조, ...)
+_TOKEN_PURE = "PURE"            # 고유어 일의 자리(하나, 두, ...)
+_TOKEN_PURE_TEN = "PURE_TEN"    # 고유어 십의 자리(열, 스물, ...)
+_TOKEN_RANGE = "RANGE"          # 범위 수사(한두, 대여섯, ...)
+_TOKEN_ORDINAL_PRE = "ORDINAL_PRE"  # 서수 접두사(제)
+_TOKEN_APPROX_PRE = "APPROX_PRE"    # 어림수 접두사(수, 기, 몇)
+_TOKEN_FIRST = "FIRST"          # 첫(째)
+_TOKEN_POSTFIX = "POSTFIX"      # 서수 접미사(째)
 
-class PosNR(object):
+
+class PosNR(PosBase):
     """
     수사 분석 Class
     """
 
     # 고유어 양수사
     _PURE_KOR_NUMBER = {
-        "하나": 1, "한": 1, "둘": 2, "두": 2, "셋": 3, "세": 3, "넷": 4, "네": 5,
+        "하나": 1, "한": 1, "둘": 2, "두": 2, "셋": 3, "세": 3, "넷": 4, "네": 4,
         "다섯": 5, "여섯": 6, "일곱": 7, "여덟": 8, "여덜": 8, "여덞": 8,
         "아홉": 9}
 
@@ -66,7 +99,7 @@ class PosNR(object):
         "일": 1, "이": 2, "삼": 3, "사": 4, "오": 5,
         "육": 6, "칠": 7, "팔": 8, "구": 9}
     _HANJA_NUMBER_DEC = {
-        "십": 10, "시": 10, "백": 100, "천": 100, "만": 10000, "십만": 100000,
+        "십": 10, "시": 10, "백": 100, "천": 1000, "만": 10000, "십만": 100000,
         "백만": 1000000, "천만": 10000000, "억": 100000000,
         "십억": 1000000000, "백억": 10000000000, "천억": 100000000000,
         "조": 1000000000000, "십조": 10000000000000, "백조": 100000000000000,
@@ -80,6 +113,9 @@ class PosNR(object):
     _ALL_NUMBER.update(_PURE_KOR_NUMBERS)
     _ALL_NUMBER.update(_HANJA_NUMBER)
 
+    # 한자어 영
+    _HANJA_ZERO = {"영": 0, "공": 0}
+
     # 고유어 접미사
     _PURE_KOR_POSTFIX = [u"째"]
 
@@ -87,12 +123,20 @@ class PosNR(object):
     # 제일,  기천만, 수천
     _HANJA_ORDINAL_PRE = [u"제", u"기", u"수", u"몇"]
 
-    def __init__(self):
-        self._nr_multi_dict = self._readDict()
+    # 수사 사전, 처음 조회할 때 로딩하고 모든 PosNR 객체가 공유한다.
+    _nr_multi_dict = SharedTable("NR")
+
+    # parse 에 사용하는 수사 조각 {첫 음절: ((조각, 종류, 값), ...)}
+    # 처음 parse 할 때 만든다.
+    _number_token = None
 
     def _readDict(self):
+        """수사 사전을 로딩한다. 유효한 캐시가 있으면 캐시를 읽는다."""
+        return self._load_tables(
+            "NR", CONFIG["res_dict_nr"], self._readTsv, ["NR"])
+
+    def _readTsv(self, file_path0):
         multi_dict = {}
-        file_path0 = CONFIG["res_dict_nr"]
         with open(file_path0, 'r', encoding='UTF-8', newline='') as csvfile:
             # next(csvfile, None)
             for item in csv.DictReader(
@@ -108,7 +152,7 @@ class PosNR(object):
                     tb = traceback.format_exc()
                     print(tb)
 
-        return multi_dict
+        return {"NR": multi_dict}
 
     def check(self, word):
         """
@@ -156,3 +200,169 @@ class PosNR(object):
             elif lastch:
                 return False
         return True
+
+    @classmethod
+    def _get_number_token(cls):
+        """
+        수사 조각을 첫 음절로 묶은 dict, 같은 첫 음절의 조각은 긴 조각부터 둔다.
+        (ex : {"한": (("한두", RANGE, [1, 2]), ("한", PURE, 1)), ...})
+        조각이 대부분 한 음절이라서 Trie 를 따라가는 것보다 빠르다.
+        """
+        number_token = cls._number_token
+        if number_token is not None:
+            return number_token
+        token_dict = {}
+        for (number_dict, kind) in [
+                (cls._HANJA_NUMBER, _TOKEN_DIGIT),
+                (cls._HANJA_ZERO, _TOKEN_DIGIT),
+                (cls._PURE_KOR_NUMBER, _TOKEN_PURE),
+                (cls._PURE_KOR_NUMBER_TEN, _TOKEN_PURE_TEN),
+                (cls._PURE_KOR_NUMBERS, _TOKEN_RANGE)]:
+            for word, value in number_dict.items():
+                token_dict[word] = (kind, value)
+        for word, value in cls._HANJA_NUMBER_DEC.items():
+            # 십만, 백억 같은 조합은 자리를 하나씩 읽는다.
+            if len(word) == 1:
+                token_dict[word] = (
+                    _TOKEN_UNIT if value < 10000 else _TOKEN_BIG_UNIT, value)
+        for word in cls._HANJA_ORDINAL_PRE:
+            token_dict[word] = (
+                _TOKEN_ORDINAL_PRE if word == u"제" else _TOKEN_APPROX_PRE,
+                None)
+        token_dict[u"첫"] = (_TOKEN_FIRST, 1)
+        for word in cls._PURE_KOR_POSTFIX:
+            token_dict[word] = (_TOKEN_POSTFIX, None)
+        number_token = {}
+        for word in sorted(token_dict, key=len, reverse=True):
+            number_token.setdefault(word[0], []).append(
+                (word,) + token_dict[word])
+        number_token = dict((ch, tuple(token_list))
+                            for ch, token_list in number_token.items())
+        cls._number_token = number_token
+        return number_token
+
+    def parse(self, word, start=0):
+        """
+        word 의 start 위치에서 시작하는 수사를 찾아서 값을 구한다.
+
+        수사 조각 사전에서 가장 긴 조각을 찾으면서 왼쪽에서 오른쪽으로 한번만 읽는다.
+        한자어(이천이십), 한자어 + 고유어(백만스물하나), 서수(스물다섯째, 제삼),
+        범위(한두), 어림수(수천만)를 처리한다.
+        수사 뒤에 다른 글자가 있으면 수사가 끝나는 위치까지만 찾는다.(ex : 삼십만원)
+
+        Args :
+            word (str) : 단어(형태소, 어절)
+            start (int) : 수사가 시작하는 위치
+        Returns:
+            NumeralMatch or None
+            ex) parse("삼십만원") => NumeralMatch(start=0, end=3, value=300000,
+                max_value=300000, ordinal=False)
+        """
+        number_token = self._get_number_token()
+        total = 0           # 큰 자리(만, 억, ...)까지 읽은 값
+        section = 0         # 마지막 큰 자리 뒤의 값
+        digit = None        # 아직 자리가 붙지 않은 한자어 숫자
+        unit = None         # section 의 마지막 자리(십, 백, 천)
+        big_unit = None     # 마지막 큰 자리
+        pure = 0            # 고유어 값
+        pure_state = 0      # 고유어 0 : 없음, 1 : 십의 자리까지, 2 : 일의 자리까지
+        range_size = 0      # 범위 수사의 큰 값 - 작은 값
+        prefix = None       # 접두사 조각 종류
+        numeric = False     # 숫자 조각을 읽었는지
+        ordinal = False
+        # 수사가 끝날 수 있는 마지막 위치와 그 때의 (값, 서수 여부)
+        best_end = None
+        best_state = None
+        index = start
+        word_len = len(word)
+        while index < word_len:
+            token_list = number_token.get(word[index])
+            if token_list is None:
+                break
+            for (token_word, kind, value) in token_list:
+                if word.startswith(token_word, index):
+                    break
+            else:
+                break
+            end = index + len(token_word)
+
+            if kind in (_TOKEN_ORDINAL_PRE, _TOKEN_APPROX_PRE, _TOKEN_FIRST):
+                if index != start:
+                    break
+                prefix = kind
+                ordinal = kind == _TOKEN_ORDINAL_PRE
+            elif kind == _TOKEN_POSTFIX:
+                if pure_state == 0 and prefix != _TOKEN_FIRST:
+                    break
+                if prefix == _TOKEN_FIRST:
+                    (pure, numeric) = (1, True)
+                ordinal = True
+            elif kind in (_TOKEN_DIGIT, _TOKEN_UNIT, _TOKEN_BIG_UNIT):
+                if pure_state or prefix == _TOKEN_FIRST:
+                    break
+                if kind == _TOKEN_DIGIT:
+                    if digit is not None or prefix == _TOKEN_APPROX_PRE:
+                        break
+                    digit = value
+                elif kind == _TOKEN_UNIT:
+                    if unit is not None and value >= unit:
+                        break
+                    section += (1 if digit is None else digit) * value
+                    (digit, unit) = (None, value)
+                else:
+                    if big_unit is not None and value >= big_unit:
+                        break
+                    section += digit or 0
+                    total += (section or 1) * value
+                    (section, digit, unit, big_unit) = (0, None, None, value)
+                numeric = True
+            else:
+                # 고유어는 한자어 숫자 뒤, 접두사 뒤에 올 수 없다.
+                if digit is not None or prefix is not None:
+                    break
+                if kind == _TOKEN_PURE_TEN:
+                    if pure_state:
+                        break
+                    pure_state = 1
+                    pure += value
+                else:
+                    if pure_state == 2:
+                        break
+                    pure_state = 2
+                    if kind == _TOKEN_RANGE:
+                        pure += value[0]
+                        range_size = value[-1] - value[0]
+                        # 범위 서수사(ex : 네다섯째)
+                        ordinal = token_word[-1] in self._PURE_KOR_POSTFIX
+                    else:
+                        pure += value
+                numeric = True
+
+            index = end
+            if numeric:
+                best_end = index
+                best_state = (total + section + (digit or 0) + pure, ordinal)
+            # 서수 접미사 뒤에는 수사가 이어지지 않는다.
+            if ordinal and kind in (_TOKEN_POSTFIX, _TOKEN_RANGE):
+                break
+        if best_end is None:
+            return None
+        (number, ordinal) = best_state
+        if prefix == _TOKEN_APPROX_PRE:
+            return NumeralMatch(start, best_end, None, None, ordinal)
+        return NumeralMatch(start, best_end, number, number + range_size,
+                            ordinal)
+
+    def parse_many(self, word_list):
+        """
+        여러 단어(token 리스트)의 수사를 찾는다.
+
+        Args :
+            word_list (iterable) : 단어 iterable
+        Returns:
+            단어마다 parse(word) 의 결과 리스트, 수사로 시작하지 않는 단어는 None
+            ex) parse_many(["이천이십", "년"]) => [NumeralMatch(0, 4, 2020, 2020,
+                False), None]
+        """
+        parse = self.parse
+        return [parse(word) for word in word_list]
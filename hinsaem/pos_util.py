@@ -6,6 +6,7 @@ pos_util
 
 이 모듈은 Krcorpus에서 형태소 관련 도음 기능을 모아둔 부분이다.
 """
+from .config import CONFIG
 
 
 def postag_str(postag_tuple):
@@ -49,6 +50,27 @@ def union_meta(meta_left, meta_right):
     return new_meta
 
 
+def meta_freq(meta, register=None, default=0.0):
+    """
+    meta 정보의 빈도(만분율)를 리턴한다.
+
+    Args :
+        meta : meta 정보(dict, PosInfo), 없으면 None
+        register : 빈도 종류("spoken" 또는 "writing"),
+            None 이면 CONFIG["freq_register"]
+        default : 빈도가 없을 때 리턴하는 값
+    Returns:
+        빈도(float) 또는 default
+    """
+    if meta is None:
+        return default
+    if register is None:
+        register = CONFIG.get("freq_register", "writing")
+    if register not in meta:
+        return default
+    return float(meta[register])
+
+
 def postag_left_check(pos_list, left_str):
     """ Testcase 에서 형태소와 품사를 확인할 때 여러 후보군 때문에 재대로된 테스트를 못하는 문제를
     해결하기 위해 만들어진 함수
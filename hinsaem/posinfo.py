@@ -0,0 +1,142 @@
+"""posinfo(형태소 사전 항목 정보) Module
+
+이 모듈은 어미 사전(E.tsv), 조사 사전(J.tsv) 항목의 정보(pos, pos2, phoneme)를
+담는 PosInfo 를 담당한다.
+
+* 같은 (pos, pos2, phoneme) 의 PosInfo 는 프로세스에 하나만 만든다.(intern)
+  사전 항목이 수천개라도 서로 다른 PosInfo 는 수백개이다.
+* pos, phoneme 은 작은 정수 code(pos_code, phoneme_code)로도 가지고 있다.
+* 변경할 수 없고, hash 값을 미리 계산해 두어서 set, dict key 로 바로 사용한다.
+* 이전의 posinfo dict 처럼 posinfo["pos"] 형태로도 읽을 수 있다.
+
+"""
+import threading
+from .eumjeol_util import compile_phoneme
+
+#: pos code 표, 사전에 다른 pos 가 있으면 뒤에 추가한다.
+POS_LIST = ["", "EC", "EF", "EP", "ETM", "ETN",
+            "JKS", "JKC", "JKG", "JKO", "JKB", "JKV", "JKQ", "JC", "JX",
+            "JSE", "VCP", "VCN"]
+#: phoneme code 표, 사전에 다른 phoneme 이 있으면 뒤에 추가한다.
+PHONEME_LIST = ["NUL"]
+
+_POS_CODE = {pos: code for code, pos in enumerate(POS_LIST)}
+_PHONEME_CODE = {phoneme: code for code, phoneme in enumerate(PHONEME_LIST)}
+
+# {(pos, pos2, phoneme): PosInfo}
+_interned = {}
+_lock = threading.Lock()
+
+
+def _get_code(code_dict, code_list, value):
+    """ value 의 code, 없으면 code_list 뒤에 추가한다. lock 안에서 호출한다. """
+    code = code_dict.get(value)
+    if code is None:
+        code = len(code_list)
+        code_list.append(value)
+        code_dict[value] = code
+    return code
+
+
+class PosInfo(object):
+    """
+    사전 항목 정보, PosInfo(pos, pos2, phoneme) 는 같은 값이면 같은 객체를 리턴한다.
+
+    Attributes :
+        pos (str) : 품사(ex : "EC")
+        pos2 (str) : 복합형태소 태깅(ex : "으랬/EP+니/EC"), 없으면 ""
+        phoneme (str) : 앞 음절 음운 제약(ex : "VO|LQ")
+        phoneme_mask (int) : compile_phoneme 으로 미리 compile 한 phoneme 제약
+        pos_code (int) : POS_LIST 의 pos index
+        phoneme_code (int) : PHONEME_LIST 의 phoneme index
+    """
+    __slots__ = ("pos", "pos2", "phoneme", "phoneme_mask",
+                 "pos_code", "phoneme_code", "_hash")
+
+    #: posinfo["key"] 로 읽을 수 있는 key, 이전 posinfo dict 의 key 와 같다.
+    #: phoneme_mask 는 phoneme 에서 만든 값이므로 속성으로만 읽는다.
+    KEYS = ("pos", "pos2", "phoneme")
+
+    def __new__(cls, pos, pos2, phoneme):
+        key = (pos, pos2, phoneme)
+        posinfo = _interned.get(key)
+        if posinfo is not None:
+            return posinfo
+
+        with _lock:
+            posinfo = _interned.get(key)
+            if posinfo is None:
+                posinfo = object.__new__(cls)
+                setter = object.__setattr__
+                setter(posinfo, "pos", pos)
+                setter(posinfo, "pos2", pos2)
+                setter(posinfo, "phoneme", phoneme)
+                setter(posinfo, "phoneme_mask", compile_phoneme(phoneme))
+                setter(posinfo, "pos_code",
+                       _get_code(_POS_CODE, POS_LIST, pos))
+                setter(posinfo, "phoneme_code",
+                       _get_code(_PHONEME_CODE, PHONEME_LIST, phoneme))
+                setter(posinfo, "_hash", hash(key))
+                _interned[key] = posinfo
+        return posinfo
+
+    def __setattr__(self, name, value):
+        raise AttributeError("PosInfo is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("PosInfo is immutable")
+
+    def __reduce__(self):
+        # unpickle 할 때도 intern 된 객체를 사용한다.
+        return (PosInfo, (self.pos, self.pos2, self.phoneme))
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if isinstance(other, PosInfo):
+            return (self.pos, self.pos2, self.phoneme) ==\
+                (other.pos, other.pos2, other.phoneme)
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    def __getitem__(self, key):
+        if key not in self.KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key):
+        return key in self.KEYS
+
+    def get(self, key, default=None):
+        if key not in self.KEYS:
+            return default
+        return getattr(self, key)
+
+    def keys(self):
+        return self.KEYS
+
+    def items(self):
+        return tuple((key, getattr(self, key)) for key in self.KEYS)
+
+    def to_dict(self):
+        """ 이전 posinfo 형식의 dict """
+        return dict(self.items())
+
+    def __repr__(self):
+        return "PosInfo(pos=%r, pos2=%r, phoneme=%r)" % (
+            self.pos, self.pos2, self.phoneme)
+
+
+def interned_count():
+    """ 지금까지 만든 PosInfo 수 """
+    return len(_interned)
@@ -0,0 +1,80 @@
+"""prefix_trie(정방향 접두 Trie) Module
+
+이 모듈은 복합명사 분리처럼 어절의 각 위치에서 시작하는 사전 단어를 찾기 위해
+단어를 앞에서부터 저장한 Trie 를 담당한다.
+
+suffix_trie.SuffixTrie 와 같은 구조이고, 방향만 반대이다.
+어절의 한 위치에서 시작하는 사전 단어를 모두 찾을 때 부분 문자열을 잘라서 사전을
+조회하는 대신, 그 위치부터 오른쪽으로 한번만 따라간다.
+
+"""
+
+
+class PrefixTrie(object):
+    """
+    단어를 앞에서부터 저장한 Trie
+
+    각 node 는 {음절: 자식 node} 형태의 dict 이고,
+    단어가 끝나는 node 에는 None key 에 (단어, 값) 이 저장된다.
+    """
+
+    def __init__(self, word_dict=None):
+        """
+        Args :
+            word_dict (dict) : {단어: 값} 형태의 사전(ex : {"사람": [pos, ...]})
+        """
+        self._root = {}
+        self.max_len = 0
+        if word_dict is not None:
+            for word, value in word_dict.items():
+                self.add(word, value)
+
+    def add(self, word, value):
+        node = self._root
+        for ch in word:
+            child = node.get(ch)
+            if child is None:
+                child = {}
+                node[ch] = child
+            node = child
+        node[None] = (word, value)
+        if len(word) > self.max_len:
+            self.max_len = len(word)
+
+    def get(self, word, default=None):
+        """ 사전에 있는 단어의 값, 없으면 default """
+        node = self._root
+        for ch in word:
+            node = node.get(ch)
+            if node is None:
+                return default
+        terminal = node.get(None)
+        if terminal is None:
+            return default
+        return terminal[1]
+
+    def __contains__(self, word):
+        return self.get(word) is not None
+
+    def iter_prefix(self, word, start=0):
+        """
+        word 의 start 위치부터 오른쪽으로 따라가면서 사전에 있는 단어를 찾는다.
+
+        Args :
+            word (str) : 어절
+            start (int) : 사전 단어가 시작하는 위치
+        Returns:
+            (end, prefix, value) 를 짧은 단어부터 차례로 yield 한다.
+            end : word 에서 사전 단어가 끝나는 위치, word[start:end] == prefix
+            prefix : 사전의 단어
+            value : 사전의 값
+            ex) iter_prefix("국어사전을") => (2, "국어", ...), (4, "국어사전", ...)
+        """
+        node = self._root
+        for index in range(start, len(word)):
+            node = node.get(word[index])
+            if node is None:
+                return
+            terminal = node.get(None)
+            if terminal is not None:
+                yield (index + 1, terminal[0], terminal[1])
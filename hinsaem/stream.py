@@ -0,0 +1,195 @@
+"""stream(말뭉치 스트리밍 분석) Module
+
+이 모듈은 큰 말뭉치를 한 줄씩 읽어서 문장으로 나누고, 형태소 분석 결과를 바로바로
+TSV 또는 JSONL 로 출력하는 기능을 담당한다.
+전체 결과를 리스트로 모으지 않기 때문에 말뭉치 크기와 관계없이 메모리 사용량이 일정하다.
+
+사용법::
+
+    python -m hinsaem.main corpus.txt -o corpus.tsv
+    cat corpus.txt | python -m hinsaem.main -f jsonl -w 4 > corpus.jsonl
+    python -m hinsaem.main corpus.txt -w 8 -m thread -o corpus.tsv
+
+출력 형식
+1. TSV : 어절마다 한 줄(문장번호, 어절, 분석결과), 문장 사이에 빈 줄
+2. JSONL : 문장마다 한 줄
+   {"id": 문장번호, "line": 줄번호, "sentence": 문장, "result": 어절별 분석결과}
+
+"""
+import io
+import re
+import sys
+import json
+import argparse
+import collections
+from .config import CONFIG
+
+FORMAT_LIST = ["tsv", "jsonl"]
+
+_SENTENCE_SPLIT_RE = re.compile(
+    "(?<=[%s])\\s+" % re.escape("".join(CONFIG["sentence_end_mark"])))
+
+
+def split_sentences(line):
+    """
+    한 줄을 문장으로 나눈다. 종료문장기호(. ! ?) 뒤의 공백에서 나누고,
+    어절 사이의 연속된 공백은 하나로 합친다.
+
+    Args :
+        line (str) : 입력 한 줄
+    Returns:
+        문장 리스트, ex) "가자. 빨리 와!" => ["가자.", "빨리 와!"]
+    """
+    sentence_list = []
+    for sentence in _SENTENCE_SPLIT_RE.split(line.strip()):
+        sentence = " ".join(sentence.split())
+        if sentence != "":
+            sentence_list.append(sentence)
+    return sentence_list
+
+
+def iter_sentences(lines):
+    """
+    줄 단위 입력에서 문장을 하나씩 돌려준다.
+
+    Args :
+        lines (iterable) : 줄 단위 입력(file object 등)
+    Returns:
+        (generator) (줄번호, 문장), 줄번호는 1부터 시작한다.
+    """
+    for line_no, line in enumerate(lines, 1):
+        for sentence in split_sentences(line):
+            yield (line_no, sentence)
+
+
+def tag_lines(hinsaem, lines, workers=1, chunksize=64, mode=None):
+    """
+    줄 단위 입력을 문장으로 나누어 형태소 분석한다.
+
+    분석은 Hinsaem.analyze_many 로 하고, 입력은 분석 중인 chunk 만큼만 미리 읽는다.
+
+    Args :
+        hinsaem (Hinsaem) : 형태소 분석기
+        lines (iterable) : 줄 단위 입력(file object 등)
+        workers (int) : analyze_many 의 worker 프로세스 수
+        chunksize (int) : analyze_many 의 chunk 크기
+        mode (str) : analyze_many 의 mode("process", "thread", "auto")
+    Returns:
+        (generator) (문장번호, 줄번호, 문장, 어절별 분석결과)
+    """
+    # analyze_many 에 넘긴 문장 중 아직 결과가 나오지 않은 문장
+    pending = collections.deque()
+
+    def _sentence_iter():
+        for line_no, sentence in iter_sentences(lines):
+            pending.append((line_no, sentence))
+            yield sentence
+
+    result_iter = hinsaem.analyze_many(
+        _sentence_iter(), workers=workers, chunksize=chunksize, mode=mode)
+    for sen_id, result in enumerate(result_iter, 1):
+        (line_no, sentence) = pending.popleft()
+        yield (sen_id, line_no, sentence, result)
+
+
+def _analysis_str(pos_info):
+    """ 어절 분석결과를 TSV 한 칸으로 만든다. (ex : ["사람", "NNG"] => 사람/NNG) """
+    if not pos_info:
+        return ""
+    # lattice 분석결과(["사람/NNG + 은/JX", ...])는 pos 에 "/" 가 있다.
+    if (len(pos_info) == 2 and "/" not in pos_info[1] and
+            all(isinstance(item, str) for item in pos_info)):
+        return pos_info[0] + "/" + pos_info[1]
+    return json.dumps(pos_info, ensure_ascii=False)
+
+
+def format_tsv(tagged):
+    """ tag_lines 의 결과 하나를 TSV 문자열로 만든다. """
+    (sen_id, _, sentence, result) = tagged
+    line_list = []
+    for eojeol, pos_info in zip(sentence.split(" "), result):
+        line_list.append("%d\t%s\t%s\n" % (
+            sen_id, eojeol, _analysis_str(pos_info)))
+    line_list.append("\n")
+    return "".join(line_list)
+
+
+def format_jsonl(tagged):
+    """ tag_lines 의 결과 하나를 JSONL 한 줄로 만든다. """
+    (sen_id, line_no, sentence, result) = tagged
+    return json.dumps({"id": sen_id, "line": line_no, "sentence": sentence,
+                       "result": result}, ensure_ascii=False) + "\n"
+
+
+_FORMATTER = {"tsv": format_tsv, "jsonl": format_jsonl}
+
+
+def tag_file(hinsaem, in_fp, out_fp, fmt="tsv", workers=1, chunksize=64,
+             mode=None):
+    """
+    in_fp 를 읽어서 분석결과를 out_fp 에 바로바로 쓴다.
+
+    Args :
+        hinsaem (Hinsaem) : 형태소 분석기
+        in_fp : 입력 file object
+        out_fp : 출력 file object
+        fmt (str) : 출력 형식, "tsv" 또는 "jsonl"
+        workers (int) : analyze_many 의 worker 프로세스 수
+        chunksize (int) : analyze_many 의 chunk 크기
+        mode (str) : analyze_many 의 mode("process", "thread", "auto")
+    Returns:
+        분석한 문장 수
+    """
+    if fmt not in _FORMATTER:
+        raise ValueError("unknown format : %s" % fmt)
+    formatter = _FORMATTER[fmt]
+    count = 0
+    for tagged in tag_lines(hinsaem, in_fp, workers, chunksize, mode):
+        out_fp.write(formatter(tagged))
+        count += 1
+    return count
+
+
+def main(argv=None):
+    """ 명령행 실행, 입력이 "-" 이면 stdin 을 읽고, 출력이 없으면 stdout 에 쓴다. """
+    from .main import Hinsaem
+
+    parser = argparse.ArgumentParser(
+        prog="python -m hinsaem.main",
+        description="Hinsaem Pos Tagger : corpus streaming tagger")
+    parser.add_argument("input", nargs="?", default="-",
+                        help="input text file (default: stdin)")
+    parser.add_argument("-o", "--output", default="-",
+                        help="output file (default: stdout)")
+    parser.add_argument("-f", "--format", default="tsv", choices=FORMAT_LIST)
+    parser.add_argument("-w", "--workers", type=int, default=1)
+    parser.add_argument("-c", "--chunksize", type=int, default=64)
+    parser.add_argument("-m", "--mode", default=None,
+                        choices=["process", "thread", "auto"],
+                        help="worker type (default: analyze_many_mode config)")
+    args = parser.parse_args(argv)
+
+    if args.input == "-":
+        in_fp = io.TextIOWrapper(sys.stdin.buffer, encoding="UTF-8")
+    else:
+        in_fp = open(args.input, "r", encoding="UTF-8")
+    if args.output == "-":
+        out_fp = io.TextIOWrapper(sys.stdout.buffer, encoding="UTF-8",
+                                  newline="\n")
+    else:
+        out_fp = open(args.output, "w", encoding="UTF-8", newline="\n")
+
+    try:
+        hinsaem = Hinsaem()
+        return tag_file(hinsaem, in_fp, out_fp, args.format,
+                        args.workers, args.chunksize, args.mode)
+    finally:
+        out_fp.flush()
+        if args.input != "-":
+            in_fp.close()
+        if args.output != "-":
+            out_fp.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""suffix_trie(역방향 접미 Trie) Module
+
+이 모듈은 어미, 조사처럼 어절의 끝에 붙는 형태소를 찾기 위해 단어를 뒤에서부터
+저장한 Trie 를 담당한다.
+
+어절의 모든 분리 위치마다 부분 문자열을 잘라서 사전을 조회하는 대신, 어절을 오른쪽에서
+왼쪽으로 한번만 따라가면서 사전에 있는 접미 단어를 모두 찾는다.
+Trie 의 첫 단계(root 의 자식)는 사전 단어의 마지막 음절 집합이므로 따로 마지막 음절 Set 을
+만들지 않아도 된다.
+
+mmap 사전(lexicon_store)을 사용할 때는 단어만 저장한 Trie(keys_only)를 만들고,
+값은 bind 한 mmap 사전에서 읽는다. 그래서 프로세스마다 사전 값을 Python 객체로 만들지 않는다.
+
+"""
+
+
+class SuffixTrie(object):
+    """
+    단어를 뒤에서부터 저장한 Trie
+
+    각 node 는 {음절: 자식 node} 형태의 dict 이고,
+    단어가 끝나는 node 에는 None key 에 (단어, 값) 이 저장된다.
+    """
+
+    def __init__(self, word_dict=None):
+        """
+        Args :
+            word_dict (dict) : {단어: 값} 형태의 사전(ex : {"는": [posinfo, ...]})
+        """
+        self._root = {}
+        # 값을 저장하지 않은 Trie 는 값을 이 사전에서 읽는다.
+        self._lexicon = None
+        if word_dict is not None:
+            for word, value in word_dict.items():
+                self.add(word, value)
+
+    # 사전 캐시에 저장할 때 bind 한 사전은 저장하지 않는다.
+    def __getstate__(self):
+        return {"_root": self._root}
+
+    def __setstate__(self, state):
+        self._root = state["_root"]
+        self._lexicon = None
+
+    def keys_only(self):
+        """ 같은 단어를 저장하고 값은 저장하지 않은 Trie, bind 한 후에 사용한다. """
+        trie = SuffixTrie()
+        for (word, _) in self.iter_terminal():
+            trie.add(word, None)
+        return trie
+
+    def bind(self, lexicon):
+        """
+        keys_only Trie 의 값을 읽을 사전을 지정한다.
+
+        Args :
+            lexicon : {단어: 값} 형태로 조회할 수 있는 사전(ex : MmapLexicon)
+        """
+        self._lexicon = lexicon
+        return self
+
+    def iter_terminal(self):
+        """ 저장한 (단어, 값) 을 모두 yield 한다. """
+        node_list = [self._root]
+        while node_list:
+            node = node_list.pop()
+            for ch, child in node.items():
+                if ch is None:
+                    yield child
+                else:
+                    node_list.append(child)
+
+    def add(self, word, value):
+        node = self._root
+        for ch in reversed(word):
+            child = node.get(ch)
+            if child is None:
+                child = {}
+                node[ch] = child
+            node = child
+        node[None] = (word, value)
+
+    def __contains__(self, last_char):
+        """ 사전 단어 중 last_char 로 끝나는 단어가 있는지 검사한다. """
+        return last_char is not None and last_char in self._root
+
+    def iter_suffix(self, word, min_index=0):
+        """
+        word 를 오른쪽부터 따라가면서 사전에 있는 접미 단어를 찾는다.
+
+        Args :
+            word (str) : 어절
+            min_index (int) : 접미 단어가 시작할 수 있는 가장 작은 index
+        Returns:
+            (index, suffix, value) 를 짧은 접미 단어부터 차례로 yield 한다.
+            index : word 에서 접미 단어가 시작하는 위치, word[index:] == suffix
+            suffix : 사전의 단어
+            value : 사전의 값
+            ex) iter_suffix("사람에게") => (3, "게", ...), (2, "에게", ...)
+        """
+        node = self._root
+        lexicon = self._lexicon
+        for index in range(len(word) - 1, min_index - 1, -1):
+            node = node.get(word[index])
+            if node is None:
+                return
+            terminal = node.get(None)
+            if terminal is not None:
+                if lexicon is None:
+                    yield (index, terminal[0], terminal[1])
+                else:
+                    yield (index, terminal[0], lexicon[terminal[0]])
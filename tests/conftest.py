@@ -0,0 +1,81 @@
+import pathmagic  # noqa
+from hinsaem.config import CONFIG
+from hinsaem import eojeol_cache
+from hinsaem import Hinsaem
+from hinsaem.pos_n0 import PosN0
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def clear_eojeol_cache():
+    """
+    어절 분석결과 캐시는 같은 class 의 분석기끼리 공유하므로,
+    테스트마다 다른 임시 사전을 사용해도 결과가 섞이지 않도록 비운다.
+    """
+    eojeol_cache.reset()
+    yield
+    eojeol_cache.reset()
+
+
+@pytest.fixture
+def write_dict(tmpdir, monkeypatch):
+    """
+    임시 사전 파일을 만들고 CONFIG 가 그 파일을 사용하게 하는 함수를 돌려준다.
+
+    write_dict({CONFIG key: 사전 내용, ...})
+    체언 사전(PosN0._DICT_FILE_LIST) 중 주지 않은 사전은 헤더만 있는 파일로 만든다.
+    """
+    def _write_dict(text_dict):
+        text_dict = dict(text_dict)
+        for (_, config_key) in PosN0._DICT_FILE_LIST:
+            text_dict.setdefault(config_key, u"word\tpos\tcategory\r\n")
+        for config_key, text in text_dict.items():
+            file_path = tmpdir.join(config_key + ".tsv")
+            file_path.write_text(text, encoding="UTF-8")
+            monkeypatch.setitem(CONFIG, config_key, str(file_path))
+        monkeypatch.setitem(
+            CONFIG, "res_dict_cache", str(tmpdir.join("cache")))
+        monkeypatch.setitem(CONFIG, "multiprocess_count", 1)
+    return _write_dict
+
+
+@pytest.fixture
+def hinsaem(write_dict):
+    """ 단일어만 있는 작은 형태소 사전으로 분석기를 만든다. """
+    write_dict({"res_dict_01":
+                u"word\tmorpheme\n사람\tNNG\n학교\tNNG\n빨리\tMAG\n"})
+    return Hinsaem()
+
+
+@pytest.fixture
+def sentence_list():
+    """ hinsaem 사전의 단어로 만든 문장 리스트 """
+    return [u"사람", u"학교 사람", u"빨리 학교", u"사람 빨리 학교", u"학교"] * 7
+
+
+@pytest.fixture
+def noun_hinsaem(write_dict):
+    """ 작은 형태소 사전, 체언 사전으로 분석기를 만든다. """
+    write_dict({
+        "res_dict_01": u"word\tmorpheme\n빨리\tMAG\n먹\tVV\n가\tVV\n"
+                       u"가\tJKS\n",
+        "res_dict_nng01": u"word\tpos\tcategory\n사람\tNNG\t\n"
+                          u"학교\tNNG\t\n국어\tNNG\t\n사전\tNNG\t\n"
+                          u"국어사전\tNNG\t\n",
+        "res_dict_nnp": u"word\tpos\tcategory\n서울\tncn\t지명\n",
+        "res_dict_n_": u"word\tpos\ttag\n개\tNNU\t\n",
+    })
+    return Hinsaem()
+
+
+@pytest.fixture
+def make_pos_n0(write_dict):
+    """
+    체언 사전 내용으로 PosN0 를 만드는 함수를 돌려준다.
+
+    make_pos_n0({CONFIG key: 사전 내용, ...})
+    """
+    def _make_pos_n0(text_dict):
+        write_dict(text_dict)
+        return PosN0()
+    return _make_pos_n0
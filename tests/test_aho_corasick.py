@@ -0,0 +1,113 @@
+import pathmagic  # noqa
+import os
+import pickle
+import random
+from hinsaem.config import CONFIG
+from hinsaem import lexicon_registry
+from hinsaem.aho_corasick import AhoCorasick
+from hinsaem.pos_n0 import PosN0, NounMatch
+import pytest
+import logging
+logging.basicConfig(level=logging.DEBUG)
+log = logging.getLogger('test')
+
+
+def setup_function():
+    log.debug("==== START " + __package__ + "::" + __name__ + " ====")
+
+
+def teardown_function():
+    log.debug("==== END ====")
+
+
+def _brute_force(word_dict, text):
+    match_list = []
+    for end in range(1, len(text) + 1):
+        for start in range(end):
+            if text[start:end] in word_dict:
+                match_list.append((start, end, text[start:end],
+                                   word_dict[text[start:end]]))
+    return sorted(match_list)
+
+
+def test_0001_iter_match():
+    """ 어절 안에 들어 있는 단어, 겹치는 단어를 모두 찾는다. """
+    word_dict = {u"서울": 1, u"대학교": 2, u"서울대학교": 3, u"학교": 4}
+    automaton = AhoCorasick(word_dict)
+    assert len(automaton) == 4
+    assert list(automaton.iter_match(u"서울대학교")) == [
+        (0, 2, u"서울", 1), (0, 5, u"서울대학교", 3), (2, 5, u"대학교", 2),
+        (3, 5, u"학교", 4)]
+    assert list(automaton.iter_match(u"서울 대학교")) == [
+        (0, 2, u"서울", 1), (3, 6, u"대학교", 2), (4, 6, u"학교", 4)]
+    # 공백을 건너뛰면 어절 경계에 걸친 단어도 찾는다.
+    assert (0, 6, u"서울대학교", 3) in list(
+        automaton.iter_match(u"서울 대학교", ignore_space=True))
+    assert list(AhoCorasick({}).iter_match(u"서울")) == []
+
+
+def test_0002_brute_force():
+    """ 부분 문자열을 모두 조회한 결과와 같다. """
+    rand = random.Random(0)
+    alphabet = u"가나다라"
+    word_dict = {}
+    for index in range(200):
+        word = u"".join(rand.choice(alphabet)
+                        for _ in range(rand.randint(1, 5)))
+        word_dict[word] = index
+    automaton = AhoCorasick(word_dict)
+    for _ in range(50):
+        text = u"".join(rand.choice(alphabet) for _ in range(30))
+        assert sorted(automaton.iter_match(text)) == \
+            _brute_force(word_dict, text)
+
+    # pickle 해도 같은 결과
+    automaton2 = pickle.loads(pickle.dumps(automaton))
+    assert list(automaton2.iter_match(text)) == \
+        list(automaton.iter_match(text))
+
+
+@pytest.fixture
+def pos_n0(make_pos_n0, monkeypatch):
+    """ 작은 체언 사전으로 분석기를 만든다. """
+    monkeypatch.setitem(CONFIG, "dict_cache", True)
+    return make_pos_n0({
+        "res_dict_nng01": u"word\tpos\tcategory\r\n대학교\tNNG\t\t\r\n",
+        "res_dict_nnp": u"word\tpos\tcategory\r\n서울\tncn\t지명\t\r\n"
+                        u"서울대학교\tncn\t기관명\t\r\n"
+                        u"서울\tncn\t책명\t\r\n",
+    })
+
+
+def test_0003_scan_nouns(pos_n0):
+    """ 단어마다 pos, category 를 돌려준다. """
+    match_list = pos_n0.scan_nouns(u"서울대학교 word 서울")
+    assert match_list == [
+        NounMatch(0, 2, u"서울", "NNP", u"지명"),
+        NounMatch(0, 2, u"서울", "NNP", u"책명"),
+        NounMatch(0, 5, u"서울대학교", "NNP", u"기관명"),
+        NounMatch(2, 5, u"대학교", "NNG", u""),
+        NounMatch(11, 13, u"서울", "NNP", u"지명"),
+        NounMatch(11, 13, u"서울", "NNP", u"책명")]
+    assert [match.word for match in pos_n0.scan_nouns(
+        u"서울 대학교", ignore_space=True)] == \
+        [u"서울", u"서울", u"서울대학교", u"대학교"]
+
+
+def test_0004_scan_nouns_cache(pos_n0, monkeypatch):
+    """ automaton 은 사전 캐시에 저장하고, 다음 로딩 때는 캐시를 읽는다. """
+    # 내용이 같은 사전을 이전 test 에서 등록했을 수 있다.
+    lexicon_registry.reload(force=True)
+    expect = pos_n0.scan_nouns(u"서울대학교")
+    assert os.path.exists(os.path.join(
+        CONFIG["res_dict_cache"], "N0_SCAN.pickle"))
+
+    def _no_build(self):
+        raise AssertionError("automaton built")
+    monkeypatch.setattr(PosN0, "_build_noun_scanner", _no_build)
+    lexicon_registry.reload(force=True)
+    assert PosN0().scan_nouns(u"서울대학교") == expect
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,66 @@
+import pathmagic  # noqa
+from hinsaem.config import CONFIG
+import pytest
+import logging
+logging.basicConfig(level=logging.DEBUG)
+log = logging.getLogger('test')
+
+
+def setup_function():
+    log.debug("==== START " + __package__ + "::" + __name__ + " ====")
+
+
+def teardown_function():
+    log.debug("==== END ====")
+
+
+def test_0001_analyze_many_serial(hinsaem, sentence_list):
+    """ workers=1 이면 현재 프로세스에서 _parse_sen 과 같은 결과 """
+    expect = [hinsaem._parse_sen(sen) for sen in sentence_list]
+    result = list(hinsaem.analyze_many(
+        iter(sentence_list), workers=1, chunksize=4))
+    assert result == expect
+
+
+def test_0002_analyze_many_pool(hinsaem, sentence_list):
+    """ worker 프로세스로 나누어도 입력 순서대로 같은 결과 """
+    expect = [hinsaem._parse_sen(sen) for sen in sentence_list]
+    result = list(hinsaem.analyze_many(
+        iter(sentence_list), workers=2, chunksize=3))
+    assert result == expect
+
+
+def test_0003_analyze_many_report(hinsaem, sentence_list):
+    """ report 모드는 chunk 마다 처리량 정보를 돌려준다. """
+    chunk_list = list(hinsaem.analyze_many(
+        sentence_list, workers=2, chunksize=10, report=True))
+    assert [info["chunk"] for _, info in chunk_list] == [0, 1, 2, 3]
+    assert [info["sentences"] for _, info in chunk_list] == [10, 10, 10, 5]
+    assert sum(info["eojeols"] for _, info in chunk_list) == 63
+    result = [item for result_list, _ in chunk_list for item in result_list]
+    assert result == [hinsaem._parse_sen(sen) for sen in sentence_list]
+
+
+def test_0004_analyze_many_mode(hinsaem, monkeypatch, sentence_list):
+    """ thread, auto 모드도 같은 결과, mode 기본값은 CONFIG 를 따른다. """
+    expect = [hinsaem._parse_sen(sen) for sen in sentence_list]
+    for mode in ["thread", "auto"]:
+        result = list(hinsaem.analyze_many(
+            iter(sentence_list), workers=3, chunksize=4, mode=mode))
+        assert result == expect
+    monkeypatch.setitem(CONFIG, "analyze_many_mode", "thread")
+    assert list(hinsaem.analyze_many(sentence_list, workers=2)) == expect
+    with pytest.raises(ValueError):
+        list(hinsaem.analyze_many(sentence_list, workers=2, mode="gpu"))
+
+
+def test_0005_analyze_many_bad_args(hinsaem, sentence_list):
+    """ 잘못된 인자는 결과를 읽기 전, 호출할 때 바로 오류가 난다. """
+    with pytest.raises(ValueError):
+        hinsaem.analyze_many(sentence_list, chunksize=0)
+    with pytest.raises(ValueError):
+        hinsaem.analyze_many(sentence_list, workers=2, mode="gpu")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
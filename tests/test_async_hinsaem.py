@@ -0,0 +1,90 @@
+import pathmagic  # noqa
+from hinsaem.async_hinsaem import AsyncHinsaem, FLUSH_SIZE, FLUSH_TIME
+import time
+import asyncio
+import pytest
+import logging
+logging.basicConfig(level=logging.DEBUG)
+log = logging.getLogger('test')
+
+
+def setup_function():
+    log.debug("==== START " + __package__ + "::" + __name__ + " ====")
+
+
+def teardown_function():
+    log.debug("==== END ====")
+
+
+def test_0001_tag_thread(hinsaem, sentence_list):
+    """ 동시에 들어온 요청을 batch 로 모아서 분석하고 요청마다 결과를 돌려준다. """
+    async def _run():
+        async with AsyncHinsaem(workers=2, max_batch=8, max_wait=0.05,
+                                mode="thread") as async_hinsaem:
+            result = await async_hinsaem.tag_many(sentence_list)
+            return (result, async_hinsaem.stats())
+
+    (result, stats) = asyncio.run(_run())
+    assert result == [hinsaem._parse_sen(sen) for sen in sentence_list]
+    assert stats["sentences"] == len(sentence_list)
+    assert stats["batches"] < len(sentence_list)
+    assert stats["max_batch_size"] <= 8
+    assert stats["flush"][FLUSH_SIZE] >= 4
+    assert sum(size * count for size, count in
+               stats["batch_size_hist"].items()) == len(sentence_list)
+    assert stats["queue_depth"] == stats["in_flight"] == 0
+
+
+def test_0002_tag_process(hinsaem, sentence_list):
+    """ 사전을 미리 로딩한 worker 프로세스에서 분석해도 같은 결과 """
+    async def _run():
+        async with AsyncHinsaem(workers=2, max_batch=4,
+                                mode="process") as async_hinsaem:
+            return await async_hinsaem.tag_many(sentence_list)
+
+    assert asyncio.run(_run()) == \
+        [hinsaem._parse_sen(sen) for sen in sentence_list]
+
+
+def test_0003_time_window(hinsaem):
+    """ max_batch 개가 모이지 않으면 max_wait 후에 보내고, 그동안 loop 를 막지 않는다. """
+    async def _run():
+        async with AsyncHinsaem(workers=1, max_batch=100, max_wait=0.05,
+                                mode="thread") as async_hinsaem:
+            task = asyncio.ensure_future(async_hinsaem.tag(u"사람 학교"))
+            await asyncio.sleep(0)
+            queued = async_hinsaem.stats()["queue_depth"]
+            time_stamp_01 = time.perf_counter()
+            result = await task
+            return (result, queued, time.perf_counter() - time_stamp_01,
+                    async_hinsaem.stats())
+
+    (result, queued, elapsed, stats) = asyncio.run(_run())
+    assert result == hinsaem._parse_sen(u"사람 학교")
+    assert queued == 1
+    assert elapsed >= 0.03
+    assert stats["flush"] == {FLUSH_TIME: 1}
+    assert stats["batch_size_hist"] == {1: 1}
+
+
+def test_0004_error_and_close(hinsaem):
+    """ 분석 오류는 요청에 전달되고, close 후에는 요청할 수 없다. """
+    async def _run():
+        async_hinsaem = AsyncHinsaem(workers=1, max_wait=0, mode="thread")
+        with pytest.raises(AttributeError):
+            await async_hinsaem.tag(None)
+        assert await async_hinsaem.tag(u"사람") == \
+            hinsaem._parse_sen(u"사람")
+        await async_hinsaem.close()
+        with pytest.raises(RuntimeError):
+            await async_hinsaem.tag(u"사람")
+
+    asyncio.run(_run())
+    with pytest.raises(ValueError):
+        AsyncHinsaem(max_batch=0)
+    with pytest.raises(ValueError):
+        AsyncHinsaem(mode="gpu")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,119 @@
+import pathmagic  # noqa
+from hinsaem.config import CONFIG
+from hinsaem.candidate import Candidate, top_k
+from hinsaem.posinfo import PosInfo
+from hinsaem.pos_e import PosE
+from hinsaem.pos_j import PosJ
+import pytest
+import logging
+logging.basicConfig(level=logging.DEBUG)
+log = logging.getLogger('test')
+
+
+def setup_function():
+    log.debug("==== START " + __package__ + "::" + __name__ + " ====")
+
+
+def teardown_function():
+    log.debug("==== END ====")
+
+
+def test_0001_candidate():
+    """ 이름, index 로 읽을 수 있고 hash 가능, 변경 불가능 """
+    posinfo = PosInfo("EC", "", "NUL")
+    candidate = Candidate(u"빠르", ((u"고", "EC"),), None, posinfo)
+    assert candidate.left == candidate[0] == u"빠르"
+    (left, postag, mark, meta) = candidate
+    assert meta is posinfo
+    assert len({candidate, Candidate(u"빠르", ((u"고", "EC"),), None,
+                                     posinfo)}) == 1
+    assert hash(Candidate(u"가", ((u"ㅁ", "ETN"),), None, {})) is not None
+    with pytest.raises(AttributeError):
+        candidate.left = u"빠"
+
+
+def test_0002_analyzer():
+    """ PosE, PosJ 는 Candidate 리스트를 리턴한다. """
+    for candidate in PosE().endswithE(u"빠르고"):
+        assert type(candidate) is Candidate
+    for candidate in PosJ().endswithj(u"사람에게"):
+        assert type(candidate) is Candidate
+        assert isinstance(candidate.meta, PosInfo)
+
+
+def test_0003_top_k():
+    """ 빈도가 높은 k 개, 빈도가 같으면 먼저 나온 후보, 중복 제거 """
+    def candidate(left, writing=None):
+        meta = {} if writing is None else {"writing": writing}
+        return Candidate(left, ((u"고", "EC"),), None, meta)
+    candidate_list = [candidate(u"가"), candidate(u"나", 10),
+                      candidate(u"다"), candidate(u"나", 10),
+                      candidate(u"라", 30), candidate(u"마")]
+    assert [item.left for item in top_k(candidate_list, 3)] == \
+        [u"라", u"나", u"가"]
+    assert [item.left for item in top_k(iter(candidate_list), 10)] == \
+        [u"라", u"나", u"가", u"다", u"마"]
+    assert top_k(candidate_list, 1, "spoken")[0].left == u"가"
+    # unique 가 False 이면 중복된 후보도 남긴다.
+    assert [item.left for item in top_k(candidate_list, 3, unique=False)] ==\
+        [u"라", u"나", u"나"]
+    with pytest.raises(ValueError):
+        top_k(candidate_list, 0)
+
+
+def test_0004_beam(monkeypatch):
+    """ endswithE, endswithj 의 k 는 후보를 k 개 이하로 제한한다. """
+    pos_e = PosE()
+    pos_j = PosJ()
+    for (func, eojeol) in [(pos_e.endswithE, u"먹었겠다."),
+                           (pos_e.endswithE, u"그어"),
+                           (pos_j.endswithj, u"사람에게서")]:
+        all_list = func(eojeol)
+        assert len(all_list) > 1
+        for k in [1, 2]:
+            beam_list = func(eojeol, k=k)
+            assert 1 <= len(beam_list) <= k
+            assert set(beam_list) <= set(all_list)
+        # CONFIG["beam_k"] 가 기본값이다.
+        monkeypatch.setitem(CONFIG, "beam_k", 1)
+        assert func(eojeol) == func(eojeol, k=1)
+        monkeypatch.setitem(CONFIG, "beam_k", None)
+        assert func(eojeol) == all_list
+    with pytest.raises(ValueError):
+        pos_e.endswithE(u"먹었다", k=0)
+
+
+def test_0005_beam_prune(monkeypatch):
+    """ beam 모드는 분리 위치마다 k 개만 남기고, 남은 후보만 선어말 어미를 찾는다. """
+    pos_e = PosE(ep_depth=3)
+    left_list = []
+    endswithES = pos_e._endswithES
+
+    def _endswithES(eojeol, mark, pos_filter, beam=None):
+        if pos_filter == pos_e.PRE_EOMI:
+            left_list.append(eojeol)
+        return endswithES(eojeol, mark, pos_filter, beam)
+    monkeypatch.setattr(pos_e, "_endswithES", _endswithES)
+
+    pos_e._endswithE(u"잡으셨겠다.")
+    all_count = len(left_list)
+    del left_list[:]
+    pos_e._endswithE(u"잡으셨겠다.", 3, pos_e._get_beam(1))
+    assert 0 < len(left_list) < all_count
+
+
+def test_0006_beam_unique_check(monkeypatch):
+    """ beam 모드도 _CONFIG_UNIQUE_CHECK 를 따른다. """
+    pos_e = PosE()
+    monkeypatch.setattr(pos_e, "_CONFIG_UNIQUE_CHECK", False)
+    split_list = list(pos_e._iter_split(u"그어", None, pos_e.GROUP_E))
+    candidate_list = [item for split_iter in split_list
+                      for item in split_iter]
+    assert len(candidate_list) > len(set(candidate_list))
+    beam_list = pos_e._endswithES(
+        u"그어", None, pos_e.GROUP_E, pos_e._get_beam(len(candidate_list)))
+    assert len(beam_list) == len(candidate_list)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,85 @@
+import pathmagic  # noqa
+from hinsaem.config import CONFIG
+from hinsaem import Hinsaem
+from hinsaem.pos_n0 import PosN0
+import pytest
+import logging
+logging.basicConfig(level=logging.DEBUG)
+log = logging.getLogger('test')
+
+
+def setup_function():
+    log.debug("==== START " + __package__ + "::" + __name__ + " ====")
+
+
+def teardown_function():
+    log.debug("==== END ====")
+
+
+@pytest.fixture
+def pos_n0(make_pos_n0):
+    """ 작은 체언 사전, 접사 사전으로 분석기를 만든다. """
+    nng_list = [u"사람", u"국어", u"사전", u"국어사전", u"전문가", u"대학교",
+                u"인공", u"지능", u"연구소", u"들"]
+    return make_pos_n0({
+        "res_dict_nng01": u"word\tpos\tcategory\r\n" + u"".join(
+            u"%s\tNNG\t\t\r\n" % word for word in nng_list),
+        "res_dict_nnp": u"word\tpos\tcategory\r\n서울\tNNP\t\t\r\n",
+        "res_dict_n_": u"word\tpos\ttag\r\n들\tXSN\t\r\n님\tXSN\t\r\n"
+                       u"비\tXPN\t\r\n개\tNNU\t\r\n",
+    })
+
+
+def test_0001_comp_noun(pos_n0):
+    """ 사전 단어 하나, 명사 + 명사 """
+    assert pos_n0.isCompNoun(u"국어사전") == [u"국어사전/NNG"]
+    assert pos_n0.isCompNoun(u"서울대학교인공지능연구소") == [
+        u"서울/NNP", u"대학교/NNG", u"인공/NNG", u"지능/NNG", u"연구소/NNG"]
+
+
+def test_0002_comp_noun_affix(pos_n0):
+    """ 접두사는 맨 앞, 접미사는 명사 뒤에만 온다. """
+    assert pos_n0.isCompNoun(u"사람들") == [u"사람/NNG", u"들/XSN"]
+    assert pos_n0.isCompNoun(u"비전문가") == [u"비/XPN", u"전문가/NNG"]
+    # 접두사, 접미사 뒤에는 접미사가 올 수 없다.
+    assert pos_n0.isCompNoun(u"비들") == [u"비/XPN", u"들/NNG"]
+    assert pos_n0.isCompNoun(u"사람들님") == [
+        u"사람/NNG", u"들/NNG", u"님/XSN"]
+    assert pos_n0.isCompNoun(u"사람님님") is None
+    assert pos_n0.isCompNoun(u"들사람") == [u"들/NNG", u"사람/NNG"]
+    assert pos_n0.isCompNoun(u"님사람") is None
+    assert pos_n0.isCompNoun(u"비") is None
+
+
+def test_0003_comp_noun_unknown(pos_n0):
+    """ 사전 단어로 나눌 수 없으면 None """
+    assert pos_n0.isCompNoun(u"사람에게") is None
+    assert pos_n0.isCompNoun(u"") is None
+    assert pos_n0.isCompNoun(u"개") is None, u"NNU 는 복합명사에 쓰지 않는다."
+    assert pos_n0.isCompNoun(u"word") is None, u"사전 파일의 헤더는 단어가 아니다."
+
+
+def test_0004_comp_noun_affix_dict(write_dict):
+    """ res/N_.tsv 의 접사는 사전 단어를 접사로 나누지 않는다. """
+    with open(CONFIG["res_dict_n_"], encoding="UTF-8", newline="") as fp:
+        n_text = fp.read()
+    nng_list = [u"국가", u"학자", u"원인", u"국", u"학", u"원", u"사람"]
+    write_dict({
+        "res_dict_01": u"word\tmorpheme\n빨리\tMAG\n",
+        "res_dict_nng01": u"word\tpos\tcategory\r\n" + u"".join(
+            u"%s\tNNG\t\t\r\n" % word for word in nng_list),
+        "res_dict_n_": n_text,
+    })
+    (pos_n0, hinsaem) = (PosN0(), Hinsaem())
+    for word in [u"국가", u"학자", u"원인"]:
+        assert pos_n0.isCompNoun(word) == [word + u"/NNG"]
+        postag_list = [path.postag_str()
+                       for path in hinsaem.analyze_eojeol(word, k=5)]
+        assert postag_list[0] == word + u"/NNG"
+        assert not [postag for postag in postag_list
+                    if u"/XSN" in postag or u"/XPN" in postag], postag_list
+    assert pos_n0.isCompNoun(u"사람들") == [u"사람/NNG", u"들/XSN"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
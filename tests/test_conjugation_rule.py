@@ -0,0 +1,103 @@
+import pathmagic  # noqa
+import json
+from hinsaem.config import CONFIG
+from hinsaem.conjugation_rule import get_ruleset, compile_rules
+from hinsaem.pos_e import PosE
+from hinsaem.pos_n import PosN
+from hinsaem.pos_util import postag_left_check
+import pytest
+import logging
+logging.basicConfig(level=logging.DEBUG)
+log = logging.getLogger('test')
+
+
+def setup_function():
+    log.debug("==== START " + __package__ + "::" + __name__ + " ====")
+
+
+def teardown_function():
+    log.debug("==== END ====")
+
+
+def test_0001_shared():
+    """ PosE, PosN 은 compile 된 같은 규칙을 공유한다. """
+    ruleset = get_ruleset()
+    assert PosE()._conjugation_rule is ruleset
+    assert PosN()._conjugation_rule is ruleset
+    assert u"IRR_D" in ruleset.names()
+    assert PosN().endswithE(u"길어") is not None
+
+
+def test_0002_find():
+    """ 어간 후보, 어미 후보로 원어간, 원어미 찾기 """
+    ruleset = get_ruleset()
+    assert (u"긷", u"어", u"길", u"IRR_D") in ruleset.find(
+        u"길", u"어", ["EC"])
+    assert (u"하얗", u"ㄴ", u"야", u"IRR_H1") in ruleset.find(
+        u"하", u"얀", ["ETM"])
+    assert ruleset.find(u"", u"어", ["EC"]) == []
+    # 동음탈락은 선어말 어미가 아닌 경우만
+    assert (u"가", u"아", u"가", u"DROPOUT_A") in ruleset.find(
+        u"가", u"", ["EC"])
+    assert u"DROPOUT_A" not in [
+        item[3] for item in ruleset.find(u"가", u"", ["EP"])]
+    # 같은 chain 은 처음 적용된 규칙 하나만(ABB_ASPIRATE 는 검사하지 않는다.)
+    assert [item[3] for item in ruleset.find(u"불켜", u"", ["EC"])] ==\
+        [u"ABB_YEO", u"DROPOUT_EO"]
+
+
+def test_0003_compile():
+    """ template, 조건, 규칙 파일 형식 오류 """
+    ruleset = compile_rules({"version": 1, "sets": {"LAST": [u"걸"]}, "rules": [
+        {"type": "TEST", "when": {"last": "@LAST", "first.cho": [u"ㅇ"]},
+         "eogan": "{stem[:-1]}{last|jong=ㄷ}", "eomi": "{harmony}{eomi[1:]}",
+         "last": "{eogan[-1]|jong=}"}]})
+    assert ruleset.find(u"걸", u"어서", ["EC"]) ==\
+        [(u"걷", u"어서", u"거", u"TEST")]
+    assert ruleset.get_rules(u"걸", u"고") == ()
+    with pytest.raises(ValueError):
+        compile_rules({"rules": [{"type": "TEST", "when": {"unknown": []},
+                                  "eogan": "", "eomi": "", "last": ""}]})
+    with pytest.raises(ValueError):
+        compile_rules({"version": 2, "rules": []})
+
+
+def test_0004_add_rule(tmpdir, monkeypatch):
+    """ 규칙 파일에 규칙을 추가하면 코드 변경 없이 분석에 사용한다. """
+    ruleset = get_ruleset()
+    assert not postag_left_check(
+        PosE()._endswithE(u"얘기했다"), u"이야기하")
+
+    with open(CONFIG["res_conjugation_rule"], encoding="utf8") as fp:
+        rule_file = json.load(fp)
+    rule_file["rules"].append({
+        "type": "ABB_YAEGI", "group": "test",
+        "desc": u"이야기 => 얘기, 얘기해 => 이야기하여",
+        "when": {"stem": [u"얘기해", u"얘기했"]},
+        "eogan": u"이야기하", "eomi": u"{여|jong=org_last.jong}{eomi}",
+        "last": "{eogan[-1]}"})
+    file_path = str(tmpdir.join("conjugation_rule.json"))
+    with open(file_path, "w", encoding="utf8") as fp:
+        json.dump(rule_file, fp, ensure_ascii=False)
+    monkeypatch.setitem(CONFIG, "res_conjugation_rule", file_path)
+
+    pos_E = PosE()
+    assert pos_E._conjugation_rule is not ruleset
+    assert pos_E._conjugation_rule is PosN()._conjugation_rule
+    assert postag_left_check(pos_E._endswithE(u"얘기했다"), u"이야기하")
+    assert PosE.rule_stats()["ABB_YAEGI"]["hits"] >= 1
+
+
+def test_0005_pos_n():
+    """ PosN.endswithE 도 공유한 규칙으로 불규칙을 분석한다. """
+    pos_N = PosN()
+    assert postag_left_check(pos_N.endswithE(u"길어"), u"긷")
+    # 선어말 어미가 붙은 경우
+    candiate_list = pos_N.endswithE(u"길었다")
+    assert postag_left_check(candiate_list, u"긷")
+    assert (u"긷", ((u"었", u"EP"), (u"다", u"EC"))) in \
+        [(item[0], item[1]) for item in candiate_list]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
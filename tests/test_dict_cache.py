@@ -0,0 +1,94 @@
+import pathmagic  # noqa
+import os
+from hinsaem.config import CONFIG
+from hinsaem import dict_cache
+import pytest
+import logging
+logging.basicConfig(level=logging.DEBUG)
+log = logging.getLogger('test')
+
+
+def setup_function():
+    log.debug("==== START " + __package__ + "::" + __name__ + " ====")
+
+
+def teardown_function():
+    log.debug("==== END ====")
+
+
+class _Reader(object):
+    """ 원본 사전을 몇번 읽었는지 확인하기 위한 reader """
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, file_path):
+        self.count += 1
+        with open(file_path, encoding="UTF-8") as fp:
+            return {"LINES": fp.read().splitlines()}
+
+
+def _make_dict(tmpdir, monkeypatch, text):
+    monkeypatch.setitem(CONFIG, "res_dict_cache", str(tmpdir.join("cache")))
+    monkeypatch.setitem(CONFIG, "dict_cache", True)
+    file_path = tmpdir.join("T.tsv")
+    file_path.write_text(text, encoding="UTF-8")
+    return str(file_path)
+
+
+def test_0001_cache_hit(tmpdir, monkeypatch):
+    """ 원본이 바뀌지 않으면 캐시를 읽는다. """
+    file_path = _make_dict(tmpdir, monkeypatch, u"가\tJKS\n")
+    reader = _Reader()
+    data = dict_cache.load_dict("T", file_path, reader)
+    assert data == {"LINES": [u"가\tJKS"]}
+    data = dict_cache.load_dict("T", file_path, reader)
+    assert data == {"LINES": [u"가\tJKS"]}
+    assert reader.count == 1, u"캐시 사용"
+
+
+def test_0002_cache_stale(tmpdir, monkeypatch):
+    """ 원본이 바뀌면 원본을 다시 읽는다. """
+    file_path = _make_dict(tmpdir, monkeypatch, u"가\tJKS\n")
+    reader = _Reader()
+    dict_cache.load_dict("T", file_path, reader)
+
+    with open(file_path, "w", encoding="UTF-8") as fp:
+        fp.write(u"가\tJKS\n이\tJKS\n")
+    data = dict_cache.load_dict("T", file_path, reader)
+    assert data == {"LINES": [u"가\tJKS", u"이\tJKS"]}
+    assert reader.count == 2, u"원본 변경"
+
+
+def test_0003_cache_touch(tmpdir, monkeypatch):
+    """ 수정시간만 바뀌고 내용이 같으면 캐시를 읽는다. """
+    file_path = _make_dict(tmpdir, monkeypatch, u"가\tJKS\n")
+    reader = _Reader()
+    dict_cache.load_dict("T", file_path, reader)
+
+    stat = os.stat(file_path)
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    dict_cache.load_dict("T", file_path, reader)
+    assert reader.count == 1, u"내용이 같으면 캐시 사용"
+
+
+def test_0004_cache_disable(tmpdir, monkeypatch):
+    """ 캐시를 끄면 매번 원본을 읽는다. """
+    file_path = _make_dict(tmpdir, monkeypatch, u"가\tJKS\n")
+    monkeypatch.setitem(CONFIG, "dict_cache", False)
+    reader = _Reader()
+    dict_cache.load_dict("T", file_path, reader)
+    dict_cache.load_dict("T", file_path, reader)
+    assert reader.count == 2, u"캐시 사용 안함"
+    assert not os.path.exists(str(tmpdir.join("cache"))), u"캐시 파일 없음"
+
+
+def test_0005_cache_write_error(tmpdir, monkeypatch):
+    """ pickle 할 수 없는 값이면 예외가 나고 임시 파일이 남지 않는다. """
+    file_path = _make_dict(tmpdir, monkeypatch, u"가\tJKS\n")
+    with pytest.raises(Exception):
+        dict_cache.write_cache("T", file_path, {"FUNC": lambda: None})
+    assert os.listdir(str(tmpdir.join("cache"))) == [], u"임시 파일 없음"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,67 @@
+import pathmagic  # noqa
+from hinsaem.config import CONFIG
+from hinsaem import eojeol_cache
+from hinsaem.pos_j import PosJ
+import pytest
+import logging
+logging.basicConfig(level=logging.DEBUG)
+log = logging.getLogger('test')
+
+
+def setup_function():
+    log.debug("==== START " + __package__ + "::" + __name__ + " ====")
+
+
+def teardown_function():
+    log.debug("==== END ====")
+
+
+def test_0001_lru():
+    """ 가장 오래 사용하지 않은 항목부터 버린다. """
+    cache = eojeol_cache.LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert "b" not in cache, u"b 가 가장 오래됨"
+    assert cache.get("b") is None
+    assert cache.stats() == {"size": 2, "maxsize": 2, "hits": 1,
+                             "misses": 1, "evictions": 1}
+
+
+def test_0002_freeze():
+    candiate_list = [[u"집", [(u"으로", u"JKB")], None, {"pos": u"JKB"}]]
+    frozen = eojeol_cache.freeze(candiate_list)
+    assert frozen == ((u"집", ((u"으로", u"JKB"),), None, {"pos": u"JKB"}),)
+
+
+def test_0003_posj_cache(monkeypatch):
+    """ 같은 어절은 캐시된 tuple 후보를 돌려준다. """
+    monkeypatch.setitem(CONFIG, "eojeol_cache_size", 10)
+    eojeol_cache.reset()
+    pos_j = PosJ()
+    pos_list = pos_j.endswithj(u"사람에게")
+    assert eojeol_cache.stats()["misses"] == 1
+    assert pos_j.endswithj(u"사람에게") == pos_list
+    assert eojeol_cache.stats()["hits"] == 1
+    assert isinstance(pos_list[0], tuple), u"변경 불가능한 후보"
+    assert pos_j.endswithj(u"사람") is None
+    assert pos_j.endswithj(u"사람") is None
+
+    # 같은 class 의 다른 분석기 객체도 캐시를 공유한다.
+    assert PosJ().endswithj(u"사람에게") == pos_list
+    assert eojeol_cache.stats()["misses"] == 2
+    assert eojeol_cache.stats()["hits"] == 3
+    eojeol_cache.reset()
+
+
+def test_0004_cache_disable(monkeypatch):
+    monkeypatch.setitem(CONFIG, "eojeol_cache_size", 0)
+    eojeol_cache.reset()
+    assert eojeol_cache.stats() is None
+    assert PosJ().endswithj(u"사람에게")[0][0] == u"사람"
+    eojeol_cache.reset()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,67 @@
+import pathmagic  # noqa
+from hinsaem.eumjeol_util import parse_eumjeol, build_eumjeol,\
+    check_phoneme_restriction, check_phoneme_mask, compile_phoneme,\
+    PHONEME_VO, PHONEME_LQ, PHONEME_ALL
+from hinsaem.eumjeol_util import parse_eumjeol_array, get_jongsung_type,\
+    get_jongsung_type_array, _CHOSUNG_LIST, _JUNGSUNG_LIST, _JONGSUNG_LIST
+import pytest
+import logging
+logging.basicConfig(level=logging.DEBUG)
+log = logging.getLogger('test')
+
+
+def setup_function():
+    log.debug("==== START " + __package__ + "::" + __name__ + " ====")
+
+
+def teardown_function():
+    log.debug("==== END ====")
+
+
+# 모든 한글 음절
+EUMJEOL_LIST = [chr(code) for code in range(0xAC00, 0xD7A4)]
+
+
+def test_0001_eumjeol_table():
+    """ 모든 음절을 분리한 후 다시 합치면 원래 음절 """
+    assert parse_eumjeol(u"힣") == (u"ㅎ", u"ㅣ", u"ㅎ")
+    for eumjeol in EUMJEOL_LIST:
+        assert build_eumjeol(*parse_eumjeol(eumjeol)) == eumjeol
+    with pytest.raises(ValueError):
+        build_eumjeol(u"ㄱ", u"ㄱ", u"")
+
+
+def test_0002_compile_phoneme():
+    assert compile_phoneme("NUL") == PHONEME_ALL
+    assert compile_phoneme("VO|LQ") == PHONEME_VO | PHONEME_LQ
+    assert compile_phoneme("") == 0
+
+
+def test_0003_phoneme_mask():
+    """ bitmask 검사 결과는 check_phoneme_restriction 과 같다. """
+    phoneme_list = ["NUL", "VO", "LQ|FS", "VO|LQ", "FS", "YANG1",
+                    "YANG2", "EUM1", "EUM1|FS", ""]
+    for phoneme in phoneme_list:
+        phoneme_mask = compile_phoneme(phoneme)
+        for eumjeol in EUMJEOL_LIST + [None]:
+            assert check_phoneme_mask(eumjeol, phoneme_mask, phoneme) ==\
+                check_phoneme_restriction(eumjeol, phoneme), (eumjeol, phoneme)
+
+
+
+def test_0004_eumjeol_array():
+    """ NumPy 로 한번에 분리한 결과는 parse_eumjeol 과 같다. """
+    pytest.importorskip("numpy")
+    text = u"".join(EUMJEOL_LIST) + u" a.ㄴ"
+    (cho, jung, jong) = parse_eumjeol_array(text)
+    jongsung_type = get_jongsung_type_array(text)
+    for index, eumjeol in enumerate(EUMJEOL_LIST):
+        assert (_CHOSUNG_LIST[cho[index]], _JUNGSUNG_LIST[jung[index]],
+                _JONGSUNG_LIST[jong[index]]) == parse_eumjeol(eumjeol)
+        assert jongsung_type[index] == get_jongsung_type(eumjeol)
+    assert list(cho[-4:]) == [-1, -1, -1, -1], u"한글 음절 아님"
+    assert list(jongsung_type[-4:]) == [0, 0, 0, 0], u"한글 음절 아님"
+    assert list(parse_eumjeol_array([0xAC04])[2]) == [4], u"code point 배열"
+
+if __name__ == "__main__":
+    pytest.main([__file__])
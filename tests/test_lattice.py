@@ -0,0 +1,144 @@
+import pathmagic  # noqa
+from hinsaem.config import CONFIG
+from hinsaem import eojeol_cache
+from hinsaem import lattice as hinsaem_lattice, Hinsaem
+from hinsaem.lattice import Lattice, EojeolLattice, freq_score
+import math
+import pytest
+import logging
+logging.basicConfig(level=logging.DEBUG)
+log = logging.getLogger('test')
+
+
+def setup_function():
+    log.debug("==== START " + __package__ + "::" + __name__ + " ====")
+
+
+def teardown_function():
+    log.debug("==== END ====")
+
+
+def test_0001_lattice_best_paths():
+    """ 점수가 높은 순서로 k 개, 형태소가 같은 경로는 하나만 """
+    lattice = Lattice("S", "E")
+    lattice.add_edge("S", "A", (("a", "X"),), "W", None, -1.0)
+    lattice.add_edge("S", "B", (("b", "X"),), "W", None, -2.0)
+    lattice.add_edge("A", "E", (("c", "X"),), "W", None, -3.0)
+    lattice.add_edge("B", "E", (("c", "X"),), "W", None, -0.5)
+    lattice.add_edge("S", "E", (("abc", "NA"),), "UNK", None, -10.0)
+    # 같은 edge 는 점수가 높은 것 하나만 둔다.
+    lattice.add_edge("S", "E", (("abc", "NA"),), "UNK", None, -9.0)
+
+    path_list = lattice.best_paths(5)
+    assert [score for score, _ in path_list] == [-2.5, -4.0, -9.0]
+    assert [edge.postag[0][0] for edge in path_list[0][1]] == ["b", "c"]
+    assert len(lattice.best_paths(1)) == 1
+    with pytest.raises(ValueError):
+        lattice.best_paths(0)
+
+
+def test_0002_freq_score():
+    """ meta 의 빈도가 없으면 기본 빈도를 사용한다. """
+    assert freq_score({"writing": 100}, 1.0) == math.log(0.01)
+    assert freq_score({"spoken": 100}, 1.0) == math.log(0.0001)
+    assert freq_score({"spoken": 100}, 1.0, "spoken") == math.log(0.01)
+    assert freq_score(None, 10000) == 0.0
+
+
+def test_0003_analyze_eojeol(noun_hinsaem):
+    """ 체언 + 조사, 어간 + 어미, 단일어 """
+    assert noun_hinsaem.analyze_eojeol(u"사람은")[0].postag_str() == \
+        u"사람/NNG + 은/JX"
+    assert noun_hinsaem.analyze_eojeol(u"서울에서")[0].postag_str() == \
+        u"서울/NNP + 에서/JKB"
+    assert noun_hinsaem.analyze_eojeol(u"빨리")[0].postag_str() == u"빨리/MAG"
+    postag_list = [path.postag_str()
+                   for path in noun_hinsaem.analyze_eojeol(u"먹었다", k=5)]
+    assert postag_list[0].startswith(u"먹/VV + 었/EP + 다/E")
+
+
+def test_0004_analyze_eojeol_compound(noun_hinsaem):
+    """ 사전에 있는 단어가 나누는 것 보다 점수가 높다. """
+    path_list = noun_hinsaem.analyze_eojeol(u"국어사전을", k=3)
+    postag_list = [path.postag_str() for path in path_list]
+    assert postag_list[0] == u"국어사전/NNG + 을/JKO"
+    assert u"국어/NNG + 사전/NNG + 을/JKO" in postag_list
+    assert list(path_list) == sorted(path_list, key=lambda path: -path.score)
+
+
+def test_0005_analyze_eojeol_mark_unknown(noun_hinsaem):
+    """ 문장기호, 미등록어, 한글이 아닌 어절 """
+    assert noun_hinsaem.analyze_eojeol(u"학교.")[0].postag == \
+        ((u"학교", "NNG"), (".", "SF"))
+    assert noun_hinsaem.analyze_eojeol(u"abc")[0].postag == (("abc", "NA"),)
+    assert noun_hinsaem.analyze_eojeol(u"3개")[0].postag_str() == \
+        u"3/NA + 개/NNU"
+    assert noun_hinsaem.analyze_eojeol(u".") == ()
+
+
+def test_0006_parse_eojeol_lattice(noun_hinsaem, monkeypatch):
+    """ CONFIG["eojeol_analyzer"] 가 "lattice" 이면 분석결과 문자열 리스트 """
+    monkeypatch.setitem(CONFIG, "eojeol_analyzer", "lattice")
+    monkeypatch.setitem(CONFIG, "lattice_k", 2)
+    result = noun_hinsaem._parse_eojeol(u"사람은")
+    assert result[0] == u"사람/NNG + 은/JX"
+    assert len(result) == 2
+
+
+def test_0007_lattice_build_once(noun_hinsaem, monkeypatch):
+    """ 분석기는 어절마다 한번만 호출한다. """
+    lattice = EojeolLattice(noun_hinsaem._word_dict)
+    call_list = []
+    endswith_e = lattice._pos_e.endswithE
+
+    def count_call(eojeol):
+        call_list.append(eojeol)
+        return endswith_e(eojeol)
+    monkeypatch.setattr(lattice._pos_e, "endswithE", count_call)
+    lattice.analyze(u"먹었다", k=3)
+    assert call_list == [u"먹었다"]
+
+
+def test_0008_analyze_eojeol_register(noun_hinsaem, monkeypatch):
+    """ 빈도 종류(CONFIG["freq_register"])가 바뀌면 캐시를 사용하지 않는다. """
+    monkeypatch.setitem(CONFIG, "eojeol_cache_size", 10)
+    eojeol_cache.reset()
+    register_list = []
+    analyze_eojeol_lattice = noun_hinsaem._analyze_eojeol_lattice
+
+    def count_call(eojeol, k, register):
+        register_list.append(register)
+        return analyze_eojeol_lattice(eojeol, k, register)
+    monkeypatch.setattr(noun_hinsaem, "_analyze_eojeol_lattice", count_call)
+
+    for register in [u"writing", u"spoken", u"writing", u"spoken"]:
+        monkeypatch.setitem(CONFIG, "freq_register", register)
+        noun_hinsaem.analyze_eojeol(u"먹었다", k=2)
+        assert noun_hinsaem._lattice.register == register_list[-1]
+    assert register_list == [u"writing", u"spoken"]
+
+
+def test_0009_parse_sen_register(write_dict, monkeypatch):
+    """ 빈도 종류가 바뀌면 문장 분석결과(analyze_many)의 순위도 바뀐다. """
+    write_dict({"res_dict_01": u"word\tmorpheme\n빨리\tMAG\n",
+                "res_dict_nng01": u"word\tpos\tcategory\n국어\tNNG\t\n"
+                                  u"사전\tNNG\t\n국어사전\tNNG\t문어\n"})
+    # 사전에 빈도가 없으므로 "문어" 단어에 빈도 종류별 빈도를 준다.
+    meta_freq = hinsaem_lattice.meta_freq
+
+    def register_freq(meta, register=None, default=0.0):
+        if meta is not None and meta.get("category", "").strip() == u"문어":
+            meta = {"writing": 1000.0, "spoken": 0.001}
+        return meta_freq(meta, register, default)
+    monkeypatch.setattr(hinsaem_lattice, "meta_freq", register_freq)
+    monkeypatch.setitem(CONFIG, "eojeol_analyzer", "lattice")
+    monkeypatch.setitem(CONFIG, "lattice_k", 2)
+    hinsaem = Hinsaem()
+
+    result_list = []
+    for register in [u"writing", u"spoken", u"writing"]:
+        monkeypatch.setitem(CONFIG, "freq_register", register)
+        result_list.append(list(hinsaem.analyze_many([u"국어사전"]))[0][0])
+    assert result_list[0][0] == u"국어사전/NNG"
+    assert result_list[1][0] == u"국어/NNG + 사전/NNG"
+    assert result_list[2] == result_list[0]
@@ -0,0 +1,63 @@
+import pathmagic  # noqa
+import os
+import sys
+import json
+import subprocess
+from hinsaem.pos_j import PosJ
+from hinsaem.pos_e import PosE
+import pytest
+import logging
+logging.basicConfig(level=logging.DEBUG)
+log = logging.getLogger('test')
+
+_ROOT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# import 중에 연 파일 중 Python 모듈이 아닌 파일을 출력한다.
+_IMPORT_SCRIPT = """
+import sys
+import json
+opened = []
+
+
+def hook(event, args):
+    if event == "open" and not str(args[0]).endswith((".py", ".pyc")):
+        opened.append(str(args[0]))
+
+
+sys.addaudithook(hook)
+import hinsaem
+from hinsaem import eumjeol_util
+from hinsaem.pos_j import PosJ
+PosJ()
+print(json.dumps(opened))
+"""
+
+
+def setup_function():
+    log.debug("==== START " + __package__ + "::" + __name__ + " ====")
+
+
+def teardown_function():
+    log.debug("==== END ====")
+
+
+def test_0001_import_no_io():
+    """ import hinsaem, 분석기 생성만으로는 파일을 읽지 않는다. """
+    output = subprocess.check_output(
+        [sys.executable, "-c", _IMPORT_SCRIPT], cwd=_ROOT_PATH,
+        env=dict(os.environ, PYTHONPATH=_ROOT_PATH))
+    assert json.loads(output.decode("UTF-8").splitlines()[-1]) == []
+
+
+def test_0002_shared_tables():
+    """ 사전은 처음 조회할 때 로딩하고 모든 객체가 공유한다. """
+    pos_J_1 = PosJ()
+    pos_J_2 = PosJ()
+    assert "_table_dict" not in pos_J_1.__dict__, u"생성할 때는 로딩 안함"
+    assert u"께서" in pos_J_1._josa_list
+    assert pos_J_1._josa_list is pos_J_2._josa_list, u"공유"
+    assert PosE()._eomi_trie is PosE()._eomi_trie, u"공유"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
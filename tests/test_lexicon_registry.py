@@ -0,0 +1,73 @@
+import pathmagic  # noqa
+import shutil
+from hinsaem.config import CONFIG
+from hinsaem import lexicon_registry
+from hinsaem.pos_e import PosE
+from hinsaem.pos_j import PosJ
+from hinsaem.pos_n import PosN
+import pytest
+import logging
+logging.basicConfig(level=logging.DEBUG)
+log = logging.getLogger('test')
+
+
+def setup_function():
+    log.debug("==== START " + __package__ + "::" + __name__ + " ====")
+
+
+def teardown_function():
+    log.debug("==== END ====")
+
+
+def _copy_josa_dict(tmpdir, monkeypatch, file_name):
+    monkeypatch.setitem(CONFIG, "res_dict_cache", str(tmpdir.join("cache")))
+    file_path = str(tmpdir.join(file_name))
+    shutil.copyfile(CONFIG["res_dict_j"], file_path)
+    monkeypatch.setitem(CONFIG, "res_dict_j", file_path)
+    return file_path
+
+
+def test_0001_shared():
+    """ 모든 객체가 같은 사전을 사용하고, PosN 은 PosE 의 어미 사전을 공유한다. """
+    pos_E = PosE()
+    assert pos_E._eomi_list is PosE()._eomi_list
+    assert PosN()._eomi_list is pos_E._eomi_list
+    assert u"퍼" in PosN()._eomi_last
+
+
+def test_0002_immutable():
+    """ 공유하는 사전은 변경할 수 없다. """
+    pos_J = PosJ()
+    with pytest.raises(TypeError):
+        pos_J._josa_list[u"께서"] = []
+    with pytest.raises(AttributeError):
+        pos_J._josa_list[u"께서"].append({})
+    with pytest.raises(AttributeError):
+        pos_J._josa_jungjong_start.add(u"ㄴ")
+
+
+def test_0003_same_content(tmpdir, monkeypatch):
+    """ 경로가 달라도 내용이 같으면 같은 사전을 공유한다. """
+    josa_list = PosJ()._josa_list
+    _copy_josa_dict(tmpdir, monkeypatch, "J.tsv")
+    assert PosJ()._josa_list is josa_list
+
+
+def test_0004_reload(tmpdir, monkeypatch):
+    """ 사전 파일을 고친 후 reload() 하면 다음 조회 때 새 사전을 사용한다. """
+    file_path = _copy_josa_dict(tmpdir, monkeypatch, "J2.tsv")
+    pos_J = PosJ()
+    assert pos_J.endswithj(u"사람뿅뿅") is None
+    assert lexicon_registry.reload() == []
+
+    # 원본 사전 마지막 줄에 줄바꿈이 없을 수 있다.(빈 줄은 무시한다.)
+    with open(file_path, "a", encoding="UTF-8", newline="") as fp:
+        fp.write(u"\r\n뿅뿅\tJKS\t\tNUL\t\t\t\r\n")
+    dropped_list = lexicon_registry.reload()
+    assert ("J", file_path, "dict") in dropped_list
+    assert u"뿅뿅" in pos_J._josa_list, u"기존 객체도 새 사전 사용"
+    assert pos_J.endswithj(u"사람뿅뿅")[0][0] == u"사람"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,101 @@
+import pathmagic  # noqa
+import pickle
+from hinsaem.config import CONFIG
+from hinsaem.lexicon_store import MmapLexicon, build_lexicon
+from hinsaem import dict_cache
+from hinsaem import lexicon_store
+from hinsaem import lexicon_registry
+from hinsaem.pos_e import PosE
+from hinsaem.pos_j import PosJ
+from hinsaem.pos_util import postag_left_check, postag_end_check
+import pytest
+import logging
+logging.basicConfig(level=logging.DEBUG)
+log = logging.getLogger('test')
+
+
+def setup_function():
+    log.debug("==== START " + __package__ + "::" + __name__ + " ====")
+
+
+def teardown_function():
+    log.debug("==== END ====")
+
+
+_WORD_DICT = {
+    u"가": [{"pos": "JKS", "pos2": "", "phoneme": "VO"}],
+    u"에게": [{"pos": "JKB", "pos2": "", "phoneme": "NUL"}],
+    u"은": [{"pos": "JX", "pos2": "", "phoneme": "FS"}],
+    u"ㄴ": [{"pos": "JX", "pos2": "", "phoneme": "VO"}],
+    u"이": [{"pos": "JKS", "pos2": "", "phoneme": "FS"},
+           {"pos": "JKC", "pos2": "", "phoneme": "FS"}],
+}
+
+
+def test_0001_lexicon(tmpdir):
+    """ mmap 사전 조회 검사 """
+    file_path = str(tmpdir.join("T.lex"))
+    build_lexicon(file_path, _WORD_DICT)
+    lexicon = MmapLexicon(file_path)
+
+    assert len(lexicon) == len(_WORD_DICT)
+    for word, value in _WORD_DICT.items():
+        assert word in lexicon, word
+        assert lexicon[word] == value, word
+    assert u"는" not in lexicon
+    assert lexicon.get(u"는") is None
+    with pytest.raises(KeyError):
+        lexicon[u"는"]
+    assert list(lexicon) == sorted(_WORD_DICT), u"정렬된 key"
+
+
+def test_0002_lexicon_pickle(tmpdir):
+    """ 다른 프로세스에 전달할 때는 경로만 전달한다. """
+    file_path = str(tmpdir.join("T.lex"))
+    build_lexicon(file_path, _WORD_DICT)
+    lexicon = pickle.loads(pickle.dumps(MmapLexicon(file_path)))
+    assert lexicon[u"이"] == _WORD_DICT[u"이"]
+
+
+def test_0003_posj_mmap(tmpdir, monkeypatch):
+    """ mmap 사전으로 조사 분석 """
+    monkeypatch.setitem(CONFIG, "res_dict_cache", str(tmpdir.join("cache")))
+    monkeypatch.setitem(CONFIG, "lexicon_backend", "mmap")
+    for _ in range(2):  # 처음에는 mmap 파일 생성, 다음은 mmap 파일 사용
+        pos_J = PosJ()
+        assert isinstance(pos_J._josa_list, MmapLexicon)
+        pos_list = pos_J.endswithj(u"사람에게")
+        assert postag_left_check(pos_list, u"사람"), u"사람 in eojeol"
+        assert postag_end_check(pos_list, u"에게/JKB"), u"에게/JKB in eojeol"
+
+
+def test_0004_trie_keys_only(tmpdir, monkeypatch):
+    """ mmap 이면 Trie 는 단어만 캐시에 저장하고 값은 mmap 사전에서 읽는다. """
+    lexicon_registry.reload(force=True)
+    expect = (PosE().endswithE(u"먹었다."), PosJ().endswithj(u"사람에게"))
+    monkeypatch.setitem(CONFIG, "res_dict_cache", str(tmpdir.join("cache")))
+    monkeypatch.setitem(CONFIG, "lexicon_backend", "mmap")
+    for _ in range(2):  # 처음에는 mmap 파일 생성, 다음은 mmap 파일 사용
+        lexicon_registry.reload(force=True)
+        assert (PosE().endswithE(u"먹었다."),
+                PosJ().endswithj(u"사람에게")) == expect
+    for (name, trie_key) in [("E", "EOMI_TRIE"), ("J", "JOSA_TRIE")]:
+        file_path = CONFIG["res_dict_" + name.lower()]
+        rest = dict_cache.read_cache(name + ".REST", file_path)
+        value_list = [value for (_, value) in rest[trie_key].iter_terminal()]
+        assert value_list and set(value_list) == {None}, name
+    lexicon_registry.reload(force=True)
+
+
+def test_0005_lexicon_write_error(tmpdir, monkeypatch):
+    """ 저장하다 오류가 나면 예외가 나고 임시 파일이 남지 않는다. """
+    def replace_error(src, dst):
+        raise OSError(28, "No space left on device")
+    monkeypatch.setattr(lexicon_store.os, "replace", replace_error)
+    with pytest.raises(OSError):
+        build_lexicon(str(tmpdir.join("T.lex")), _WORD_DICT)
+    assert tmpdir.listdir() == [], u"임시 파일 없음"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -422,6 +422,69 @@ def test_0010_e():
     assert postag_end_check(pos_list, u"다/EF"), u"다/EF in eojeol"
 
 
+def test_0011_ep_depth():
+    """ 선어말 어미 반복 횟수(ep_depth) """
+    pos_list = PosE(ep_depth=2).endswithE(u"잡으셨겠다.")
+    assert postag_left_check(pos_list, u"잡으시"), u"잡으시 in depth 2"
+    assert not postag_left_check(pos_list, u"잡"), u"잡 not in depth 2"
+
+    pos_list = PosE(ep_depth=3).endswithE(u"잡으셨겠다.")
+    assert postag_left_check(pos_list, u"잡"), u"잡 in depth 3"
+    assert u"으시/EP+었/EP+겠/EP+다/EF" in [
+        postag_str(item[1]) for item in pos_list if item[0] == u"잡"]
+
+    # 선어말 어미가 더 없으면 반복을 멈춘다.
+    assert PosE(ep_depth=10)._endswithE(u"먹고") ==\
+        PosE(ep_depth=1)._endswithE(u"먹고")
+
+    # 앞 단계에서 새로 추가된 후보만 다시 분석하므로 같은 후보가 중복되지 않는다.
+    pos_list = PosE(ep_depth=3)._endswithE(u"잡으셨다.")
+    assert len(pos_list) == len(set(pos_list))
+    assert PosE(ep_depth=10)._endswithE(u"잡으셨다.") == pos_list
+    pos_list = PosE(ep_depth=20)._endswithE(u"잡으셨겠다.")
+    assert len(pos_list) == len(set(pos_list))
+
+
+def test_0012_ep_memo(monkeypatch):
+    """ 어절 하나를 분석하는 동안 같은 앞부분의 선어말 어미는 한번만 찾는다. """
+    pos_e = PosE(ep_depth=3)
+    left_list = []
+    endswithES = pos_e._endswithES
+
+    def _endswithES(eojeol, mark, pos_filter, beam=None):
+        if pos_filter == pos_e.PRE_EOMI:
+            left_list.append(eojeol)
+        return endswithES(eojeol, mark, pos_filter, beam)
+
+    monkeypatch.setattr(pos_e, "_endswithES", _endswithES)
+    pos_list = pos_e._endswithE(u"잡으셨겠다.")
+    assert pos_list
+    assert len(left_list) == len(set(left_list))
+
+
+def test_0013_rule_index():
+    """ (어간 끝음절, 어미 첫음절) 규칙 index, 규칙별 검사/적용 횟수 """
+    def get_rules(last_eumjeol_eogan, first_eumjeol_eomi):
+        return [rule.name for rule in pos_E._conjugation_rule.get_rules(
+            last_eumjeol_eogan, first_eumjeol_eomi)]
+    assert u"IRR_D" in get_rules(u"길", u"어")
+    assert u"IRR_D" not in get_rules(u"길", u"고")
+    assert get_rules(u"", u"어") == []
+    # "ㅎ" 불규칙 1 다음의 규칙은 어미 첫음절로도 검사한다.
+    assert u"IRR_EU" in get_rules(u"는", u"감")
+
+    PosE.reset_rule_stats()
+    pos_list = PosE()._endswithE(u"길어")
+    assert postag_left_check(pos_list, u"긷"), u"긷 in eojeol"
+    rule_stats = PosE.rule_stats()
+    assert rule_stats["IRR_D"]["checked"] >= 1
+    assert rule_stats["IRR_D"]["hits"] >= 1
+    assert rule_stats["IRR_B"] == {"checked": 0, "hits": 0}
+
+    PosE.reset_rule_stats()
+    assert PosE.rule_stats()["IRR_D"] == {"checked": 0, "hits": 0}
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
 
@@ -0,0 +1,60 @@
+import pathmagic  # noqa
+from hinsaem.config import CONFIG
+from hinsaem import pos_n0
+from hinsaem.pos_n0 import PosN0
+import pytest
+import logging
+logging.basicConfig(level=logging.DEBUG)
+log = logging.getLogger('test')
+
+
+def setup_function():
+    log.debug("==== START " + __package__ + "::" + __name__ + " ====")
+
+
+def teardown_function():
+    log.debug("==== END ====")
+
+
+def _make_dict_files(tmpdir):
+    file_path_list = []
+    for index, (ret_key, config_key) in enumerate(PosN0._DICT_FILE_LIST):
+        file_path = tmpdir.join(config_key + ".tsv")
+        file_path.write_text(
+            u"word\tpos\tcategory\ttag\r\n"
+            u"사람%d\t%s\t일반\t\r\n사과\t%s\t일반\t\r\n" % (
+                index, ret_key, ret_key), encoding="UTF-8")
+        file_path_list.append(str(file_path))
+    return file_path_list
+
+
+@pytest.mark.parametrize("loader", ["thread", "process"])
+def test_0001_loader(tmpdir, monkeypatch, loader):
+    """ 읽는 방법과 관계없이 같은 사전을 만든다. """
+    file_path_list = _make_dict_files(tmpdir)
+    monkeypatch.setitem(CONFIG, "multiprocess_count", 2)
+    monkeypatch.setitem(CONFIG, "n0_loader", loader)
+    result_dict = PosN0()._read_dict_tsv(file_path_list)
+
+    assert sorted(result_dict) == ["NNG", "NNP", "N_"]
+    assert u"사람0" in result_dict["NNG"] and u"사람4" in result_dict["NNG"]
+    assert result_dict["NNP"][u"사과"] == [{"pos": "NNP", "category": u"일반"}]
+    assert u"word" not in result_dict["NNG"], u"첫 줄은 헤더"
+
+
+def test_0002_no_pool(tmpdir, monkeypatch):
+    """ multiprocess_count 가 1 이면 Pool 을 만들지 않는다. """
+    def _no_pool(*args, **kwargs):
+        raise AssertionError("pool created")
+
+    file_path_list = _make_dict_files(tmpdir)
+    monkeypatch.setitem(CONFIG, "multiprocess_count", 1)
+    monkeypatch.setitem(CONFIG, "n0_loader", "process")
+    monkeypatch.setattr(pos_n0.mp, "Pool", _no_pool)
+    monkeypatch.setattr(pos_n0, "ThreadPoolExecutor", _no_pool)
+    result_dict = PosN0()._read_dict_tsv(file_path_list)
+    assert u"사람5" in result_dict["NNP"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -1,6 +1,6 @@
 import pathmagic  # noqa
 from hinsaem import Hinsaem
-from hinsaem.pos_nr import PosNR
+from hinsaem.pos_nr import PosNR, NumeralMatch
 import pytest
 import logging
 logging.basicConfig(level=logging.DEBUG)
@@ -53,6 +53,39 @@ def test_0003_nr():
     assert posNR.check(u"수천만"), u"수천만 is nr"
 
 
+def test_0004_parse():
+    """ 수사의 값 """
+    for (word, value) in [(u"삼십만", 300000), (u"이천이십", 2020),
+                          (u"일백만", 1000000), (u"이십만이천", 202000),
+                          (u"이천구백삼십일", 2931), (u"만이천", 12000),
+                          (u"일억이천만", 120000000), (u"영", 0),
+                          (u"스물하나", 21), (u"아흔아홉", 99),
+                          (u"백만스물하나", 1000021)]:
+        assert posNR.parse(word) == \
+            NumeralMatch(0, len(word), value, value, False), word
+
+    """ 서수, 범위, 어림수 """
+    assert posNR.parse(u"스물다섯째") == NumeralMatch(0, 5, 25, 25, True)
+    assert posNR.parse(u"첫째") == NumeralMatch(0, 2, 1, 1, True)
+    assert posNR.parse(u"제삼") == NumeralMatch(0, 2, 3, 3, True)
+    assert posNR.parse(u"한두") == NumeralMatch(0, 2, 1, 2, False)
+    assert posNR.parse(u"네다섯째") == NumeralMatch(0, 4, 4, 5, True)
+    assert posNR.parse(u"수천만") == NumeralMatch(0, 3, None, None, False)
+
+
+def test_0005_parse_span():
+    """ 수사가 끝나는 위치, 수사가 아니면 None """
+    assert posNR.parse(u"삼십만원") == \
+        NumeralMatch(0, 3, 300000, 300000, False)
+    assert posNR.parse(u"약삼십만원", 1).end == 4
+    assert posNR.parse(u"둘째가") == NumeralMatch(0, 2, 2, 2, True)
+    for word in [u"", u"제", u"첫", u"째", u"원"]:
+        assert posNR.parse(word) is None, word
+    assert posNR.parse_many([u"이천이십", u"년", u"스물다섯째"]) == [
+        NumeralMatch(0, 4, 2020, 2020, False), None,
+        NumeralMatch(0, 5, 25, 25, True)]
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
 
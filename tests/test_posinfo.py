@@ -0,0 +1,59 @@
+import pathmagic  # noqa
+import pickle
+from hinsaem.posinfo import PosInfo, POS_LIST, PHONEME_LIST
+from hinsaem.eumjeol_util import compile_phoneme
+from hinsaem.pos_e import PosE
+import pytest
+import logging
+logging.basicConfig(level=logging.DEBUG)
+log = logging.getLogger('test')
+
+
+def setup_function():
+    log.debug("==== START " + __package__ + "::" + __name__ + " ====")
+
+
+def teardown_function():
+    log.debug("==== END ====")
+
+
+def test_0001_intern():
+    """ 같은 값이면 같은 객체, 변경 불가능 """
+    posinfo = PosInfo("EC", "", "VO|LQ")
+    assert posinfo is PosInfo("EC", "", "VO|LQ")
+    assert posinfo is pickle.loads(pickle.dumps(posinfo)), u"unpickle 도 intern"
+    assert posinfo is not PosInfo("EF", "", "VO|LQ")
+    assert hash(posinfo) == hash(("EC", "", "VO|LQ"))
+    with pytest.raises(AttributeError):
+        posinfo.pos = "EF"
+
+
+def test_0002_fields():
+    """ 속성, code, 이전 posinfo dict 형식 호환 """
+    posinfo = PosInfo("JKS", "", "VO")
+    assert POS_LIST[posinfo.pos_code] == "JKS"
+    assert PHONEME_LIST[posinfo.phoneme_code] == "VO"
+    assert posinfo.phoneme_mask == compile_phoneme("VO")
+    assert posinfo["pos"] == "JKS" and posinfo.get("spoken") is None
+    assert "spoken" not in posinfo
+    with pytest.raises(KeyError):
+        posinfo["spoken"]
+    assert "phoneme_mask" not in posinfo
+    assert posinfo == {"pos": "JKS", "pos2": "", "phoneme": "VO"}
+    assert posinfo != {"pos": "JKS", "pos2": "", "phoneme": "FS"}
+    assert posinfo.to_dict() == {"pos": "JKS", "pos2": "", "phoneme": "VO"}
+
+
+def test_0003_dictionary():
+    """ 어미 사전 항목은 PosInfo 를 공유한다. """
+    pos_E = PosE()
+    posinfo_set = set()
+    for posinfo_list in pos_E._eomi_list.values():
+        for posinfo in posinfo_list:
+            assert isinstance(posinfo, PosInfo)
+            posinfo_set.add(id(posinfo))
+    assert len(posinfo_set) < len(pos_E._eomi_list)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
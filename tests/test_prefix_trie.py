@@ -0,0 +1,36 @@
+import pathmagic  # noqa
+from hinsaem.prefix_trie import PrefixTrie
+import pytest
+import logging
+logging.basicConfig(level=logging.DEBUG)
+log = logging.getLogger('test')
+
+
+def setup_function():
+    log.debug("==== START " + __package__ + "::" + __name__ + " ====")
+
+
+def teardown_function():
+    log.debug("==== END ====")
+
+
+def test_0001_prefix():
+    """ 짧은 사전 단어부터 찾는다. """
+    trie = PrefixTrie({u"국어": [1], u"국어사전": [2], u"사전": [3]})
+    assert u"국어" in trie
+    assert u"국" not in trie, u"사전 단어가 아님"
+    assert trie.get(u"사전") == [3]
+    assert trie.max_len == 4
+    result = list(trie.iter_prefix(u"국어사전을"))
+    assert result == [(2, u"국어", [1]), (4, u"국어사전", [2])]
+
+
+def test_0002_prefix_start():
+    """ start 위치에서 시작하는 사전 단어만 찾는다. """
+    trie = PrefixTrie({u"사전": [3]})
+    assert list(trie.iter_prefix(u"국어사전", 2)) == [(4, u"사전", [3])]
+    assert list(trie.iter_prefix(u"국어사전", 1)) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,73 @@
+import pathmagic  # noqa
+import io
+import json
+from hinsaem import stream
+import pytest
+import logging
+logging.basicConfig(level=logging.DEBUG)
+log = logging.getLogger('test')
+
+
+def setup_function():
+    log.debug("==== START " + __package__ + "::" + __name__ + " ====")
+
+
+def teardown_function():
+    log.debug("==== END ====")
+
+
+CORPUS = u"사람  학교. 빨리 학교!\n\n  사람\n"
+
+
+def test_0001_split_sentences():
+    """ 종료문장기호 뒤에서 문장을 나누고 공백을 정리한다. """
+    assert stream.split_sentences(u"사람  학교. 빨리 학교!\n") ==\
+        [u"사람 학교.", u"빨리 학교!"]
+    assert stream.split_sentences(u"   \n") == []
+    assert list(stream.iter_sentences(io.StringIO(CORPUS))) ==\
+        [(1, u"사람 학교."), (1, u"빨리 학교!"), (3, u"사람")]
+
+
+def test_0002_tag_lines(hinsaem):
+    """ 문장번호, 줄번호, 문장, 분석결과를 차례로 돌려준다. """
+    tagged_list = list(stream.tag_lines(hinsaem, io.StringIO(CORPUS)))
+    assert [tagged[:3] for tagged in tagged_list] == [
+        (1, 1, u"사람 학교."), (2, 1, u"빨리 학교!"), (3, 3, u"사람")]
+    assert tagged_list[2][3] == [(u"사람", u"NNG")]
+
+
+def test_0003_tag_file_tsv(hinsaem):
+    out_fp = io.StringIO()
+    count = stream.tag_file(hinsaem, io.StringIO(CORPUS), out_fp, "tsv")
+    assert count == 3
+    line_list = out_fp.getvalue().split("\n")
+    assert line_list[0] == u"1\t사람\t사람/NNG"
+    assert line_list[2] == u""
+    assert line_list[3] == u"2\t빨리\t빨리/MAG"
+
+
+def test_0004_tag_file_jsonl(hinsaem):
+    """ worker 프로세스를 사용해도 입력 순서대로 출력한다. """
+    out_fp = io.StringIO()
+    stream.tag_file(hinsaem, io.StringIO(CORPUS * 5), out_fp, "jsonl",
+                    workers=2, chunksize=2)
+    item_list = [json.loads(line) for line in out_fp.getvalue().splitlines()]
+    assert [item["id"] for item in item_list] == list(range(1, 16))
+    assert item_list[3]["line"] == 4
+    assert item_list[3]["sentence"] == u"사람 학교."
+    assert item_list[3]["result"][0] == [u"사람", u"NNG"]
+
+
+def test_0005_tag_file_thread(hinsaem):
+    """ thread 모드는 프로세스 모드와 같은 결과를 출력한다. """
+    out_list = []
+    for mode in ["process", "thread"]:
+        out_fp = io.StringIO()
+        stream.tag_file(hinsaem, io.StringIO(CORPUS * 5), out_fp, "tsv",
+                        workers=2, chunksize=2, mode=mode)
+        out_list.append(out_fp.getvalue())
+    assert out_list[0] == out_list[1]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
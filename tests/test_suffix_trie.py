@@ -0,0 +1,35 @@
+import pathmagic  # noqa
+from hinsaem.suffix_trie import SuffixTrie
+import pytest
+import logging
+logging.basicConfig(level=logging.DEBUG)
+log = logging.getLogger('test')
+
+
+def setup_function():
+    log.debug("==== START " + __package__ + "::" + __name__ + " ====")
+
+
+def teardown_function():
+    log.debug("==== END ====")
+
+
+def test_0001_suffix():
+    """ 짧은 접미 단어부터 찾는다. """
+    trie = SuffixTrie({u"게": [1], u"에게": [2], u"에": [3]})
+    assert u"게" in trie, u"마지막 음절"
+    assert u"에" in trie, u"마지막 음절"
+    assert u"람" not in trie, u"마지막 음절 아님"
+    result = list(trie.iter_suffix(u"사람에게"))
+    assert result == [(3, u"게", [1]), (2, u"에게", [2])]
+
+
+def test_0002_suffix_min_index():
+    """ min_index 보다 앞에서 시작하는 접미 단어는 찾지 않는다. """
+    trie = SuffixTrie({u"에게": [2]})
+    assert list(trie.iter_suffix(u"에게")) == [(0, u"에게", [2])]
+    assert list(trie.iter_suffix(u"에게", 1)) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
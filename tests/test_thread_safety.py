@@ -0,0 +1,150 @@
+import pathmagic  # noqa
+from hinsaem.config import CONFIG
+from hinsaem import Hinsaem
+from hinsaem import eojeol_cache
+from hinsaem import lexicon_registry
+from hinsaem.pos_e import PosE
+from hinsaem.pos_j import PosJ
+from hinsaem.pos_n import PosN
+import sys
+import random
+import threading
+import pytest
+import logging
+logging.basicConfig(level=logging.DEBUG)
+log = logging.getLogger('test')
+
+THREAD_COUNT = 8
+REPEAT = 30
+
+EOJEOL_LIST = [u"먹었겠다.", u"빠르고", u"그어", u"잡으셨겠다.", u"길어",
+               u"사람에게서", u"학교에", u"국어사전을", u"서울에서", u"빨리"]
+SENTENCE_LIST = [u"사람은 빨리 먹었다.", u"학교에 가고", u"국어사전을 샀다.",
+                 u"서울에서 빨리 가자!"]
+
+
+def setup_function():
+    log.debug("==== START " + __package__ + "::" + __name__ + " ====")
+
+
+def teardown_function():
+    log.debug("==== END ====")
+
+
+@pytest.fixture
+def small_cache(monkeypatch):
+    """ 항목이 계속 버려지도록 어절 분석결과 캐시를 작게 만든다. """
+    monkeypatch.setitem(CONFIG, "eojeol_cache_size", 4)
+    eojeol_cache.reset()
+    # thread 전환이 자주 일어나도록 한다.
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+    eojeol_cache.reset()
+
+
+def _run_threads(func):
+    """ THREAD_COUNT 개의 thread 에서 func(thread 번호) 를 동시에 실행한다. """
+    barrier = threading.Barrier(THREAD_COUNT)
+    result_list = [None] * THREAD_COUNT
+    error_list = []
+
+    def _worker(index):
+        try:
+            barrier.wait()
+            result_list[index] = func(index)
+        except Exception as ex:
+            error_list.append(ex)
+
+    thread_list = [threading.Thread(target=_worker, args=(index,))
+                   for index in range(THREAD_COUNT)]
+    for thread in thread_list:
+        thread.start()
+    for thread in thread_list:
+        thread.join()
+    assert error_list == []
+    return result_list
+
+
+def test_0001_readonly():
+    """ 생성할 때 정한 설정과 사전은 변경할 수 없다. """
+    pos_e = PosE(ep_depth=3, sense_sentence_mark=False)
+    assert pos_e.ep_depth == 3
+    assert pos_e.sense_sentence_mark is False
+    assert PosN().sense_sentence_mark is True
+    with pytest.raises(AttributeError):
+        pos_e.sense_sentence_mark = True
+    with pytest.raises(AttributeError):
+        pos_e.ep_depth = 1
+    with pytest.raises(TypeError):
+        pos_e._eomi_list[u"다"] = []
+
+
+def test_0002_sense_sentence_mark():
+    """ sense_sentence_mark 가 False 이면 문장부호와 관계없이 어미를 찾는다. """
+    pos_list = PosE(sense_sentence_mark=False).endswithE(u"먹고.")
+    assert any(candidate.postag[-1] == (u"고", "EC")
+               for candidate in pos_list)
+    assert all(candidate.postag[-1][1] == "EF"
+               for candidate in PosE().endswithE(u"먹고."))
+
+
+def test_0003_shared_analyzer_stress(noun_hinsaem, small_cache):
+    """ 여러 thread 가 같은 분석기 객체를 사용해도 한 thread 와 같은 결과 """
+    pos_e = PosE()
+    pos_j = PosJ()
+
+    def _analyze(eojeol):
+        return (pos_e.endswithE(eojeol), pos_j.endswithj(eojeol),
+                noun_hinsaem._parse_sen(eojeol),
+                noun_hinsaem.analyze_eojeol(eojeol, k=2))
+
+    expect = dict((eojeol, _analyze(eojeol)) for eojeol in EOJEOL_LIST)
+
+    def _job(index):
+        rand = random.Random(index)
+        mismatch = []
+        for _ in range(REPEAT):
+            eojeol_list = list(EOJEOL_LIST)
+            rand.shuffle(eojeol_list)
+            for eojeol in eojeol_list:
+                if _analyze(eojeol) != expect[eojeol]:
+                    mismatch.append(eojeol)
+        return mismatch
+
+    assert _run_threads(_job) == [[]] * THREAD_COUNT
+    assert eojeol_cache.stats()["evictions"] > 0
+
+
+def test_0004_first_load_and_reload(noun_hinsaem, small_cache):
+    """ 사전을 처음 로딩하거나 다시 로딩하는 중에 분석해도 결과가 같다. """
+    expect = [noun_hinsaem._parse_sen(sen) for sen in SENTENCE_LIST]
+    lexicon_registry.reload(force=True)
+    shared = Hinsaem()
+
+    def _job(index):
+        result_list = []
+        for count in range(REPEAT):
+            if index == 0 and count % 10 == 0:
+                lexicon_registry.reload(force=True)
+            result_list.append(
+                [shared._parse_sen(sen) for sen in SENTENCE_LIST])
+        return result_list
+
+    for result_list in _run_threads(_job):
+        assert result_list == [expect] * REPEAT
+
+
+def test_0005_analyze_many_thread(noun_hinsaem):
+    """ thread 모드도 입력 순서대로 _parse_sen 과 같은 결과 """
+    sentence_list = SENTENCE_LIST * 20
+    expect = [noun_hinsaem._parse_sen(sen) for sen in sentence_list]
+    result = list(noun_hinsaem.analyze_many(
+        iter(sentence_list), workers=THREAD_COUNT, chunksize=3,
+        mode="thread"))
+    assert result == expect
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])